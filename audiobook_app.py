@@ -12,6 +12,8 @@ Usage:
 
 import asyncio
 import concurrent.futures
+import gzip
+import hashlib
 import re
 import json
 import os
@@ -49,7 +51,10 @@ except ImportError:
 
 # ── Import version and template builder ──
 from version import __version__
-from templates.index_page import build_html_template
+from templates.index_page import (
+    build_html_template, load_i18n_payloads, load_seo_data, build_podcast_guide_partials,
+    build_app_script, app_script_url, static_asset_url, i18n_version,
+)
 
 
 
@@ -94,8 +99,6 @@ _admin_queue = []          # list of dicts: {title, author, filename, voice, cha
 _admin_queue_lock = threading.Lock()
 _admin_last_sent = 0.0     # timestamp dell'ultimo digest inviato
 
-FAVICON_B64 = "data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHZpZXdCb3g9IjAgMCA2NCA2NCI+CiAgPGRlZnM+CiAgICA8bGluZWFyR3JhZGllbnQgaWQ9ImJnIiB4MT0iMCUiIHkxPSIwJSIgeDI9IjEwMCUiIHkyPSIxMDAlIj4KICAgICAgPHN0b3Agb2Zmc2V0PSIwJSIgc3R5bGU9InN0b3AtY29sb3I6I2MyOWE2YyIvPgogICAgICA8c3RvcCBvZmZzZXQ9IjEwMCUiIHN0eWxlPSJzdG9wLWNvbG9yOiNhMDc4NTAiLz4KICAgIDwvbGluZWFyR3JhZGllbnQ+CiAgPC9kZWZzPgogIDxyZWN0IHdpZHRoPSI2NCIgaGVpZ2h0PSI2NCIgcng9IjE0IiBmaWxsPSJ1cmwoI2JnKSIvPgogIDxwYXRoIGQ9Ik0xNiA0NFYyMGMwLTIgMS41LTMuNSAzLjUtMy41QzIzIDE2LjUgMjggMTcgMzIgMTljNC0yIDktMi41IDEyLjUtMi41IDIgMCAzLjUgMS41IDMuNSAzLjV2MjQiIGZpbGw9Im5vbmUiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMi41IiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiLz4KICA8cGF0aCBkPSJNMzIgMTl2MjUiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIi8+CiAgPHBhdGggZD0iTTE3IDM2YzAtOSA2LjctMTUgMTUtMTVzMTUgNiAxNSAxNSIgZmlsbD0ibm9uZSIgc3Ryb2tlPSJ3aGl0ZSIgc3Ryb2tlLXdpZHRoPSIyLjgiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIvPgogIDxyZWN0IHg9IjEzIiB5PSIzNCIgd2lkdGg9IjciIGhlaWdodD0iMTAiIHJ4PSIzIiBmaWxsPSJ3aGl0ZSIvPgogIDxyZWN0IHg9IjQ0IiB5PSIzNCIgd2lkdGg9IjciIGhlaWdodD0iMTAiIHJ4PSIzIiBmaWxsPSJ3aGl0ZSIvPgogIDxwYXRoIGQ9Ik0yMiAzNy41YzEuMi0xIDEuMi0zIDAtNCIgZmlsbD0ibm9uZSIgc3Ryb2tlPSIjYzI5YTZjIiBzdHJva2Utd2lkdGg9IjEuMyIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIi8+CiAgPHBhdGggZD0iTTQyIDM3LjVjLTEuMi0xLTEuMi0zIDAtNCIgZmlsbD0ibm9uZSIgc3Ryb2tlPSIjYzI5YTZjIiBzdHJva2Utd2lkdGg9IjEuMyIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIi8+Cjwvc3ZnPg=="
-
 _download_tokens = {}  # token -> {job_id, created_at, download_type, base_url, ...}
 _TOKENS_FILE = UPLOAD_DIR / "_download_tokens.json"
 _tokens_lock = threading.Lock()
@@ -1582,6 +1585,121 @@ Disallow: /dl/
     return body, 200, {"Content-Type": "text/plain; charset=utf-8"}
 
 
+# ─── Asset statici (bundle JS, dizionari i18n, immagini) ────────────────────
+# Registro unico: URL → contenuto pronto a startup (corpo, eventuale variante
+# gzip, ETag). Nessun accesso a disco né compressione a request-time.
+_ASSETS: dict[str, dict] = {}
+_CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def _register_asset(url: str, body: bytes, mimetype: str,
+                    compress: bool = False, immutable: bool = False,
+                    webp: bytes | None = None) -> str:
+    """Registra un asset servito dalla memoria e restituisce il suo URL.
+
+    immutable=True solo se l'URL cambia con il contenuto (hash nel nome; per ?v= vedi _serve_asset):
+    cache di un anno senza rivalidazione. Altrimenti cache di un giorno + ETag.
+    compress=True pre-comprime con gzip (inutile per PNG/WebP, già compressi).
+    webp: variante WebP dell'immagine, servita allo stesso URL ai browser che
+    la dichiarano in Accept.
+    """
+    _ASSETS[url] = {
+        "body": body,
+        "gz": gzip.compress(body, 9) if compress else None,
+        "webp": webp,
+        "mimetype": mimetype,
+        "etag": hashlib.sha256(body).hexdigest()[:16],
+        "cache": _CACHE_IMMUTABLE if immutable else "public, max-age=86400",
+    }
+    return url
+
+
+def _minify_svg(body: bytes) -> bytes:
+    """Rimuove commenti e indentazione tra i tag di un SVG (il sorgente resta leggibile)."""
+    body = re.sub(rb"<!--.*?-->", b"", body, flags=re.S)
+    return re.sub(rb">\s+<", b"><", body).strip()
+
+
+def _serve_asset(url: str, immutable: bool = False):
+    """Serve un asset registrato; immutable=True forza la cache di un anno
+    (URL versionato dalla query, es. ?v=hash corrente)."""
+    asset = _ASSETS.get(url)
+    if asset is None:
+        return "", 404
+    body, mimetype, etag, vary = asset["body"], asset["mimetype"], asset["etag"], None
+    encoding = None
+    if asset["webp"] is not None:
+        vary = "Accept"
+        # Solo se WebP è dichiarato esplicitamente (q>0): */* lo manda anche chi non lo decodifica
+        if any(mt == "image/webp" and q > 0 for mt, q in request.accept_mimetypes):
+            body, mimetype, etag = asset["webp"], "image/webp", etag + "-webp"
+    elif asset["gz"] is not None:
+        vary = "Accept-Encoding"
+        if request.accept_encodings["gzip"] > 0:  # header parsato: gzip;q=0 = rifiutato
+            body, encoding, etag = asset["gz"], "gzip", etag + "-gz"
+    resp = Response(body, mimetype=mimetype)
+    if encoding:
+        resp.headers["Content-Encoding"] = encoding
+    if vary:
+        resp.headers["Vary"] = vary
+    resp.headers["Cache-Control"] = _CACHE_IMMUTABLE if immutable else asset["cache"]
+    resp.set_etag(etag)
+    return resp.make_conditional(request)
+
+
+# Dizionari UI per lingua: la pagina incorpora solo la propria lingua,
+# le altre vengono scaricate dal browser al primo cambio lingua (?v=hash).
+# Il percorso non ha hash: cache di un giorno + ETag, un anno solo con il ?v=
+# corrente (vedi i18n_file), così un ?v= vecchio non fissa il contenuto nuovo.
+I18N_V = i18n_version()
+for _lang, _body in load_i18n_payloads().items():
+    _register_asset(f"/i18n/{_lang}.json", _body, "application/json; charset=utf-8",
+                    compress=True)
+# Guida podcast: HTML pre-renderizzato per lingua, scaricato solo all'apertura.
+for _lang, _body in build_podcast_guide_partials().items():
+    _register_asset(f"/i18n/podcast_guide.{_lang}.html", _body,
+                    "text/html; charset=utf-8", compress=True)
+
+# Bundle JS della pagina: identico per tutte le lingue, hash del contenuto nel nome.
+APP_JS_URL = _register_asset(app_script_url(), build_app_script(),
+                             "text/javascript; charset=utf-8",
+                             compress=True, immutable=True)
+
+# Screenshot della guida podcast (hash del contenuto nel nome, calcolato una volta)
+STATIC_DIR = SCRIPT_DIR / "static"
+# (PNG + variante WebP lossless, ~16-18% più leggera, negoziata via Accept)
+PG_IMG_A_URL = _register_asset(static_asset_url("pg_a.png"),
+                               (STATIC_DIR / "pg_a.png").read_bytes(), "image/png",
+                               immutable=True,
+                               webp=(STATIC_DIR / "pg_a.webp").read_bytes())
+PG_IMG_B_URL = _register_asset(static_asset_url("pg_b.png"),
+                               (STATIC_DIR / "pg_b.png").read_bytes(), "image/png",
+                               immutable=True,
+                               webp=(STATIC_DIR / "pg_b.webp").read_bytes())
+
+# Favicon (pagina principale e pagine di download): file SVG in static/,
+# servito con hash nel nome invece di un data URI ripetuto in ogni pagina.
+# SVG è testo: a differenza di PNG/WebP la variante gzip dimezza i byte.
+FAVICON_URL = _register_asset(static_asset_url("favicon.svg"),
+                              _minify_svg((STATIC_DIR / "favicon.svg").read_bytes()),
+                              "image/svg+xml",
+                              compress=True, immutable=True)
+# Sprite delle icone "Libri gratis": stesso trattamento, URL già inserito nel bundle JS.
+FB_ICONS_URL = _register_asset(static_asset_url("fb-icons.svg"),
+                               _minify_svg((STATIC_DIR / "fb-icons.svg").read_bytes()),
+                               "image/svg+xml",
+                               compress=True, immutable=True)
+
+
+@app.route("/i18n/<name>")
+def i18n_file(name):
+    return _serve_asset(request.path, immutable=request.args.get("v") == I18N_V)
+
+
+@app.route("/assets/<name>")
+def asset_file(name):
+    return _serve_asset(request.path)
+
 
 @app.route("/api/voices")
 def api_voices():
@@ -1776,7 +1894,11 @@ def api_cover(job_id):
     if not cover_path or not os.path.exists(cover_path):
         return "", 404
     mime = job.get("cover_mime", "image/jpeg")
-    return send_file(cover_path, mimetype=mime)
+    # La copertina di un job non cambia: il browser la riusa (e rivalida via ETag)
+    # invece di riscaricarla a ogni reload. Privata: è estratta da un file dell'utente.
+    resp = send_file(cover_path, mimetype=mime, conditional=True)
+    resp.headers["Cache-Control"] = "private, max-age=3600"
+    return resp
 
 
 @app.route("/api/generate", methods=["POST"])
@@ -1946,6 +2068,9 @@ def api_active_jobs():
                 title = job.get("original_filename", jid)
             start_ts = job.get("start_time", 0)
             active.append({
+                # Chiave stabile e opaca per le righe del monitor: il job_id dà
+                # accesso ai download e non esce da qui
+                "key": job.setdefault("monitor_key", uuid.uuid4().hex[:12]),
                 "title": title,
                 "started": datetime.fromtimestamp(start_ts).strftime("%Y-%m-%d %H:%M:%S") if start_ts else "—",
                 "status": job.get("status", ""),
@@ -2401,7 +2526,7 @@ def _render_dl_expired_page(lang="en"):
     t = _t.get(lang, _t["en"])
     return f"""<!DOCTYPE html><html lang="{lang}"><head><meta charset="UTF-8">
 <meta name="viewport" content="width=device-width,initial-scale=1">
-<link rel="icon" type="image/svg+xml" href="{FAVICON_B64}">
+<link rel="icon" type="image/svg+xml" href="{FAVICON_URL}">
 <title>Audiobook Maker — {t['title']}</title>
 <style>
 body{{font-family:system-ui,-apple-system,sans-serif;display:flex;justify-content:center;
@@ -2449,7 +2574,7 @@ def _render_dl_page(token, book_title, remaining_str, dl_type, lang="en"):
     warn_text = t["warn"].replace("{r}", remaining_str)
     return f"""<!DOCTYPE html><html lang="{lang}"><head><meta charset="UTF-8">
 <meta name="viewport" content="width=device-width,initial-scale=1">
-<link rel="icon" type="image/svg+xml" href="{FAVICON_B64}">
+<link rel="icon" type="image/svg+xml" href="{FAVICON_URL}">
 <title>Audiobook Maker — {t['title']}</title>
 <style>
 body{{font-family:system-ui,-apple-system,sans-serif;display:flex;justify-content:center;
@@ -2593,52 +2718,10 @@ def api_download_podcast(job_id):
 
 # ═══════════════════════════════════════════════════════════════════
 # SEO DATA — usato sia per il pre-rendering server-side che per sitemap.xml
-# Mantienilo allineato con seo_data.js (che gestisce il cambio lingua client-side)
+# Fonte unica: sezione "seo" di i18n/<lang>.json (la stessa inviata al client
+# per il cambio lingua, vedi applySEO in seo_data.js)
 # ═══════════════════════════════════════════════════════════════════
-_SEO_DATA = {
-    "it": {
-        "title":   "Audiobook Maker — Convertitore Gratuito da EPUB ad Audiolibro Online | Text-to-Speech AI",
-        "desc":    "Converti i tuoi ebook EPUB in audiolibri MP3 gratis con voci AI naturali. Convertitore online gratuito text-to-speech: carica il tuo libro, scegli la voce e scarica l'audiolibro. Nessuna installazione, funziona dal browser. Supporta italiano, inglese, francese, spagnolo, tedesco e cinese.",
-        "kw":      "convertitore epub audiolibro, epub in audiolibro gratis, convertire ebook in audiolibro online, creare audiolibro da epub, text to speech italiano, da libro a audiolibro gratis, convertitore audiolibro online gratuito, epub to mp3, trasformare ebook in audio, sintesi vocale libro, audiolibro maker, convertire libro in audio gratis, ebook to audiobook italiano, tts italiano gratis, creare audiolibro gratis online, convertitore testo in voce, epub reader audio, da testo ad audiolibro, ascoltare ebook, libro parlato gratis",
-        "ld_name": "Audiobook Maker",
-        "ld_desc": "Convertitore online gratuito per trasformare ebook EPUB in audiolibri MP3 con voci neurali TTS AI. Supporta 6 lingue, selezione capitoli e generazione feed podcast RSS.",
-    },
-    "en": {
-        "title":   "Audiobook Maker — Free Online EPUB to Audiobook Converter | AI Text-to-Speech",
-        "desc":    "Convert your EPUB ebooks to MP3 audiobooks for free with natural AI voices. Free online text-to-speech converter: upload your book, choose a voice, and download your audiobook. No installation needed, works in your browser. Supports English, Italian, French, Spanish, German and Chinese.",
-        "kw":      "epub to audiobook converter, free epub to audiobook, convert ebook to audiobook online free, epub to mp3 converter, text to speech audiobook, free audiobook maker online, ebook to audiobook converter, epub to audio, online audiobook creator free, turn ebook into audiobook, tts audiobook generator, convert epub to mp3 free, free text to speech book reader, ai audiobook maker, epub audiobook converter online, ebook to mp3, listen to epub, epub reader with audio, book to audiobook converter free, create audiobook from epub",
-        "ld_name": "Audiobook Maker",
-        "ld_desc": "Free online tool to convert EPUB ebooks into MP3 audiobooks using neural AI TTS voices. Supports 6 languages, chapter selection, and podcast RSS feed generation.",
-    },
-    "fr": {
-        "title":   "Audiobook Maker — Convertisseur Gratuit EPUB en Livre Audio en Ligne | Text-to-Speech IA",
-        "desc":    "Convertissez vos ebooks EPUB en livres audio MP3 gratuitement avec des voix IA naturelles. Convertisseur en ligne gratuit text-to-speech : téléchargez votre livre, choisissez une voix et téléchargez votre livre audio. Aucune installation, fonctionne dans le navigateur.",
-        "kw":      "convertisseur epub livre audio, epub en livre audio gratuit, convertir ebook en livre audio en ligne, créer livre audio gratuit, text to speech français, convertisseur livre audio en ligne gratuit, epub vers mp3, transformer ebook en audio, synthèse vocale livre, audiobook maker, convertir livre en audio gratuit, ebook to audiobook français, tts français gratuit, créer livre audio en ligne, convertisseur texte en voix, epub lecteur audio, de texte à livre audio, écouter ebook, livre parlé gratuit, epub en audio gratuit",
-        "ld_name": "Audiobook Maker",
-        "ld_desc": "Outil en ligne gratuit pour convertir des ebooks EPUB en livres audio MP3 avec des voix neuronales TTS IA. Prend en charge 6 langues et la génération de flux RSS podcast.",
-    },
-    "es": {
-        "title":   "Audiobook Maker — Convertidor Gratuito de EPUB a Audiolibro Online | Text-to-Speech IA",
-        "desc":    "Convierte tus ebooks EPUB en audiolibros MP3 gratis con voces IA naturales. Convertidor online gratuito text-to-speech: sube tu libro, elige una voz y descarga tu audiolibro. Sin instalación, funciona desde el navegador.",
-        "kw":      "convertidor epub audiolibro, epub a audiolibro gratis, convertir ebook a audiolibro online, crear audiolibro gratis, text to speech español, convertidor audiolibro online gratuito, epub a mp3, transformar ebook en audio, síntesis de voz libro, audiobook maker, convertir libro a audio gratis, ebook to audiobook español, tts español gratis, crear audiolibro en línea gratis, convertidor texto a voz, lector epub con audio, de texto a audiolibro, escuchar ebook, libro hablado gratis, epub a audio gratis",
-        "ld_name": "Audiobook Maker",
-        "ld_desc": "Herramienta online gratuita para convertir ebooks EPUB en audiolibros MP3 con voces neuronales TTS IA. Soporta 6 idiomas y generación de feed podcast RSS.",
-    },
-    "de": {
-        "title":   "Audiobook Maker — Kostenloser Online EPUB zu Hörbuch Konverter | KI Text-to-Speech",
-        "desc":    "Konvertieren Sie Ihre EPUB-E-Books kostenlos in MP3-Hörbücher mit natürlichen KI-Stimmen. Kostenloser Online Text-to-Speech Konverter: Laden Sie Ihr Buch hoch, wählen Sie eine Stimme und laden Sie Ihr Hörbuch herunter. Keine Installation nötig, funktioniert im Browser.",
-        "kw":      "epub zu hörbuch konverter, epub in hörbuch umwandeln kostenlos, ebook in hörbuch umwandeln online, hörbuch erstellen kostenlos, text to speech deutsch, hörbuch konverter online kostenlos, epub zu mp3, ebook in audio umwandeln, sprachsynthese buch, audiobook maker, buch in hörbuch umwandeln kostenlos, ebook to audiobook deutsch, tts deutsch kostenlos, hörbuch erstellen online gratis, text in sprache konverter, epub vorlesen lassen, text zu hörbuch, ebook anhören, hörbuch maker kostenlos, epub zu audio kostenlos",
-        "ld_name": "Audiobook Maker",
-        "ld_desc": "Kostenloses Online-Tool zum Konvertieren von EPUB-E-Books in MP3-Hörbücher mit neuronalen KI-TTS-Stimmen. Unterstützt 6 Sprachen und Podcast-RSS-Feed-Generierung.",
-    },
-    "zh": {
-        "title":   "Audiobook Maker — 免费在线EPUB转有声书转换器 | AI文字转语音",
-        "desc":    "使用自然AI语音将EPUB电子书免费转换为MP3有声书。免费在线文字转语音转换器：上传书籍，选择语音，下载有声书。无需安装，浏览器即可使用。支持中文、英语、意大利语、法语、西班牙语和德语。",
-        "kw":      "epub转有声书, 免费epub转有声书, 在线电子书转有声书, 免费创建有声书, 文字转语音中文, 免费在线有声书转换器, epub转mp3, 电子书转音频, 语音合成, 有声书制作, 免费电子书转音频, ebook to audiobook中文, tts中文免费, 在线制作有声书, 文本转语音, epub阅读器语音, 文字转有声书, 听电子书, 免费有声书制作器, epub转音频免费",
-        "ld_name": "Audiobook Maker",
-        "ld_desc": "免费在线工具，使用神经网络AI TTS语音将EPUB电子书转换为MP3有声书。支持6种语言和播客RSS订阅源生成。",
-    },
-}
+_SEO_DATA = load_seo_data()
 
 
 _SUPPORTED_LANGS = list(_SEO_DATA.keys())  # ['it', 'en', 'fr', 'es', 'de', 'zh']
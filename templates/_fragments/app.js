@@ -0,0 +1,947 @@
+// ═══════════════════ ACTIVE JOBS MONITOR ═══════════════════
+let _monTimer=null,_monSig=null;
+function openMonitor(){
+  E.monModal.classList.add('open');
+  _monSig=null;
+  document.addEventListener('visibilitychange',_monVis);
+  _fetchMonitor();
+}
+function closeMonitor(){
+  E.monModal.classList.remove('open');
+  if(_monTimer){clearTimeout(_monTimer);_monTimer=null}
+  document.removeEventListener('visibilitychange',_monVis);
+}
+// Tab in background: nessun polling; tornando in primo piano, refresh immediato
+function _monVis(){
+  if(_monTimer){clearTimeout(_monTimer);_monTimer=null}
+  if(!document.hidden)_fetchMonitor();
+}
+// Prossimo poll solo con modale aperta e tab visibile (catena di setTimeout, mai sovrapposti)
+function _monNext(ms){
+  if(!E.monModal.classList.contains('open')||document.hidden)return;
+  clearTimeout(_monTimer);_monTimer=setTimeout(_fetchMonitor,ms);
+}
+function _fetchMonitor(){
+  fetch('/api/active_jobs').then(r=>r.json()).then(d=>{
+    _renderMonitor(d);
+    // 5 s mentre qualcosa genera, 20 s quando non c'è lavoro in corso
+    _monNext((d.jobs||[]).some(j=>j.status==='generating')?5000:20000);
+  }).catch(()=>{
+    _monSig=null;
+    _monReset('<div style="text-align:center;padding:20px;color:#c00">Errore di connessione</div>');
+    _monNext(20000);
+  });
+}
+// Righe indicizzate per la chiave opaca del job (j.key; l'id non esce dal server): ogni
+// nuovo job clona il <template id="tplJobRow">, già parsato con la pagina; ai
+// poll successivi si aggiornano solo barra, percentuale, stato e capitolo
+const _monRows=new Map();
+let _monTbody=null;
+function _monPct(j){return j.total>0?Math.round(j.progress/j.total*100):0}
+function _monNewRow(j){
+  const tr=E.tplJobRow.content.firstElementChild.cloneNode(true),c=tr.cells,p=c[2].children;
+  c[0].textContent=j.started;
+  c[1].firstElementChild.textContent=j.title;
+  return {tr,chap:c[1].lastElementChild,wrap:p[0],bar:p[0].firstElementChild,pctEl:p[1],statusEl:p[2],chapter:null,status:null,pct:-1};
+}
+function _monUpdate(r,j){
+  if(r.chapter!==j.chapter){r.chap.textContent=j.chapter||'';r.chap.style.display=j.chapter?'':'none';r.chapter=j.chapter}
+  const gen=j.status==='generating';
+  if(r.status!==j.status){
+    r.wrap.style.display=gen?'inline-block':'none';
+    r.pctEl.style.display=gen?'':'none';
+    r.statusEl.style.display=gen?'none':'';
+    r.statusEl.textContent=j.status;
+    r.status=j.status;
+  }
+  const pct=_monPct(j);
+  if(gen&&r.pct!==pct){r.bar.style.width=pct+'%';r.pctEl.textContent=pct+'%';r.pct=pct}
+}
+function _monReset(html){_monRows.clear();_monTbody=null;E.monBody.innerHTML=html}
+function _renderMonitor(d){
+  // Stessi job e stesso avanzamento del poll precedente: nessuna mutazione DOM
+  const sig=JSON.stringify(d.jobs||[]);
+  if(sig===_monSig)return;
+  _monSig=sig;
+  if(!d.jobs||d.jobs.length===0){
+    _monReset('<div style="text-align:center;padding:24px;color:#999;font-size:.95rem">Nessuna generazione in corso</div>');
+    E.monTitle.textContent='Active Jobs';
+    return;
+  }
+  E.monTitle.textContent='Active Jobs ('+d.count+')';
+  if(!_monTbody){
+    _monReset('<table style="width:100%;border-collapse:collapse;font-size:.9rem">'
+      +'<thead><tr style="background:var(--s2,#f0f5fa)">'
+      +'<th style="padding:8px 10px;text-align:left;font-weight:600;border-bottom:2px solid var(--brd,#ddd)">Inizio</th>'
+      +'<th style="padding:8px 10px;text-align:left;font-weight:600;border-bottom:2px solid var(--brd,#ddd)">Titolo</th>'
+      +'<th style="padding:8px 10px;text-align:center;font-weight:600;border-bottom:2px solid var(--brd,#ddd)">Progresso</th>'
+      +'</tr></thead><tbody></tbody></table>');
+    _monTbody=E.monBody.querySelector('tbody');
+  }
+  const seen=new Set(),frag=document.createDocumentFragment();
+  for(const j of d.jobs){
+    const k=j.key;seen.add(k);
+    let r=_monRows.get(k);
+    if(!r){r=_monNewRow(j);_monRows.set(k,r);frag.appendChild(r.tr)}
+    _monUpdate(r,j);
+  }
+  _monTbody.appendChild(frag);
+  for(const[k,r]of _monRows)if(!seen.has(k)){r.tr.remove();_monRows.delete(k)}
+}
+
+document.addEventListener('keydown',e=>{if(e.key==='Escape'){closeFreeBooks();closePodcastGuide();closeMonitor();previewStop();closeAbout();E.emailModal.classList.remove('open')}});
+
+// Preferenze salvate (lingua, tema): localStorage letto una sola volta all'avvio,
+// riscritto solo quando il valore cambia
+const PREFS={};
+try{PREFS.l=localStorage.getItem('abm_l');PREFS.th=localStorage.getItem('abm_th')}catch(e){}
+function savePref(k,v){
+  if(PREFS[k]===v)return;
+  PREFS[k]=v;
+  try{localStorage.setItem('abm_'+k,v)}catch(e){}
+}
+
+let cl='en';
+function t(k){return(L[cl]||{})[k]||(L.en||{})[k]||k}
+// Nodi [data-t] (con la chiave già letta) e pulsanti lingua, raccolti una volta;
+// si riraccolgono solo se un nodo è stato sostituito (es. etichette di btnD/btnP)
+let _i18nNodes=null,_langBtns=null;
+function _collectI18nNodes(){
+  _i18nNodes=Array.from(document.querySelectorAll('[data-t]'),e=>({e,k:e.getAttribute('data-t')}));
+}
+function applyI18n(){
+  if(!_i18nNodes||_i18nNodes.some(n=>!n.e.isConnected))_collectI18nNodes();
+  if(!_langBtns)_langBtns=Array.from(document.querySelectorAll('.lsw button'));
+  // Come t(), con i due dizionari risolti una volta per passata
+  const cur=L[cl]||{},fb=L.en||{};
+  for(const n of _i18nNodes)n.e.textContent=cur[n.k]||fb[n.k]||n.k;
+  for(const b of _langBtns)b.classList.toggle('on',b.dataset.l===cl);
+  // <html lang> (zh → zh-Hans) è di applySEO, come il valore reso dal server
+}
+let _langReq=null;
+function setLang(l){
+  _langReq=l;
+  loadLang(l).then(()=>{
+    if(_langReq!==l)return;  // click più recente su un'altra lingua
+    cl=l;applyI18n();buildAbout();applySEO(cl);refreshFBDesc();savePref('l',l);
+    // Sync URL with selected language (SEO: URL ↔ content coherence)
+    var p='/'+l+'/';if(location.pathname!==p)history.replaceState(null,'',p);
+    // Update server-rendered SEO content block language
+    var sc=document.getElementById('seoContent');if(sc)sc.style.display='none';
+  }).catch(e=>console.warn('i18n '+l+':',e));
+}
+function detectLang(){
+  // INIT_LANG è iniettato server-side: rispetta la lingua della URL (/it/, /en/, ecc.)
+  if(typeof INIT_LANG!=='undefined'&&L[INIT_LANG])return INIT_LANG;
+  if(PREFS.l&&LANGS.includes(PREFS.l))return PREFS.l;
+  const n=(navigator.language||navigator.userLanguage||'en').toLowerCase().split('-')[0];
+  return LANGS.includes(n)?n:'en';
+}
+
+// ═══════════════════ STATE ═══════════════════
+let voices={},bookData=null,jobId=null,singleFile=true,generating=false,jobDone=false,hbInterval=null,isTxtFile=false,emailPromptShown=false,emailRegistered=false,emailCheckTimer=null,smtpAvailable=false;
+// Elementi usati nei percorsi caldi (monitor, anteprima, selezione, i18n, SEO,
+// avanzamento SSE, email, reset):
+// risolti una sola volta al DOMContentLoaded invece che a ogni chiamata
+const E={};
+const E_IDS=('themeBtn aboutBtn aboutTitle aboutBody aboutModal pgBody pgModal fbBody fbModal monModal monTitle monBody uz fi ufn utx s1sum aerr alo vl vv fgOut toS toC bkT bkA bkCover smC smW smD selTot selCnt chl chAll s3sum btnG metaDesc metaKw ogTitle ogDesc ogUrl twTitle twDesc jsonLd tplJobRow'
+  +' emailModal s1 s2 s3 btnPrev prevSpinner prevPlayBtn prevIconPlay prevIconPause prevAudio prevProgressFill prevTime prevText prevModal vr s3err s2sum s4 s4bkT s4bkA s4bkCover pMsg pPct pBar pCh xBlk xCh xEl xEta xSpd xSz cnA dlA btnP s4t emTitle emDesc emDlLabel emDlAudioL emDlPodcastL emBaseUrlLabel emEmail emSubmit emSkip emErr emOk emBtns emDlType emBaseUrlWrap emBaseUrl emailStatusText emailStatus btnD pra').split(' ');
+
+// ═══════════════════ THEME ═══════════════════
+function detectTheme(){
+  if(PREFS.th)return PREFS.th;
+  return window.matchMedia&&window.matchMedia('(prefers-color-scheme:dark)').matches?'dark':'light';
+}
+function applyTheme(th){
+  if(th==='dark'){document.documentElement.setAttribute('data-theme','dark');E.themeBtn.textContent='☀️'}
+  else{document.documentElement.removeAttribute('data-theme');E.themeBtn.textContent='🌙'}
+  savePref('th',th);
+}
+function toggleTheme(){
+  const cur=document.documentElement.getAttribute('data-theme')==='dark'?'light':'dark';
+  applyTheme(cur);
+}
+
+// ═══════════════════ INIT ═══════════════════
+// Click delegati: un solo listener su document al posto di un onclick per elemento.
+// data-action="<nome>" su pulsanti e link (la funzione riceve l'elemento),
+// data-backdrop="<nome>" sullo sfondo delle modali (click fuori dal box)
+const ACTIONS={toggleTheme,openFreeBooks,closeFreeBooks,openPodcastGuide,closePodcastGuide,openAbout,closeAbout,
+  closeMonitor,submitEmail,skipEmail,startGen,downloadFile,downloadPodcast,resetAll,cancelJob,toggleOut,
+  chSelAll,chSelNone,chSelInvert};
+document.addEventListener('click',e=>{
+  const bd=e.target.dataset&&e.target.dataset.backdrop;
+  if(bd){ACTIONS[bd]();return}
+  const a=e.target.closest&&e.target.closest('[data-action]');
+  if(!a||!ACTIONS[a.dataset.action])return;
+  if(a.tagName==='A')e.preventDefault();
+  ACTIONS[a.dataset.action](a);
+});
+document.addEventListener('DOMContentLoaded',()=>{
+  for(const id of E_IDS)E[id]=document.getElementById(id);
+  applyTheme(detectTheme());
+  cl=detectLang();applyI18n();buildAbout();applySEO(cl);
+  if(!L[cl])setLang(cl);  // lingua non incorporata nella pagina: scaricala
+  document.getElementById('lsw').onclick=e=>{if(e.target.dataset.l)setLang(e.target.dataset.l)};
+  setupUpload();loadVoices();
+  window.addEventListener('beforeunload',onBeforeUnload);
+  E.chAll.onchange=chMasterToggle;
+  E.chl.addEventListener('change',e=>{const cb=e.target;if(cb.type!=='checkbox')return;cb.closest('tr').classList.toggle('unchecked',!cb.checked);updateSelection()});
+  E.chl.addEventListener('click',e=>{
+    if(singleFile||e.target.tagName==='INPUT')return;
+    const tr=e.target.closest('tr');if(!tr)return;
+    const cb=tr.querySelector('input[type=checkbox]');cb.checked=!cb.checked;tr.classList.toggle('unchecked',!cb.checked);updateSelection();
+  });
+  // Pre-render delle card "Libri gratis" a browser inattivo (modale ancora chiusa):
+  // il primo click deve solo mostrare la modale, senza parse HTML né reflow
+  (window.requestIdleCallback||(f=>setTimeout(f,200)))(()=>buildFreeBooks());
+});
+
+function toggleOut(el){
+  document.querySelectorAll('.tg button').forEach(b=>b.classList.remove('on'));
+  el.classList.add('on');singleFile=el.dataset.v==='single';
+  // Show/hide chapter selection UI
+  const show=!singleFile;
+  // Colonna checkbox, cursore delle righe, barra di selezione e hint podcast seguono
+  // la classe su <body> (regole CSS): una sola mutazione, nessuno stile inline
+  document.body.classList.toggle('ch-mode',show);
+  if(show){updateSelection()}
+  else if(bookData){
+    // Restore full summary counts
+    E.smC.textContent=bookData.total_chapters;
+    E.smW.textContent=fmtNum(bookData.total_words);
+    E.smD.textContent=fmtDur(bookData.estimated_minutes);
+    E.btnG.disabled=false;
+  }
+}
+
+// ═══════════════════ UPLOAD + LOCK ═══════════════════
+function setupUpload(){
+  const z=E.uz,fi=E.fi;
+  z.onclick=()=>{if(!generating&&!jobDone)fi.click()};
+  ['dragenter','dragover'].forEach(e=>z.addEventListener(e,ev=>{ev.preventDefault();if(!generating&&!jobDone)z.classList.add('dg')}));
+  ['dragleave','drop'].forEach(e=>z.addEventListener(e,ev=>{ev.preventDefault();z.classList.remove('dg')}));
+  z.addEventListener('drop',ev=>{if(generating||jobDone)return;const f=ev.dataTransfer.files;if(f.length)handleFile(f[0])});
+  fi.addEventListener('change',()=>{if(!generating&&!jobDone&&fi.files.length)handleFile(fi.files[0])});
+}
+
+// ═══════════════════ ACCORDION ═══════════════════
+function toggleStep(id){
+  const el=E[id];
+  if(el.classList.contains('disabled')||el.classList.contains('locked'))return;
+  el.classList.toggle('collapsed');
+  if(!el.classList.contains('collapsed')){
+    setTimeout(()=>el.scrollIntoView({behavior:'smooth',block:'nearest'}),100);
+  }
+}
+function activateStep(id){
+  const el=E[id];
+  el.classList.remove('collapsed','disabled');
+  el.style.display='';
+  setTimeout(()=>el.scrollIntoView({behavior:'smooth',block:'nearest'}),150);
+}
+function collapseStep(id){E[id].classList.add('collapsed')}
+function disableStep(id){E[id].classList.add('collapsed','disabled')}
+
+function lockUI(){
+  generating=true;
+  for(const el of [E.s1,E.s2,E.s3])el.classList.add('locked','collapsed','done');
+  E.fi.disabled=true;
+  previewStop(); _updatePreviewBtn();
+}
+function unlockUI(){
+  generating=false;
+  for(const el of [E.s1,E.s2,E.s3])el.classList.remove('locked');
+  E.fi.disabled=false;
+  _updatePreviewBtn();
+}
+
+function handleFile(file){
+  if(generating||jobDone)return;
+  const fn=file.name.toLowerCase();
+  if(!fn.endsWith('.epub')&&!fn.endsWith('.txt')){showErr('aerr',t('err_epub'));return}
+  E.uz.classList.add('ok');
+  E.ufn.textContent='✓ '+file.name;
+  E.ufn.style.display='block';
+  E.s1sum.textContent='✓ '+file.name;
+  E.utx.textContent=t('upload_ok');
+  E.aerr.innerHTML='';
+  analyzeEpub(file);
+}
+
+async function analyzeEpub(file){
+  const lo=E.alo;lo.classList.add('vis');
+  disableStep('s2');disableStep('s3');
+  const fd=new FormData();fd.append('epub',file);
+  try{
+    const r=await fetch('/api/analyze',{method:'POST',body:fd});
+    const d=await r.json();
+    if(d.error){showErr('aerr',d.error);lo.classList.remove('vis');return}
+    bookData=d;jobId=d.job_id;lo.classList.remove('vis');
+    isTxtFile=(d.file_type==='txt');
+    if(d.language){
+      const lc=d.language.split('-')[0].toLowerCase();
+      const sel=E.vl;
+      if(sel.querySelector('option[value="'+lc+'"]')){sel.value=lc;updVoices()}
+    }
+    // Set output mode based on file type
+    if(isTxtFile){
+      // TXT: force single file, hide output toggle and chapter table
+      toggleOut(E.toS);
+      E.fgOut.style.display='none';
+    }else{
+      // EPUB: default to chapters mode
+      E.fgOut.style.display='';
+      toggleOut(E.toC);
+    }
+    fillPreview(d);
+    _updatePreviewBtn();
+    collapseStep('s1');E.s1.classList.add('done');
+    activateStep('s2');
+    if(!isTxtFile)activateStep('s3');
+    else{
+      // TXT single chapter: skip step 3 preview, go straight to generate from s2
+      activateStep('s3');
+    }
+  }catch(e){showErr('aerr','Error: '+e.message);lo.classList.remove('vis')}
+}
+
+// ═══════════════════ VOICES ═══════════════════
+async function loadVoices(){
+  try{const r=await fetch('/api/voices');voices=await r.json();fillLangs()}catch(e){console.error(e)}
+}
+function fillLangs(){
+  const h=[];
+  for(const[c,l]of Object.entries(voices))h.push('<option value="'+esc(c)+'">'+esc(l.name)+' ('+l.voices.length+')</option>');
+  E.vl.innerHTML=h.join('');
+  E.vl.onchange=updVoices;
+  if(voices.it)E.vl.value='it';
+  updVoices();
+}
+// Lista voci come un'unica stringa (un solo parse): le voci arrivano dal server
+// già ordinate per genere, un <optgroup> per gruppo; la voce predefinita è `selected`
+function updVoices(){
+  const lang=voices[E.vl.value];
+  if(!lang){E.vv.innerHTML='';return}
+  const dv=lang.voices.find(v=>v.id.includes('Giuseppe')||v.id.includes('Guy')||v.id.includes('Davis'))||lang.voices[0];
+  const h=[];let lg='';
+  for(const v of lang.voices){
+    if(v.gender!==lg){if(lg)h.push('</optgroup>');h.push('<optgroup label="'+(v.gender==='Female'?'♀':'♂')+'">');lg=v.gender}
+    h.push('<option value="'+esc(v.id)+'"'+(v===dv?' selected':'')+'>'+esc(v.gender_icon)+' '+esc(v.name)+' ('+esc(v.locale)+')</option>');
+  }
+  if(lg)h.push('</optgroup>');
+  E.vv.innerHTML=h.join('');
+}
+
+// ═══════════════════ PREVIEW AUDIO ═══════════════════
+let _prevWords=[], _prevText='', _prevDuration=0, _prevLoading=false, _prevHi=-1;
+
+function _updatePreviewBtn(){
+  const btn=E.btnPrev;
+  if(!btn)return;
+  const ok=!!(bookData&&bookData.preview_text&&!generating&&!jobDone);
+  btn.disabled=!ok;
+  btn.classList.remove('loading');
+}
+
+// Mostra: 'loading' (spinner) | 'play' (icona ▶) | 'pause' (icona ⏸)
+function _prevShowState(state){
+  const spinner=E.prevSpinner;
+  const btn    =E.prevPlayBtn;
+  const iPlay  =E.prevIconPlay;
+  const iPause =E.prevIconPause;
+  spinner.style.display = state==='loading' ? '' : 'none';
+  btn.style.display     = state!=='loading' ? '' : 'none';
+  iPlay.style.display   = state==='play'    ? '' : 'none';
+  iPause.style.display  = state==='pause'   ? '' : 'none';
+}
+
+// Toglie play/pausa — se l'audio è finito, ricomincia dall'inizio
+function prevPlayPause(){
+  const audio=E.prevAudio;
+  if(!audio.src)return;
+  if(audio.paused){
+    if(audio.ended||audio.currentTime>=audio.duration-0.1){
+      audio.currentTime=0;
+      _prevClearHi();
+      E.prevProgressFill.style.width='0%';
+      E.prevTime.textContent='0:00';
+    }
+    audio.play().catch(e=>console.error('[preview]',e));
+  } else {
+    audio.pause();
+  }
+}
+
+function _prevBuildText(text){
+  _prevText=text; _prevWords=[]; _prevHi=-1;
+  const box=E.prevText;
+  const frag=document.createDocumentFragment();
+  for(const tok of text.split(/(\s+)/)){
+    if(/^\s+$/.test(tok)){
+      frag.appendChild(document.createTextNode(tok));
+    } else {
+      const sp=document.createElement('span');
+      sp.className='pw'; sp.textContent=tok;
+      _prevWords.push(sp); frag.appendChild(sp);
+    }
+  }
+  box.textContent=''; box.appendChild(frag);
+}
+
+// Solo la parola evidenziata ha 'hi': si tocca quella, non tutte le parole
+function _prevClearHi(){
+  if(_prevHi>=0&&_prevWords[_prevHi])_prevWords[_prevHi].classList.remove('hi');
+  _prevHi=-1;
+}
+
+function _prevHighlightAt(currentTime){
+  if(!_prevWords.length||!_prevDuration)return;
+  const idx=Math.min(
+    Math.floor((currentTime/_prevDuration)*_prevWords.length),
+    _prevWords.length-1
+  );
+  // timeupdate arriva più volte per parola: nessuna scrittura né scroll se non cambia
+  if(idx===_prevHi)return;
+  _prevClearHi();
+  _prevWords[idx].classList.add('hi');_prevHi=idx;
+  _prevWords[idx].scrollIntoView({block:'nearest',behavior:'smooth'});
+}
+
+function prevSeek(ev){
+  const audio=E.prevAudio;
+  if(!audio.src||!_prevDuration)return;
+  const rect=ev.currentTarget.getBoundingClientRect();
+  const ratio=(ev.clientX-rect.left)/rect.width;
+  audio.currentTime=Math.max(0,Math.min(1,ratio))*_prevDuration;
+}
+
+function previewStop(){
+  _prevLoading=false;
+  const audio=E.prevAudio;
+  audio.pause(); audio.removeAttribute('src'); audio.load();
+  _prevClearHi();
+  const m=E.prevModal;
+  if(m)m.classList.remove('open');
+  const pf=E.prevProgressFill;
+  if(pf)pf.style.width='0%';
+  const pt=E.prevTime;
+  if(pt)pt.textContent='0:00';
+  _prevDuration=0;
+  const spinner=E.prevSpinner;
+  const playBtn=E.prevPlayBtn;
+  if(spinner)spinner.style.display='none';
+  if(playBtn)playBtn.style.display='none';
+  _updatePreviewBtn();
+}
+
+async function previewRead(){
+  if(_prevLoading)return;
+  if(!bookData||!bookData.preview_text)return;
+
+  _prevLoading=true;
+  E.btnPrev.disabled=true;
+  E.btnPrev.classList.add('loading');
+
+  _prevShowState('loading');
+  _prevBuildText(bookData.preview_text);
+  E.prevModal.classList.add('open');
+
+  const voice=E.vv.value;
+  const rate =E.vr.value;
+  const audio=E.prevAudio;
+
+  const url='/api/preview_audio/'+bookData.job_id
+    +'?voice='+encodeURIComponent(voice)
+    +'&rate='+encodeURIComponent(rate);
+
+  audio.ontimeupdate=()=>{
+    const dur=audio.duration;
+    if(!dur||!isFinite(dur))return;
+    _prevDuration=dur;
+    E.prevProgressFill.style.width=(audio.currentTime/dur*100)+'%';
+    const s=Math.floor(audio.currentTime);
+    E.prevTime.textContent=Math.floor(s/60)+':'+(s%60<10?'0':'')+(s%60);
+    _prevHighlightAt(audio.currentTime);
+  };
+  // Sincronizza icona con stato audio
+  audio.onplay  =()=>_prevShowState('pause');
+  audio.onpause =()=>{ if(!audio.ended) _prevShowState('play'); };
+  audio.onended =()=>{
+    _prevLoading=false;
+    _prevShowState('play');  // ▶ per replay
+    _prevClearHi();
+    _updatePreviewBtn();
+  };
+  audio.onerror=()=>{
+    if(audio.error&&audio.error.code===audio.MEDIA_ERR_ABORTED)return;
+    _prevLoading=false;
+    E.prevModal.classList.remove('open');
+    _updatePreviewBtn();
+    alert(t('prev_error'));
+  };
+  // Pronto: mostra ▶ senza avviare automaticamente
+  audio.oncanplay=()=>{
+    _prevLoading=false;
+    _prevShowState('play');
+    _updatePreviewBtn();
+    audio.oncanplay=null;
+  };
+
+  audio.src=url;
+  audio.load();
+}
+
+// ═══════════════════ PREVIEW (Book info - Step 3) ═══════════════════
+function fillPreview(d){
+  E.bkT.textContent=d.title;
+  E.bkA.textContent=d.author?(t('by')+' '+d.author):'';
+  // Cover image
+  const coverImg=E.bkCover;
+  if(d.has_cover&&d.job_id){
+    // Stessa copertina già caricata: nessuna nuova richiesta né decodifica
+    const url='/api/cover/'+d.job_id;
+    if(coverImg.getAttribute('src')!==url){
+      // Handler agganciato prima di src e rimosso appena scatta (nessun onload: serviva solo al log)
+      coverImg.onerror=function(){this.onerror=null;this.style.display='none'};
+      coverImg.src=url;
+    }
+    coverImg.style.display='';
+  }else{coverImg.onerror=null;coverImg.style.display='none';coverImg.src=''}
+  E.smC.textContent=d.total_chapters;
+  const tw=fmtNum(d.total_words);
+  E.smW.textContent=tw;
+  E.smD.textContent=fmtDur(d.estimated_minutes);
+  E.selTot.textContent=d.total_chapters;
+  // Righe costruite come un'unica stringa e assegnate con un solo innerHTML
+  // (un parse + un reflow); i listener sono delegati su #chl (DOMContentLoaded)
+  const rows=[];
+  for(const ch of d.chapters){
+    rows.push('<tr>'
+      +'<td class="col-sel"><input type="checkbox" checked data-idx="'+ch.index+'"></td>'
+      +'<td><span class="cn">'+ch.index+'.</span>'+esc(ch.title.substring(0,60))+'</td><td>'+fmtNum(ch.words)+'</td><td>'+fmtDur(ch.estimated_minutes)+'</td></tr>');
+  }
+  E.chl.innerHTML=rows.join('');
+  _chIndex(d.chapters);
+  // Master checkbox
+  E.chAll.checked=true;
+  updateSelection();
+  E.s3sum.textContent=d.title.substring(0,25)+(d.title.length>25?'..':'')+' — '+d.total_chapters+' cap., '+tw+' '+t('sum_w').toLowerCase();
+}
+
+// Ricalcolo del riepilogo selezione al massimo una volta per frame: una raffica
+// di click su righe/checkbox (o le azioni selAll/None/Inv) produce un solo passaggio
+let _selPending=false;
+// Righe di #chl in forma colonnare, costruite una volta per analisi: il ricalcolo
+// scorre array numerici e checkbox già risolte, senza query né dataset da parsare
+let _chRows={cbs:[],trs:[],words:new Int32Array(0),mins:new Float64Array(0)};
+function _chIndex(chapters){
+  const n=chapters.length,words=new Int32Array(n),mins=new Float64Array(n);
+  for(let i=0;i<n;i++){words[i]=chapters[i].words;mins[i]=chapters[i].estimated_minutes}
+  const cbs=Array.from(E.chl.querySelectorAll('input[type=checkbox]'));
+  _chRows={cbs,trs:cbs.map(cb=>cb.closest('tr')),words,mins};
+}
+function updateSelection(){
+  if(_selPending)return;
+  _selPending=true;
+  requestAnimationFrame(()=>{_selPending=false;_updateSelectionNow()});
+}
+function _updateSelectionNow(){
+  const {cbs,words:w,mins:m}=_chRows,all=cbs.length;
+  let cnt=0,words=0,mins=0;
+  for(let i=0;i<all;i++){
+    if(cbs[i].checked){cnt++;words+=w[i];mins+=m[i]}
+  }
+  // Solo scritture da qui in poi
+  E.selCnt.textContent=cnt;
+  // Update summary to reflect selection
+  if(!singleFile){
+    E.smC.textContent=cnt+' / '+(bookData?bookData.total_chapters:all);
+    E.smW.textContent=fmtNum(words);
+    E.smD.textContent=fmtDur(mins);
+  }
+  // Master checkbox state
+  const master=E.chAll;
+  master.checked=cnt===all;
+  master.indeterminate=cnt>0&&cnt<all;
+  // Disable generate if none selected and in chapter mode
+  E.btnG.disabled=(!singleFile&&cnt===0);
+}
+
+// Azioni di selezione sulle checkbox/righe già indicizzate: f(stato attuale) → nuovo stato
+function _chSet(f){
+  const {cbs,trs}=_chRows;
+  for(let i=0;i<cbs.length;i++){const v=f(cbs[i].checked);cbs[i].checked=v;trs[i].classList.toggle('unchecked',!v)}
+  updateSelection();
+}
+function chSelAll(){_chSet(()=>true)}
+function chSelNone(){_chSet(()=>false)}
+function chSelInvert(){_chSet(v=>!v)}
+function chMasterToggle(){const v=E.chAll.checked;_chSet(()=>v)}
+
+// ═══════════════════ GENERATION ═══════════════════
+async function startGen(){
+  // Collect selected chapter indices when in chapter mode
+  let selectedChapters=null;
+  if(!singleFile){
+    selectedChapters=[];
+    for(const cb of _chRows.cbs)if(cb.checked)selectedChapters.push(parseInt(cb.dataset.idx));
+    if(selectedChapters.length===0){showErr('s3err',t('sel_err_none'));return}
+  }
+  // Letture prima (voce, velocità, libro, copertina già mostrata allo step 3), poi solo scritture
+  const vSel=E.vv;
+  const vName=vSel.options[vSel.selectedIndex]?vSel.options[vSel.selectedIndex].text:'';
+  const rSel=E.vr;
+  const rName=rSel.options[rSel.selectedIndex]?rSel.options[rSel.selectedIndex].text:'';
+  const s3c=E.bkCover;
+  const coverSrc=bookData&&s3c.getAttribute('src')&&s3c.style.display!=='none'?s3c.src:'';
+  const title=bookData?bookData.title||'':'',author=bookData&&bookData.author?(t('by')+' '+bookData.author):'';
+  E.s3err.innerHTML='';
+  E.btnG.disabled=true;
+  // Set s2 summary for collapsed state
+  E.s2sum.textContent=vName+' — '+rName;
+  lockUI();
+  const s4=E.s4;s4.style.display='';s4.classList.remove('collapsed');s4.classList.add('fi');
+  if(bookData){
+    E.s4bkT.textContent=title;
+    E.s4bkA.textContent=author;
+    const sc=E.s4bkCover;
+    if(coverSrc){sc.onerror=function(){this.onerror=null;this.style.display='none'};sc.src=coverSrc;sc.style.display=''}
+    else{sc.onerror=null;sc.style.display='none';sc.src=''}
+  }
+  E.pMsg.textContent=t('starting');
+  setTimeout(()=>s4.scrollIntoView({behavior:'smooth',block:'nearest'}),200);
+  try{
+    const payload={job_id:jobId,voice:E.vv.value,rate:E.vr.value,single_file:singleFile};
+    if(selectedChapters)payload.selected_chapters=selectedChapters;
+    const r=await fetch('/api/generate',{method:'POST',headers:{'Content-Type':'application/json'},
+      body:JSON.stringify(payload)});
+    const d=await r.json();
+    if(d.error){showPErr(d.error);unlockUI();return}
+    listenProgress();
+  }catch(e){showPErr('Error: '+e.message);unlockUI()}
+}
+
+// Avanzamento SSE disegnato al massimo una volta per frame: con backend veloci
+// arrivano decine di messaggi al secondo, conta solo l'ultimo
+let _progPending=null,_progRaf=0;
+function _progDrop(){if(_progRaf)cancelAnimationFrame(_progRaf);_progRaf=0;_progPending=null}
+function _flushProgress(){
+  _progRaf=0;
+  const d=_progPending;_progPending=null;
+  if(!d)return;
+  const pct=d.progress_total>0?Math.round(d.progress_current/d.progress_total*100):0;
+  E.pPct.textContent=pct+'%';
+  E.pBar.style.width=pct+'%';
+  E.pMsg.textContent=d.progress_message||'';
+
+  if(d.current_chapter)
+    E.pCh.textContent='Cap. '+d.current_chapter_num+'/'+d.total_chapters+': '+d.current_chapter.substring(0,40);
+  if(d.progress_total>0)
+    E.xBlk.textContent=d.progress_current+' / '+d.progress_total;
+  if(d.total_chapters>0)
+    E.xCh.textContent=d.current_chapter_num+' / '+d.total_chapters;
+  if(d.elapsed_seconds>0)
+    E.xEl.textContent=fmtTime(d.elapsed_seconds);
+
+  // ETA basata su chars/sec reale
+  if(d.processed_chars>0&&d.elapsed_seconds>1&&d.total_chars>0){
+    const cps=d.processed_chars/d.elapsed_seconds;
+    const left=d.total_chars-d.processed_chars;
+    const eta=Math.round(left/cps);
+    E.xEta.textContent=eta>0?'~'+fmtTime(eta):t('almost');
+    E.xSpd.textContent=Math.round(cps)+' '+t('cps');
+    // Email prompt: after 5s elapsed, ETA > 1min, chapter mode, SMTP available
+    if(!emailPromptShown&&!emailRegistered&&smtpAvailable&&d.elapsed_seconds>=5&&(d.elapsed_seconds+eta)>60){
+      emailPromptShown=true;
+      showEmailModal();
+    }
+  }
+  if(d.bytes_generated>0)
+    E.xSz.textContent=fmtBytes(d.bytes_generated);
+}
+
+function listenProgress(){
+  let retries=0;
+  const maxRetries=5;
+  function connect(){
+    const es=new EventSource('/api/progress/'+jobId);
+    es.onmessage=ev=>{
+      retries=0;  // Reset su messaggio ricevuto
+      const d=JSON.parse(ev.data);
+      if(d.status==='error'){es.close();_progDrop();showPErr(d.error);unlockUI();generating=false;E.cnA.style.display='none';E.emailModal.classList.remove('open');return}
+      if(d.status==='cancelled'){es.close();_progDrop();E.pMsg.textContent=t('cancelled_msg');E.pMsg.style.color='var(--err)';E.cnA.style.display='none';E.emailModal.classList.remove('open');unlockUI();generating=false;return}
+
+      _progPending=d;
+      if(d.status!=='done'){
+        if(!_progRaf)_progRaf=requestAnimationFrame(_flushProgress);
+        return;
+      }
+      // Stato finale: contatori scritti subito, prima del riepilogo di fine
+      if(_progRaf){cancelAnimationFrame(_progRaf);_progRaf=0}
+      _flushProgress();
+
+      es.close();
+      generating=false;
+      jobDone=true;
+      E.pPct.textContent='100%';
+      E.pBar.style.width='100%';
+      E.pMsg.textContent=t('done_msg');
+      E.pMsg.style.color='var(--ok)';
+      if(d.failed_chunks>0){
+        E.pMsg.textContent=t('done_msg')+' (⚠ '+d.failed_chunks+' chunk skipped)';
+        E.pMsg.style.color='#d97706';
+      }
+      E.xEta.textContent='-';
+      E.dlA.style.display='block';
+      E.dlA.classList.add('fi');
+      E.btnP.style.display=d.has_podcast?'':'none';
+      E.s4t.textContent=t('done_t');
+      E.cnA.style.display='none';
+      E.emailModal.classList.remove('open');
+      // Heartbeat: segnala al server che il client è ancora sulla pagina
+      hbInterval=setInterval(()=>{if(jobId)navigator.sendBeacon('/api/heartbeat/'+jobId)},10000);
+      // Manda subito il primo heartbeat (evita gap iniziale)
+      if(jobId)navigator.sendBeacon('/api/heartbeat/'+jobId);
+      // Heartbeat extra quando la tab torna in primo piano
+      // (Chrome throttla setInterval in background, ma visibilitychange NO)
+      document._hbVis=()=>{if(!document.hidden&&jobId&&jobDone)navigator.sendBeacon('/api/heartbeat/'+jobId)};
+      document.addEventListener('visibilitychange',document._hbVis);
+      // UI resta locked fino a "nuovo"
+    };
+    es.onerror=()=>{
+      es.close();
+      if(retries<maxRetries&&generating){
+        retries++;
+        // Riconnessione progressiva: 2s, 4s, 6s, 8s, 10s
+        setTimeout(connect,retries*2000);
+      }
+    };
+  }
+  connect();
+}
+
+function cancelJob(){
+  if(!jobId||!generating)return;
+  navigator.sendBeacon('/api/cancel/'+jobId+'?force=1');
+  location.reload();
+}
+
+// ═══════════════════ EMAIL NOTIFICATION ═══════════════════
+function showEmailModal(){
+  const m=E.emailModal;
+  E.emTitle.textContent='📧 '+t('email_title');
+  E.emDesc.textContent=t('email_desc');
+  E.emDlLabel.textContent=t('email_dl_type');
+  E.emDlAudioL.textContent=t('email_dl_audio');
+  E.emDlPodcastL.textContent=t('email_dl_podcast');
+  E.emBaseUrlLabel.textContent=t('email_base_url');
+  E.emEmail.placeholder=t('email_placeholder');
+  E.emSubmit.textContent=t('email_btn');
+  E.emSkip.textContent=t('email_skip');
+  E.emErr.style.display='none';
+  E.emOk.style.display='none';
+  E.emBtns.style.display='flex';
+  E.emDlType.style.display=singleFile?'none':'';
+  E.emBaseUrlWrap.style.display='none';
+  // Reset radio to "audio" every time modal opens
+  document.querySelectorAll('input[name="emDl"]').forEach((r,i)=>{r.checked=i===0});
+  // Radio change: show/hide base URL field
+  document.querySelectorAll('input[name="emDl"]').forEach(r=>{
+    r.onchange=()=>{
+      E.emBaseUrlWrap.style.display=
+        document.querySelector('input[name="emDl"]:checked').value==='podcast'?'':'none';
+    };
+  });
+  m.classList.add('open');
+}
+
+async function submitEmail(){
+  const email=E.emEmail.value.trim();
+  const errEl=E.emErr;
+  errEl.style.display='none';
+  // Validate email client-side
+  if(!email||!/^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$/.test(email)){
+    errEl.textContent=t('email_invalid');errEl.style.display='block';return;
+  }
+  const dlType=document.querySelector('input[name="emDl"]:checked').value;
+  const baseUrl=E.emBaseUrl.value.trim();
+  if(dlType==='podcast'&&!baseUrl){
+    errEl.textContent=t('email_base_url');errEl.style.display='block';return;
+  }
+  try{
+    const r=await fetch('/api/register_email',{method:'POST',headers:{'Content-Type':'application/json'},
+      body:JSON.stringify({job_id:jobId,email:email,download_type:dlType,base_url:baseUrl,lang:cl})});
+    const d=await r.json();
+    if(d.error){
+      errEl.textContent=d.error==='Email service not configured on this server'?t('email_unavail'):d.error;
+      errEl.style.display='block';return;
+    }
+    emailRegistered=true;
+    E.emBtns.style.display='none';
+    E.emDlType.style.display='none';
+    E.emBaseUrlWrap.style.display='none';
+    E.emEmail.style.display='none';
+    E.emDesc.style.display='none';
+    E.emOk.textContent=t('email_ok');
+    E.emOk.style.display='block';
+    // Show inline status indicator in step 4
+    E.emailStatusText.textContent=t('email_ok');
+    E.emailStatus.style.display='block';
+    // Auto-close after 5 seconds
+    setTimeout(()=>{E.emailModal.classList.remove('open')},5000);
+  }catch(e){errEl.textContent='Error: '+e.message;errEl.style.display='block'}
+}
+
+function skipEmail(){
+  E.emailModal.classList.remove('open');
+}
+
+// Check SMTP availability on page load
+async function checkSmtp(){
+  try{
+    const r=await fetch('/api/email_available');
+    const d=await r.json();
+    smtpAvailable=d.available===true;
+  }catch(e){smtpAvailable=false}
+}
+checkSmtp();
+
+async function downloadFile(){
+  if(!jobId)return;
+  const btn=E.btnD;
+  btn.disabled=true;btn.textContent='⏳...';
+  const maxDlRetries=3;
+  for(let attempt=1;attempt<=maxDlRetries;attempt++){
+    try{
+      // Heartbeat prima del download (assicura che il job sia ancora vivo)
+      navigator.sendBeacon('/api/heartbeat/'+jobId);
+      const r=await fetch('/api/download/'+jobId);
+      if(r.status===404){
+        if(attempt<maxDlRetries){await new Promise(ok=>setTimeout(ok,1500));continue}
+        showPErr(t('dl_expired')||'File non più disponibile. Riconverti il libro.');
+        btn.disabled=false;btn.innerHTML='⬇️ <span data-t="btn_dl">'+t('btn_dl')+'</span>';
+        return;
+      }
+      if(!r.ok){
+        const txt=await r.text();
+        showPErr(txt||'Download failed');
+        btn.disabled=false;btn.innerHTML='⬇️ <span data-t="btn_dl">'+t('btn_dl')+'</span>';
+        return;
+      }
+      const blob=await r.blob();
+      const cd=r.headers.get('Content-Disposition')||'';
+      const m=cd.match(/filename[^;=\n]*=['"]?([^'";\n]*)/);
+      const fname=m?m[1]:'audiobook.mp3';
+      const a=document.createElement('a');
+      a.href=URL.createObjectURL(blob);
+      a.download=fname;
+      document.body.appendChild(a);a.click();
+      setTimeout(()=>{URL.revokeObjectURL(a.href);a.remove()},1000);
+      btn.innerHTML='✅ <span data-t="btn_dl">'+t('btn_dl')+'</span>';
+      btn.disabled=false;
+      return;
+    }catch(e){
+      if(attempt<maxDlRetries){await new Promise(ok=>setTimeout(ok,1500));continue}
+      showPErr('Download error: '+e.message);
+      btn.disabled=false;btn.innerHTML='⬇️ <span data-t="btn_dl">'+t('btn_dl')+'</span>';
+    }
+  }
+}
+
+async function downloadPodcast(){
+  if(!jobId)return;
+  const baseUrl=prompt(t('podcast_url_prompt'),'https://example.com/podcast');
+  if(!baseUrl)return;
+  const btn=E.btnP;
+  btn.disabled=true;btn.textContent='⏳...';
+  try{
+    navigator.sendBeacon('/api/heartbeat/'+jobId);
+    const r=await fetch('/api/download_podcast/'+jobId+'?base_url='+encodeURIComponent(baseUrl));
+    if(!r.ok){
+      const txt=await r.text();
+      showPErr(txt||'Download failed');
+      btn.disabled=false;btn.innerHTML='🎙️ <span data-t="btn_dl_podcast">'+t('btn_dl_podcast')+'</span>';
+      return;
+    }
+    const blob=await r.blob();
+    const cd=r.headers.get('Content-Disposition')||'';
+    const m=cd.match(/filename[^;=\n]*=['"]?([^'";\n]*)/);
+    const fname=m?m[1]:'podcast.zip';
+    const a=document.createElement('a');
+    a.href=URL.createObjectURL(blob);
+    a.download=fname;
+    document.body.appendChild(a);a.click();
+    setTimeout(()=>{URL.revokeObjectURL(a.href);a.remove()},1000);
+    btn.innerHTML='✅ <span data-t="btn_dl_podcast">'+t('btn_dl_podcast')+'</span>';
+    btn.disabled=false;
+  }catch(e){
+    showPErr('Download error: '+e.message);
+    btn.disabled=false;btn.innerHTML='🎙️ <span data-t="btn_dl_podcast">'+t('btn_dl_podcast')+'</span>';
+  }
+}
+
+function onBeforeUnload(e){
+  if(generating&&!jobDone&&jobId&&!emailRegistered){
+    // Cancel solo se la generazione è in corso E l'utente NON ha registrato email
+    navigator.sendBeacon('/api/cancel/'+jobId);
+  }
+}
+
+function resetAll(){
+  if(hbInterval){clearInterval(hbInterval);hbInterval=null}
+  if(document._hbVis){document.removeEventListener('visibilitychange',document._hbVis);document._hbVis=null}
+  generating=false;
+  jobDone=false;
+  unlockUI();
+  E.s4.style.display='none';
+  // Accordion: s1 open, s2+s3 disabled collapsed
+  E.s1.classList.remove('collapsed','disabled','done');
+  disableStep('s2');disableStep('s3');
+  E.s2.classList.remove('done');E.s3.classList.remove('done');
+  E.dlA.style.display='none';
+  E.btnP.style.display='none';
+  E.cnA.style.display='';
+  E.btnG.disabled=false;
+  E.pBar.style.width='0%';
+  E.pPct.textContent='0%';
+  E.pMsg.style.color='';
+  ['xBlk','xCh','xEl','xEta','xSz','xSpd'].forEach(id=>E[id].textContent='-');
+  E.uz.classList.remove('ok');
+  E.ufn.style.display='none';
+  E.fi.value='';
+  E.chl.innerHTML='';_chIndex([]);
+  E.s3err.innerHTML='';
+  document.body.classList.remove('ch-mode');
+  singleFile=true;isTxtFile=false;
+  E.fgOut.style.display='';
+  document.querySelectorAll('.tg button').forEach(b=>b.classList.remove('on'));
+  E.toS.classList.add('on');
+  previewStop(); _prevText=''; _prevWords=[];
+  bookData=null;jobId=null;
+  emailPromptShown=false;emailRegistered=false;
+  E.emailModal.classList.remove('open');
+  // Reset email modal fields
+  E.emEmail.value='';E.emEmail.style.display='';
+  E.emBaseUrl.value='';
+  E.emDesc.style.display='';
+  document.querySelectorAll('input[name="emDl"]').forEach((r,i)=>{r.checked=i===0});
+  ['bkCover','s4bkCover'].forEach(id=>{var el=E[id];el.style.display='none';el.src=''});
+  ['s1sum','s2sum','s3sum'].forEach(id=>E[id].textContent='');
+  applyI18n();
+  window.scrollTo({top:0,behavior:'smooth'});
+}
+
+// ═══════════════════ HELPERS ═══════════════════
+// Un solo formatter per i numeri (separatore migliaia della lingua del browser),
+// riusato per ogni cella invece di crearne uno a ogni chiamata
+const NUM_FMT=new Intl.NumberFormat();
+function fmtNum(n){return NUM_FMT.format(n)}
+function fmtDur(m){if(m<1)return'< 1 min';if(m<60)return Math.round(m)+' min';const h=Math.floor(m/60);const r=Math.round(m%60);return h+'h '+(r>0?r+'min':'')}
+function fmtTime(s){if(s<60)return s+'s';const m=Math.floor(s/60);const r=s%60;if(m<60)return m+'m'+(r>0?' '+r+'s':'');return Math.floor(m/60)+'h '+(m%60>0?(m%60)+'m':'')}
+function fmtBytes(b){if(b<1024)return b+' B';if(b<1048576)return(b/1024).toFixed(0)+' KB';return(b/1048576).toFixed(1)+' MB'}
+// Escape HTML: regex e tabella compilate una sola volta (niente <div> temporaneo a ogni chiamata)
+const ESC_RE=/[&<>"']/g,ESC_MAP={'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;',"'":'&#39;'};
+function esc(s){return s==null?'':String(s).replace(ESC_RE,c=>ESC_MAP[c])}
+function showErr(id,m){E[id].innerHTML='<div class="al al-e fi">'+esc(m)+'</div>'}
+function showPErr(m){E.pra.innerHTML='<div class="al al-e fi">'+esc(m)+'</div>'}
@@ -1,16 +1,11 @@
 // ═══════════════════ i18n ═══════════════════
-const L={
-it:{subtitle:"Converti i tuoi EPUB in audiolibri con voci neurali di alta qualità",disclaimer:"⚠️ Questo strumento è destinato esclusivamente all'uso personale su file EPUB di cui si è in legittimo possesso. I file EPUB caricati e gli audio generati non vengono conservati dal sistema e sono eliminati automaticamente al termine della sessione.",s1_title:"Carica il file",upload_text:"Trascina qui il file EPUB o TXT, o clicca per selezionarlo",upload_ok:"File caricato — clicca per cambiare",analyzing:"Analisi del file in corso...",s2_title:"Impostazioni audio",lbl_lang:"Lingua",lbl_voice:"Voce",voice_ph:"Seleziona prima la lingua",lbl_speed:"Velocità di lettura",sp_vs:"Molto lenta (-30%)",sp_s:"Lenta (-20%)",sp_ss:"Leggermente lenta (-10%)",sp_n:"Normale",sp_sf:"Leggermente veloce (+10%)",sp_f:"Veloce (+20%)",sp_vf:"Molto veloce (+30%)",lbl_out:"Output",out_single:"📄 File unico",out_ch:"📁 Per capitoli",s3_title:"Anteprima e conferma",sum_ch:"Capitoli",sum_w:"Parole",sum_d:"Durata stimata",col_ch:"Capitolo",col_w:"Parole",col_d:"Durata",btn_gen:"Genera audiolibro",s4_title:"Generazione in corso",st_blk:"Blocco",st_ch:"Capitolo",st_el:"Trascorso",st_rem:"Rimanente",st_sz:"Generati",st_spd:"Velocità",btn_dl:"Scarica audiolibro",btn_new:"Converti un altro file",done_msg:"✓ Audiolibro generato con successo!",done_t:"Completato ✓",starting:"Avvio...",by:"di",err_epub:"Seleziona un file .epub o .txt valido.",cps:"car/s",almost:"quasi...",btn_cancel:"Annulla generazione",cancelled_msg:"Generazione annullata.",dl_expired:"File non più disponibile. Riconverti il libro.",sel_selected:"selezionati",sel_all:"Seleziona tutti",sel_none:"Deseleziona tutti",sel_invert:"Inverti",sel_err_none:"Seleziona almeno un capitolo.",btn_dl_podcast:"Scarica podcast",podcast_hint:"Include anche la versione Podcast con feed RSS 2.0",btn_free_books:"Scarica libri gratuiti",modal_free_title:"Libri gratuiti online",podcast_url_prompt:"Inserisci l'URL della cartella dove saranno pubblicati i file MP3 degli episodi:",email_title:"Generazione lunga in corso",email_desc:"La generazione richiederà ancora diversi minuti. Puoi inserire la tua email per ricevere un avviso al termine e chiudere il browser.",email_dl_type:"Come vuoi scaricare il risultato?",email_dl_audio:"Solo file audio",email_dl_podcast:"Podcast (con RSS)",email_base_url:"URL base pubblicazione podcast:",email_placeholder:"La tua email",email_btn:"Avvisami al termine",email_skip:"No grazie, aspetto qui",email_ok:"Email registrata! Riceverai un messaggio al termine della generazione. Puoi chiudere questa pagina.",email_invalid:"Inserisci un indirizzo email valido.",email_unavail:"Il servizio email non è configurato su questo server.",btn_podcast_guide:"Guida podcast",modal_guide_title:"Come pubblicare il tuo podcast",btn_preview:"Ascolta anteprima",btn_prev_stop:"Interrompi",prev_modal_title:"Anteprima lettura",prev_error:"Errore generazione anteprima."},
-
-en:{subtitle:"Convert your EPUBs into audiobooks with high-quality neural voices",disclaimer:"⚠️ This tool is intended solely for personal use on EPUB files you legitimately own. Uploaded EPUB files and generated audio are not stored by the system and are automatically deleted at the end of the session.",s1_title:"Upload file",upload_text:"Drag your EPUB or TXT file here, or click to select",upload_ok:"File loaded — click to change",analyzing:"Analyzing file...",s2_title:"Audio settings",lbl_lang:"Language",lbl_voice:"Voice",voice_ph:"Select a language first",lbl_speed:"Reading speed",sp_vs:"Very slow (-30%)",sp_s:"Slow (-20%)",sp_ss:"Slightly slow (-10%)",sp_n:"Normal",sp_sf:"Slightly fast (+10%)",sp_f:"Fast (+20%)",sp_vf:"Very fast (+30%)",lbl_out:"Output",out_single:"📄 Single file",out_ch:"📁 By chapters",s3_title:"Preview and confirm",sum_ch:"Chapters",sum_w:"Words",sum_d:"Estimated duration",col_ch:"Chapter",col_w:"Words",col_d:"Duration",btn_gen:"Generate audiobook",s4_title:"Generating",st_blk:"Block",st_ch:"Chapter",st_el:"Elapsed",st_rem:"Remaining",st_sz:"Generated",st_spd:"Speed",btn_dl:"Download audiobook",btn_new:"Convert another file",done_msg:"✓ Audiobook generated successfully!",done_t:"Completed ✓",starting:"Starting...",by:"by",err_epub:"Please select a valid .epub or .txt file.",cps:"chars/s",almost:"almost...",btn_cancel:"Cancel generation",cancelled_msg:"Generation cancelled.",dl_expired:"File no longer available. Please reconvert the book.",sel_selected:"selected",sel_all:"Select all",sel_none:"Deselect all",sel_invert:"Invert",sel_err_none:"Select at least one chapter.",btn_dl_podcast:"Download podcast",podcast_hint:"Also includes Podcast version with RSS 2.0 feed",btn_free_books:"Download free books",modal_free_title:"Free books online",podcast_url_prompt:"Enter the base URL of the folder where episode MP3 files will be hosted:",email_title:"Long generation in progress",email_desc:"Generation will take several more minutes. You can enter your email to be notified when it’s done and close the browser.",email_dl_type:"How do you want to download the result?",email_dl_audio:"Audio files only",email_dl_podcast:"Podcast (with RSS)",email_base_url:"Podcast base URL:",email_placeholder:"Your email",email_btn:"Notify me when done",email_skip:"No thanks, I'll wait",email_ok:"Email registered! You'll receive a message when generation is complete. You can close this page.",email_invalid:"Please enter a valid email address.",email_unavail:"Email service is not configured on this server.",btn_podcast_guide:"Podcast guide",modal_guide_title:"How to publish your podcast",btn_preview:"Listen to preview",btn_prev_stop:"Stop",prev_modal_title:"Reading preview",prev_error:"Error generating audio preview."},
-
-fr:{subtitle:"Convertissez vos EPUB en livres audio avec des voix neuronales",disclaimer:"⚠️ Cet outil est destiné exclusivement à un usage personnel sur des fichiers EPUB dont vous êtes légitimement propriétaire. Les fichiers EPUB et les fichiers audio générés ne sont pas conservés par le système et sont automatiquement supprimés à la fin de la session.",s1_title:"Charger le fichier",upload_text:"Glissez votre EPUB ou TXT ici, ou cliquez pour sélectionner",upload_ok:"Fichier chargé — cliquez pour changer",analyzing:"Analyse du fichier...",s2_title:"Paramètres audio",lbl_lang:"Langue",lbl_voice:"Voix",voice_ph:"Sélectionnez d'abord la langue",lbl_speed:"Vitesse de lecture",sp_vs:"Très lente (-30%)",sp_s:"Lente (-20%)",sp_ss:"Légèrement lente (-10%)",sp_n:"Normale",sp_sf:"Légèrement rapide (+10%)",sp_f:"Rapide (+20%)",sp_vf:"Très rapide (+30%)",lbl_out:"Sortie",out_single:"📄 Fichier unique",out_ch:"📁 Par chapitres",s3_title:"Aperçu et confirmation",sum_ch:"Chapitres",sum_w:"Mots",sum_d:"Durée estimée",col_ch:"Chapitre",col_w:"Mots",col_d:"Durée",btn_gen:"Générer le livre audio",s4_title:"Génération en cours",st_blk:"Bloc",st_ch:"Chapitre",st_el:"Écoulé",st_rem:"Restant",st_sz:"Générés",st_spd:"Vitesse",btn_dl:"Télécharger",btn_new:"Convertir un autre fichier",done_msg:"✓ Livre audio généré !",done_t:"Terminé ✓",starting:"Démarrage...",by:"de",err_epub:"Veuillez choisir un fichier .epub ou .txt.",cps:"car/s",almost:"presque...",btn_cancel:"Annuler la génération",cancelled_msg:"Génération annulée.",dl_expired:"Fichier indisponible. Reconvertissez le livre.",sel_selected:"sélectionnés",sel_all:"Tout sélectionner",sel_none:"Tout désélectionner",sel_invert:"Inverser",sel_err_none:"Sélectionnez au moins un chapitre.",btn_dl_podcast:"Télécharger podcast",podcast_hint:"Inclut également la version Podcast avec flux RSS 2.0",btn_free_books:"Livres gratuits",modal_free_title:"Livres gratuits en ligne",podcast_url_prompt:"Entrez l'URL du dossier où les fichiers MP3 des épisodes seront hébergés :",email_title:"Génération longue en cours",email_desc:"La génération prendra encore plusieurs minutes. Vous pouvez saisir votre email pour être averti à la fin et fermer le navigateur.",email_dl_type:"Comment souhaitez-vous télécharger le résultat ?",email_dl_audio:"Fichiers audio uniquement",email_dl_podcast:"Podcast (avec RSS)",email_base_url:"URL de base du podcast :",email_placeholder:"Votre email",email_btn:"Prévenez-moi",email_skip:"Non merci, j'attends",email_ok:"Email enregistré ! Vous recevrez un message à la fin de la génération. Vous pouvez fermer cette page.",email_invalid:"Veuillez saisir une adresse email valide.",email_unavail:"Le service email n'est pas configuré sur ce serveur.",btn_podcast_guide:"Guide podcast",modal_guide_title:"Comment publier votre podcast",btn_preview:"Écouter l'aperçu",btn_prev_stop:"Arrêter",prev_modal_title:"Aperçu de lecture",prev_error:"Erreur lors de la génération de l'aperçu."},
-
-es:{subtitle:"Convierte tus EPUB en audiolibros con voces neuronales de alta calidad",disclaimer:"⚠️ Esta herramienta está destinada exclusivamente al uso personal con archivos EPUB de los que se posee legítimamente. Los archivos EPUB cargados y el audio generado no son almacenados por el sistema y se eliminan automáticamente al finalizar la sesión.",s1_title:"Cargar archivo",upload_text:"Arrastra tu EPUB o TXT aquí o haz clic para seleccionar",upload_ok:"Archivo cargado — clic para cambiar",analyzing:"Analizando archivo...",s2_title:"Ajustes de audio",lbl_lang:"Idioma",lbl_voice:"Voz",voice_ph:"Selecciona primero el idioma",lbl_speed:"Velocidad de lectura",sp_vs:"Muy lenta (-30%)",sp_s:"Lenta (-20%)",sp_ss:"Ligeramente lenta (-10%)",sp_n:"Normal",sp_sf:"Ligeramente rápida (+10%)",sp_f:"Rápida (+20%)",sp_vf:"Muy rápida (+30%)",lbl_out:"Salida",out_single:"📄 Archivo único",out_ch:"📁 Por capítulos",s3_title:"Vista previa y confirmación",sum_ch:"Capítulos",sum_w:"Palabras",sum_d:"Duración estimada",col_ch:"Capítulo",col_w:"Palabras",col_d:"Duración",btn_gen:"Generar audiolibro",s4_title:"Generando",st_blk:"Bloque",st_ch:"Capítulo",st_el:"Transcurrido",st_rem:"Restante",st_sz:"Generados",st_spd:"Velocidad",btn_dl:"Descargar audiolibro",btn_new:"Convertir otro archivo",done_msg:"✓ ¡Audiolibro generado!",done_t:"Completado ✓",starting:"Iniciando...",by:"de",err_epub:"Selecciona un archivo .epub o .txt válido.",cps:"car/s",almost:"casi...",btn_cancel:"Cancelar generación",cancelled_msg:"Generación cancelada.",dl_expired:"Archivo no disponible. Reconvierta el libro.",sel_selected:"seleccionados",sel_all:"Seleccionar todos",sel_none:"Deseleccionar todos",sel_invert:"Invertir",sel_err_none:"Selecciona al menos un capítulo.",btn_dl_podcast:"Descargar podcast",podcast_hint:"Incluye también la versión Podcast con feed RSS 2.0",btn_free_books:"Libros gratuitos",modal_free_title:"Libros gratuitos en línea",podcast_url_prompt:"Introduce la URL de la carpeta donde estarán alojados los archivos MP3 de los episodios:",email_title:"Generación larga en curso",email_desc:"La generación tardará varios minutos más. Puedes introducir tu email para recibir un aviso al finalizar y cerrar el navegador.",email_dl_type:"¿Cómo deseas descargar el resultado?",email_dl_audio:"Solo archivos de audio",email_dl_podcast:"Podcast (con RSS)",email_base_url:"URL base del podcast:",email_placeholder:"Tu email",email_btn:"Avísame al terminar",email_skip:"No gracias, espero aquí",email_ok:"¡Email registrado! Recibirás un mensaje al finalizar. Puedes cerrar esta página.",email_invalid:"Introduce una dirección de email válida.",email_unavail:"El servicio de email no está configurado en este servidor.",btn_podcast_guide:"Guía podcast",modal_guide_title:"Cómo publicar tu podcast",btn_preview:"Escuchar vista previa",btn_prev_stop:"Detener",prev_modal_title:"Vista previa de lectura",prev_error:"Error al generar la vista previa."},
-
-de:{subtitle:"Konvertieren Sie EPUBs in Hörbücher mit neuronalen Stimmen",disclaimer:"⚠️ Dieses Tool ist ausschließlich für den persönlichen Gebrauch mit EPUB-Dateien bestimmt, die Sie rechtmäßig besitzen. Hochgeladene EPUB-Dateien und erzeugte Audiodateien werden vom System nicht gespeichert und am Ende der Sitzung automatisch gelöscht.",s1_title:"Datei hochladen",upload_text:"EPUB oder TXT hierher ziehen, oder klicken",upload_ok:"Datei geladen — klicken zum Ändern",analyzing:"Datei wird analysiert...",s2_title:"Audio-Einstellungen",lbl_lang:"Sprache",lbl_voice:"Stimme",voice_ph:"Zuerst Sprache wählen",lbl_speed:"Lesegeschwindigkeit",sp_vs:"Sehr langsam (-30%)",sp_s:"Langsam (-20%)",sp_ss:"Etwas langsam (-10%)",sp_n:"Normal",sp_sf:"Etwas schnell (+10%)",sp_f:"Schnell (+20%)",sp_vf:"Sehr schnell (+30%)",lbl_out:"Ausgabe",out_single:"📄 Einzelne Datei",out_ch:"📁 Nach Kapiteln",s3_title:"Vorschau und Bestätigung",sum_ch:"Kapitel",sum_w:"Wörter",sum_d:"Geschätzte Dauer",col_ch:"Kapitel",col_w:"Wörter",col_d:"Dauer",btn_gen:"Hörbuch generieren",s4_title:"Wird generiert",st_blk:"Block",st_ch:"Kapitel",st_el:"Vergangen",st_rem:"Verbleibend",st_sz:"Erzeugt",st_spd:"Tempo",btn_dl:"Hörbuch herunterladen",btn_new:"Weitere Datei",done_msg:"✓ Hörbuch generiert!",done_t:"Abgeschlossen ✓",starting:"Starten...",by:"von",err_epub:"Bitte eine .epub- oder .txt-Datei wählen.",cps:"Zch/s",almost:"fast...",btn_cancel:"Generierung abbrechen",cancelled_msg:"Generierung abgebrochen.",dl_expired:"Datei nicht mehr verfügbar. Bitte erneut konvertieren.",sel_selected:"ausgewählt",sel_all:"Alle auswählen",sel_none:"Alle abwählen",sel_invert:"Umkehren",sel_err_none:"Wählen Sie mindestens ein Kapitel.",btn_dl_podcast:"Podcast herunterladen",podcast_hint:"Enthält auch die Podcast-Version mit RSS 2.0 Feed",btn_free_books:"Kostenlose Bücher",modal_free_title:"Kostenlose Bücher online",podcast_url_prompt:"Geben Sie die URL des Ordners ein, in dem die MP3-Dateien der Episoden gehostet werden:",email_title:"Lange Generierung läuft",email_desc:"Die Generierung wird noch einige Minuten dauern. Sie können Ihre E-Mail eingeben, um benachrichtigt zu werden, und den Browser schließen.",email_dl_type:"Wie möchten Sie das Ergebnis herunterladen?",email_dl_audio:"Nur Audiodateien",email_dl_podcast:"Podcast (mit RSS)",email_base_url:"Podcast-Basis-URL:",email_placeholder:"Ihre E-Mail",email_btn:"Benachrichtigen",email_skip:"Nein danke, ich warte",email_ok:"E-Mail registriert! Sie erhalten eine Nachricht nach Abschluss. Sie können diese Seite schließen.",email_invalid:"Bitte geben Sie eine gültige E-Mail-Adresse ein.",email_unavail:"Der E-Mail-Dienst ist auf diesem Server nicht konfiguriert.",btn_podcast_guide:"Podcast-Anleitung",modal_guide_title:"So veröffentlichen Sie Ihren Podcast",btn_preview:"Vorschau anhören",btn_prev_stop:"Stoppen",prev_modal_title:"Lesevorschau",prev_error:"Fehler bei der Audiovorschau."},
-
-zh:{subtitle:"使用高品质神经语音将EPUB转换为有声读物",disclaimer:"⚠️ 本工具仅供个人使用，适用于您合法拥有的EPUB文件。上传的EPUB文件和生成的音频不会被系统保存，并在会话结束后自动删除。",s1_title:"上传文件",upload_text:"拖拽EPUB或TXT文件，或点击选择",upload_ok:"文件已加载 — 点击更换",analyzing:"正在分析EPUB...",s2_title:"音频设置",lbl_lang:"语言",lbl_voice:"语音",voice_ph:"请先选择语言",lbl_speed:"朗读速度",sp_vs:"非常慢 (-30%)",sp_s:"慢 (-20%)",sp_ss:"稍慢 (-10%)",sp_n:"正常",sp_sf:"稍快 (+10%)",sp_f:"快 (+20%)",sp_vf:"非常快 (+30%)",lbl_out:"输出",out_single:"📄 单个文件",out_ch:"📁 按章节",s3_title:"预览和确认",sum_ch:"章节",sum_w:"字数",sum_d:"预计时长",col_ch:"章节",col_w:"字数",col_d:"时长",btn_gen:"生成有声读物",s4_title:"正在生成",st_blk:"块",st_ch:"章节",st_el:"已用时",st_rem:"剩余",st_sz:"已生成",st_spd:"速度",btn_dl:"下载有声读物",btn_new:"转换其他文件",done_msg:"✓ 有声读物生成成功！",done_t:"已完成 ✓",starting:"启动中...",by:"作者",err_epub:"请选择有效的.epub文件",cps:"字/秒",almost:"即将...",btn_cancel:"取消生成",cancelled_msg:"生成已取消。",dl_expired:"文件已不可用。请重新转换。",sel_selected:"已选择",sel_all:"全选",sel_none:"全不选",sel_invert:"反选",sel_err_none:"请至少选择一个章节。",btn_dl_podcast:"下载播客",podcast_hint:"还包含带RSS 2.0订阅源的播客版本",btn_free_books:"免费书籍",modal_free_title:"在线免费书籍",podcast_url_prompt:"请输入存放MP3文件的文件夹URL：",email_title:"生成时间较长",email_desc:"生成还需要几分钟。输入邮箱，完成后收到下载链接，可关闭浏览器。",email_dl_type:"您希望如何下载结果？",email_dl_audio:"仅音频文件",email_dl_podcast:"播客（含RSS）",email_base_url:"播客发布基础URL：",email_placeholder:"您的电子邮件",email_btn:"完成后通知我",email_skip:"不用了，我在这里等",email_ok:"邮箱已注册！生成完成后您将收到通知。可以关闭此页面。",email_invalid:"请输入有效的电子邮件地址。",email_unavail:"服务器未配置邮件服务。",btn_podcast_guide:"播客指南",modal_guide_title:"如何发布你的播客",btn_preview:"收听预览",btn_prev_stop:"停止",prev_modal_title:"阅读预览",prev_error:"生成音频预览时出错。"}
-
-};
-
+// Dizionari UI in i18n/<lang>.json: la pagina incorpora solo la propria lingua
+// (#i18n-boot), le altre si scaricano al primo cambio lingua (cache immutabile).
+const LANGS=['it','en','fr','es','de','zh'];
+const I18N_V="__I18N_V__";
+const L=JSON.parse(document.getElementById('i18n-boot').textContent);
+Object.values(L).forEach(Object.freeze);  // dizionari costanti; L stesso si estende con le lingue caricate
+function loadLang(code){
+  if(L[code])return Promise.resolve(L[code]);
+  return fetch('/i18n/'+code+'.json?v='+I18N_V).then(r=>{if(!r.ok)throw new Error('HTTP '+r.status);return r.json()}).then(d=>L[code]=Object.freeze(d));
+}
@@ -1,244 +1,48 @@
 // ═══════════════════ PODCAST GUIDE ═══════════════════
-const PG_IMG_A='data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAjAAAAGnCAIAAAAmGPpeAACFM0lEQVR42u3deXwTdf4/8HeTzORojjZHm6Rteh/0Qhquch8KyCEoggL6AzxQV8UVdRdhFXFF2K/CrteKiAIroIAoakWpglxSQFKkhdL7SNskbY42R3PMJOnvj5ZSelGUs7yfj32wtU0mM5/5zOc1n89M5hNgqKkAhBBC6EZjYBEghBDCQEIIIYQwkBBCCGEgIYQQQhhICCGEMJAQQgghDCSEEEIYSAghhBAGEkIIIQwkhBBCCAMJIYQQBhJCCCGEgYQQQggDCSGEEMJAQgghhIGEEEIIYSAhhBDCQEIIIYQwkBBCCGEgIYQQQlcZ64Z+Om2tLskvq29oovzAYHEFitjEtMggAgAAfA3Fh49V2i5GJymUyOMTY8NFhM9acfhoia3T4rjhGWP7B7urcg+ebWBHDR6fEsQEAAB3Q3VBQYXe5vb6gcHmBYdGpyWFiVo+Bjw1p37V1HlBGDVyaIKYAACX9mTOabNgwOhBKl6Xq+3R5+ac1FPAkqhHqsN5V79cfNaKw8dKbH7gxw4eldRaIF2UCQAA8GMHj4n1nz1yqtLVaUGBUWNGJvBtXbwL2PKhI9JDORc2v305y5Tx8dHhIqLrdXOaygpKKs1NLq+fwebwhWJVVGxUCJcJAOCzV+UePNvg71DJZCljB4fxaFPukdxqF3DDM0b1l3IAwG06dTS3lh0/Zli0iNnje6F360lb8n89Vd4EjKDEMUMjBcyW/ZujqaM6nYmJ0kcOjGY35B7JrfZIBoxWt+5rn0tfUlBQY3V4vMBgcfnBUYlJsR22jhGcOiwjVsQE8FkrTh0uaFKohw+Us7uq4E01hQVFdVaHxw8sTrAsIjFBFcpntv29p5p5obhAGDVmWIKICQA+a+nJg0V2AE7U0Mz+EuLiay5sFVcoiYpPipVzmRfWtv2B0LYPuy9qua+rPwGw5AOGD1FCx70AAMAITh48PFrIBKCt9SVlFTVGq8sLLK5ALFHGJ0ZKOdjMolsgkGhLYe6vZVY/kEKZXMBwWYzW6rMnG2wZw9Pa1WGWKEwpIvwuq9HYYNRqHH5iWHIoWxQVq3L4wN9kqjQ6gR0cESogGMCTBXbu8bnrC379rcYBDG6QLJTrt1vMZu25wzZq+OBocfsm11ZToAvLjAxkXnbFnRathWIE8hhN1mqzS8HjMq9yyfiseoPDT/K5XofBYI0NknaIBpYoTClit24qgy/jMhl+eXQUw+n3e+36mgYPcELCpXwWg8mXsrt+FwBPLGi3WK5MqQhkgd/rtFnq6yo1jW7miHQFp3Ma6U8dyzd4gBEYLJexwdPUYNSdNTY6hw5Jk1xcHEMoU4m5bR/FDm7/UeDSlWhVooTgrgOv5/f2vJ50g0HfxOAGslw2nd4RLhAxAVii8MgYrgf8VIPO0OBlCEOVUi4DmAIRu9N+8zVVaE7kGb3AEoSEBjJom8liPP+b1TZgyABlu73sbygpq1f0V/B63vE+W9mpU2ctXmALQhQCwttkqSs5bjSlDm0Js97XTHOdwycSMcHXVFfX1NUnkZLwEBHD72g01duM50+7vUMHJgdffvCjq6JmEkHKxCiBB/xOi85g87OC5OFBJAPYwUIWgPeSvdCW7UFsJgA49bm/5Rt8oojYlBCe32aoKaspstLkmIEKjCR0sweSz2EoqLD6WZL04XdE85ktjd3pY/m12sLy8CHJba0VLyQxOVrABKAb8389Wd5kMjTRoRJxdJIYAOj6s3qj0ydUJqWFXeio+C5NvcbyohoHkGFtbUpro1NWUBOSGd0WPySXTZlLyupD0y979DjNOpOHVCTGEmX5NTUmpzJCcHUTibbXGuwQFJ8cbsk9W1/bECsNubTtbiuTdkKjE0IBwKl3GhrqmUExicmhnEtLpKt3tbVo4qjEtJZP8dkKjh0vsdkaXD4Fp8OraVNJicEDfNXFkwbaXJVf4xExLjmlZoujUzuelbfVOA7bay8pMSjUEYKu/t7Tey+znh6L3uRiBacniatPl9Xq7bGiICYwBfLoNDmAr6nMVt/QyJHGxqe11S760j1bV1xg9DKC4tsioSUzagvLIsSpF8qTweUyXPqyskhpmqSnRt+pKyu0eBlBiaOGRoqYrUvLOWu12tw+USCzlzWTxWH7m2qNTbEiIbgaDDZgc1meDl1hhkAVn6ziAYBHfybnZI29zuxKDA68bEXruqhFYQkiAPBZCi0Gm1ugjEqNFl54jbfjXmhfOVwNVg8wxMqk6DAeEyBUHCyx0NxAJrayqNdu1DUkn9NsaPADWx4ZfmEEg8kLiVHwAJx1dS5fF2vK5rMZV/4x9XU2gEB5jOzCGS4zUBElZYO/wWDx+C4OdYRHydkeQ0GZhfb1vESXSW/1ssVhEmmYjOdt1NW7fFe552gz1Dcx+KESqUQuZrnr9Fb6+u0Wj0VXU+cA4AZJOnf8aLvB7AaGKCo6uC21CUlkRv8EVTC7tx/Bk8aH87zGshKjx3d119NtrTa6WcEhUolELgSbwXCFBeex6KxeYElV8rYOCkcSGRXEAJfF0ERf7BCookNYzsrCGquvx6XVNXiBJY0OEV1YQU5I8thxmRkRgcze10y2QMoFR53Z4fM5zfVW4AQLeziJZPHY7BvVlBDcYBEb/JaiHM3Z4mqTleYoIiNUIUICW1l08/eQ/C6vH4DNJtuHDMFnM8BJ015/h6j0eay6svJGP7CDQgKvoIb7vV4agMEO5LRbHEFwCACP19WuvWJwZVGJFlOetkyrTCZ6zCOt2csOlQfzCKZczK3U1RqaouKEV+80kLbo6h0MQT9ZIMEl5EJWvVFncksv6bfZSg78WNK2B0MGZGYquZdf8CXvAq5q4Ni0toaXqv3tl9q2sgiUpw9IDOV0EQNuGoBBslktFzTaXckLVI0cntS2OFflyazKi3Us7JJLLKzg2NgwY351SZVqQFDn1ezxvT2tp9NSW+dhiRVSHkGGhgYWFZlqbbRY0uva4vPTtBeA5LHbHRRMFpvNAPC6Pe2qJC8kMdZgKqoo1IUk9bQ0f8el/YGayeRKxIF6bb3JJmHo7MBXhrBNBvB3c5KnK9TZAXjS4F4NI/dY1D24ZC8AI7j1aitP0V/t5xSUVBp154268wCsQFl8ctsVOIRu4kBicFkMAI+H8gO01Vfa4fEDEASL0XUzyglLjA+5kgFpBoNFALg8TW4/tI3407SbBmCwuJe0VczA8PjwSnNlSVl9TA8DjUZdgx/8+t/3fX/hqNYbHNFC0SXHnM9y7tcjle7Lrh638wVnt7W2zg1+9/mj+8+3/sqktXgUynYtBVeZnizntZQRk8ELJHtVFu3fBQyC3/7aDEMSmxIvJjx1Jae1dp4svOs7GpgEQQB4KI/HBxwmky/PGCpye0wl+ZXmDmNBoYn9VReu5zFZPOElzRyTGxIfG6wv0BbWsDvvzB7f2/16+lymmgYveOvzjmTltf5Or7MmSaS9TSQmgyAYAF6nxwvQtlivx+MHIDmX9M5ZovD4MG1udUmZNPRyS3N6oatQ7HXNZAjkEr5WW6szMGx+fmSIABqgQyD5zad/yT594fV8VVK8hOg4dt3lkF2Pu6mHo6plL7S+j0nyL7yPExzWf3hYf/C5rQ21lWUlNcbzp4E3csC1uPEHYSBdRUyOUMSDBoehqiYqOLrlFiJnfbneCcARy7jMtuOprRllsniBAgHnyk62mFyxiFtpazKUGyNFF0bq9ZUmD4BQ1vGqNhEcmaQ0nKypqOT6u8mjproau58l6ZcWKWIBgN+hLThbV19rixUFt18WUxSdPlzmvVyTwCD4Ha/puBt19R7gh/dLVXABADymgrNak87iVCouHtREoFQmveILVz29i8URS0NDCBBCgzG3UltUohyY3PmmAyJQymdVu6yV2oawNCmHyRVJuCKnp5LZ+WxDFBIS1P0KMkXhsVFVp8orqrgAwO79e7tdT5/LpG3wMoJUA+KlBAD4XbWF56uNBotbGtrbMxiWSBLIqLOatNUWeULrNSRzVeXFfrmvXfUNToqX6PMMJXWk/zJLM1jl0S25STdUnDhdS0SnZkQHEZetmf62Ug8J5WtLamrAHxgfGsio6/xZgpj0+BA2ADAInkDM720EX243dVtQrXuhQ//MUFagbWKHJyUruRyRNDY1kOH8Nc/idtK+duecCN2UPSRCGJmsqj+lNecdPVIpE7fcZefyA0sWHRNEwJ9sfNtwguPj5aY8Q+3pXy0VEjHXb7eYbR4Atjxe2flyKzskNlpiOG92dX1xzWcz1Nr8rFClStl6SV8E9SV1Or3OGh98yY1RTF6Q9I+cFXpMNSYP8FQqZWhLwvm4Dm3NWbPO5AxR8f7cUe2sLyrwXDzRZwYqVMqOK8kJjo+X1eQZywp1EYMjOxU7V5EYW2srqtfm/mQUhUgEBG03tew1YSDRrsQ8loqz5y7evgU8cawq5JKPIsSxCfLa04bOd6p3/V5mz+vpc5oNDV5GcHiEIqRlt9KEuaq60lTd6AmV9/LEnykIj4/V/V7SWHnkQH2IRMigbSaL0wuM4ChVp3uXmTx5fHxlw3kb1c1BxBQo4mN1uSWNJQcPGULEIh7TZdKZHSDqFxRIXFHNZAbKxZwSmxMCJXI+i9k5kBikSCIN7aa+XVqe7OBIVTj/Soq6qyE7S2VRvvHiVrODldFKIcEGu9lYa7RaDSEiNtBNllqLnyEMFvMwjdBNH0jAZCvShowKKjlTVNNgNNgAgMGTxyYkx4Zc1ZvWmIKI9FH84LNnS2objbWNAMASKmKTk8JDuzpOmHx5cmTNkTJ7V4uiG3T1NmCEhF4MTA5fEszSGeoM1gSx9E9fvfU5TdVmLwTKQ9q+qsLkBEsCobFBa3SHRQb+qaV7rbVaa7v/5kGovFNqMnnK2Hit+byl7KwuZHBEx9F/QhQ5eFhgWUFJpdluqLGyuAKRLDwqNCRcKW1fnH6b8ZLvPbGpEEXHlo4XGhsvrj9r6djB6M17O66n0l9fY/UzAkOC2nrQhEAm5lbWmGosbnmvbzsmxMlDM4NLCvIrzPV1TgBgcCUxSfFJyq6uzBNCVaKy8rcaV7cnQ+LkoZnCwsIifUO93g4AwJXEp6bGtnY9e10zGYRALuVXakEWIiDAeYW7/dLyZMmDleF81pUUdRdcRl25sV0j0iQIVwp5wbEDU72nC2rM+hozADA4kvDEpMRwKd7VgHotwFBTgaWAEELohsNHByGEEMJAQgghhDCQEEIIYSAhhBBCHbFuwnVqbm7GHYMQQtdUQEAABhLmEEII3URN7s2TTKybp1AwnBBC6Pp3j26eZLrBgdQheDCcEELoRoVQc3Pzjc2kGxZI7WOmN7GEyYQQQn8mhzo0oS2/75BMLf95o2LpxgRSl2nUQ0RhMiGE0FXJoba/do6i9m+5IZl0AwKpcwK1/eDz0l6fDwB8Pq+Xpv1+H9YqhBC6ihgMJosgmEwWALBYTCaTaOsVte8e3ZBMut6B1F0aNTc3U5QnIAAIguTwAjkcHocbyCLwuYwIIXQ1eWnK7XK6XU6Xq8nrpb1eN0myW9KoQxRd/0y6roHUOYRa/vX7/R63M1AYpAiLwuqCEELXsNEnSD5B8oVBLf+pr6loctg4HG5AQOtzEroMp+vUe7v+xdEhjQCamxxWRUQMphFCCF1nivBoRXi03dYI0Nypcb7erl8gdd68lr6RzdqYlDYokC/EmoEQQtdfIF/YL32wzdbY3OzvsqHua4HUebCu5QeKcqtiErFCIITQjaWKSvB4PO3b5y5vge4jPaTOPUGK8gTyRdg3QgihG99PEoh4gQKKorpsrvtgILVPJp+PhoAAeVgk1gOEELoZKMKjAJp9Pu+N+q7n9QikLr/x6vP6CBbe1Y0QQjcRFkH4fL4emu4+0kNqPxzZ3NwcwGBweIG4+xFC6ObB4Qa23PZ9/S8gwQ2coM/n9XI4PNz9CCF08+ByA31e74369GseSN11+mia4nCxh4QQQjdVD4lH09RlG/Bbu4fUYbyuubnZ7/fhk4EQQuimwiJIv9/X1lBftyi6roGEEEIIYSAhhBDCQEIIIYRutkDCWfUQQuiWc1vc9o0QQghhICGEELq9AwlH7RBC6BZyWzxcFSGEELrBgYSdJIQQQl1i3ZA+IMYSQgjdtNqa6ICAgL7cQ0IIIYQwkBBCCGEgIYQQQhhICCGEMJAQQgghDCSEEEK3Dlbf3ryaxvPnDb/28h5zn685Kji9n3IIVguEEMJAuso+O7HcRdvFPDnJ4jY3Nxvs5T28uLm5Oath83/mHSCYbKwZCCF0nfXxITtvMyXjR8gEKpLFtTj1Xb6GZHLV4ZODuQoAaG72+/w+rBYIIYSBdPXxSKHNZaqynKN8ri5fME/9xtTkZ+dmrLzWa+Ixfzd/08PDt/37ZzuA17j3h0eGb3rkmXM6T4/vsuu3ztz08PBdG447r9aKUCV5y4dvenji/hzzbVPR9YWrxm56eGzWfr23T2yPPe+z7OXTNj08/H+v7TBT3Z+Rta9mt+N+R7cW1u2wkWanDqDrC0n3pDwfIeoHAA1OQ4/LaDp7YuUTBXoAiEt7Y8PAyD87qMfixcfd+5AYImUiHB+8sqa4ZtOCA5qU0W+8Hhl0u5YBVVKxY32tFvhpM6KHpnDJq7rwptwj/3i21CSO/uvmMWoJVjiEgXQV1dkrKW/XfaNU+ej+yvEBAQFGh3Z3/r967N1of9C2jviVao+UpEWm/tkYCYyPnxaPFfDKm8sSbZ7BBym3dSHQZqsTAFSq+xYPjLvaJzQESQIAkEyCxOqGMJCuLhdtVwhiB4Tf/Xttts5W3PZ7hTBuZvpSAPB4Xd+c+7fH29RTH8tw4LAD+PKpk337dho1PxjvTQ0PbGkfjx/5xwulJnniss3D+gkA9IWr5uYUgmzB9knjFSxKX/X1WycPnHA4+fykydHKi0v0Gvf+9PdVBhgw+I21KUq2tzG3YNunRefPOawU8OTi2FFpDz0Zo7zY1vhovXbHG6XHjxitpFj9SOaCe0MCAQCcpV9rduysLdO6aGCK4mTqB9SzJ7f86bLLbIlae85bP/73B4do/Ihly+Mv/auz9OuTmz7Vai0gigubOIN54O0Kkyp5xeYhcWxoKinZ+WG+5rTVSjFFKpn60cHz7pSQ9poNc386YhFPfU8t3Z+f9bPBypcNfTRz3mRJyyrpDmu2flJRVupykqQ0RTX1ucHj49lUyal/LMjXy6PnzYYjn2rpyXeteE7mPP77zq3a8+esVopUDIme+pR6VDyUfvj9yq1WAID9B57dL569eco0lStv58mv9hjKDBTw+bFDEh94LrmfhNWy+Zveys/VUoRcNnSGmO6ut1FV/vUnRXnnLFoDRchFsQMS73sqsZ+E1fOeBXv9/ndO7jth0Vt8PJVMPVs9e7IiiA3gsZ/feXLHHoPWQIFYlHRn8n0PJcVJWqK0qxLrfgUAnKVf//7dD4ayEqsVSGm8XD37jnvvFFl3/PiPd400AGgLVo4riP3L2GE5hz87DUnL71k+OQjAc/6db9/c6ZDOuOuNl+TdbLRT88a3//nBJbp73Bv/iAxq7Xf+dMDAHbn2ngV8IAAAmAS2j+g6uy2+hzQt5a+DIqZMS1nc9hsOK/ChjFUA0NzcvDtvTa21sKf3e42ni/IswBsQN3JGdCwJpsOlhb0ZhfeYD6w6lHXC4eSL0gaI6MMFB0q7GyTRvPWs5vhph1Muzxgp41ks+TsPvbmq3NguV4+v/11j4aoiubTFcvztQztzPQCeqh0H3ny7tFBLiQaoMgbwnaWGA6t++s/XZqpXywSg7Oc/PfDxDw4iJe2vL3VII2g8fvKDtyu0Fp8oRR4rsO5brzW1nDgDgL5kw5KjB064pOPTFjypElkMB1Yc2pbrBGg5rbYcWHF0XxVTISdpg/HIW0cPlHgBoPF4zlsvF+RryaSHBs+bLKJPl25ekpNj9gKQBAAYtF9/aiQGqNJTuFBVuuHl/OOnfbGPDJ59N990oujjJUdzzEzpkMSRKSQAgCps3EOJ/cS+0k8P/Ge9tgxkExcPnpgCZfs1/1lVqvMA6Cs2vazJ1VKESp4WD+e3lpZ1faXFrvkwJ2u/kU5JfHzliNlDSf0PJ99aVXSZC3se8/4VP23+wain+GnjwxQO45G3f3xzfU0jeEp3HnhrvbbMAIqRqiSxK39nzpsvnyq191Bi3a5A09n8DW8X5eq56sUj/vJSYpy9dt+KAzuPU6KUuHEjRQQAkOKhs9PGJXOYV3xI8JImqxQA1tNarb2t3wmgUo1M4QGbSWAPCWEP6Vqpd2gVwjhZYCTJ5Lbc2nB/+ss8UggAh8q3l5h+u0yuOPL2GpxApo2SS+W+oSnMwtO1h0/b1XcKen4fpa09ctoHpHj2+1OmxbNAX/J/C47mO7poEwv3lGoBiAHqFWvTI9kXrlcdKdBUqSaJW17DjH3krmUPSEiw5yz99r9HHJq9xtnxcGCnkQZQzL5rxXOKQPBW7fhx5bvGwj2l2jtJa/fLHHdhBct2Hj2y00Kr4v668o64jlvjLNtrMAEQQwYvW52iZHsu9k7AqztelG8BYsAdi15KUbK9/fiuf7xt0Oy3zI5vPa2WTh637KmQQLt+66If92mt50tc0+Lh/B6tCUD1yIinHw4hQSWzf/+f/bXHT7vUka3bmPTSpKfvFJAAVJVVPTs5Th42bnK4jBKbTv94wGAprPJlZiROHFl05Bwlik+896nIIHvNpp8tNPDHLR/9UAYbJovoBT8dOF2aZ4gmzpXmOwBUiS9tGNZPAI3HD658ocLUxc6lrBYfABl5Z+LQUQLyTpV6tosQ84PY0NTTnq04cIICEE1cPeWhDDZVcu7jt0qNeqtJD0f2WGhgxi6etOwBCWnXf7fq5HGHQ2fx8HK7KbEUbncr0OhwOQEIRdjIO+PjBKAeEncvRUoVPBKS7p1h1ByxmuTyiU8OjIPG/X9gxDglcWRK6c5ztcfPOdOHMrVHak0AilFxKgGAhSTIC2ceCGEgXWUntd/0V45jMljDo2f9Uvq/cXELYqVqANDZSo6W7+jufoe21sdQe+S0D/jykQO4JBvSJ8uI04b8vbXGO5NklxvotwIAX6QUswAAxKJIOeR37iRRLl0VBcBUjQxTsAEAAhUyBR/0DodWT0FrIJHKyJZr11xlJBeOUE6Lw2oBnQUAROnjxYEAACxpvEgERpPBarS4TD0ss+VKtcOwbycAgGpyYpKC1bmlNhooAFAMkUvZAMCWxot4YHUCAPispS4aAE6f/Pu4kxcTrMphpUTQspID+IEAIODHKpigBaedojw+k54CAO367x9df/FzTHoX3RJIpDj9wvV5Ui5W8kuPbz2Q9XbbTfg+J+UDuKQzQFkcOgsAOA48u/1Au96k3kxZq1w0AE8hkwoAWn4guwokNr/fSBFxznL85S+PA6kYohp5Z3T6EH5Qj3vWWWU1AYBYnB7PBgAyPuXpDSkAQFUV6iwAwI9L4ZMAIFBMWzN9GgCA5/zObkoMZN2tQFC8qp+44vg5zcpJGkIuSxsVPWp8mEjBuzr9FrZo6AxZ1jlD3s/GxhRSc9wBpHjkneJAAKplsI6N/SOEgXQt6GzF5iadJFB5h/LOOntFZtR9AGBx6jb/9jdfM32ZN3v1h0vLKACq9r/3f/bftl+fLtVUxU2K7Fh+FNX9t5goAOrPb8zV/JYUTyUitFbtVs2RUXd13pbLfjSRkvz4I2FBrQ0XEwQiKdnShWp3ck0yO7xRcXfmQ5P5F17A5ClEhMMAAECSPLJlHTxVOw/8Z72FVsUtWBstoyz739LkWnpYMW7Gi5njI9s+lBTFk84Tnc4PummYIx+e9EZkUdZebVWVy3SidOeJ0p2qxJc2DIu97J4lux0q665v0UWJsdlkNyuQLol5fDM3bWvBkXMOq96Yu9OYu5OZ9OI9L93bTVx6gAIgwUf3qpqxZEMS08WG46crzp/jn9cCMSBRrWIBAEkyCQACe0jo+rtdnmVXbjkNAAK29P70l1kMwuN1fnlmNe1zX/aNduORvRYAUIyMmzg7eeLs5Imz49LkAJTxyGELBUDwSQIAHA6jwwsAziqj/kJzQEi4IgBwWHUWLwBQFmNpl7eWk3xlJBfApz9taWnOm/RGvQOAFMUq2s5SXVUlDgoAgNJVuQCAp+CLxHylGAAcpa1/8ppKrFYAkItl8l4sk69asG7S07NF4DB8/U5px6smbFImZwKA6bTVCgDg0Z+2XvgmFFMUxyUAaDsEpYT3ywiPjeQSAASf2dNJNZsrVZAA4ASuKiO8X4ZcJWECANFFs05VnbbSAIpRiUOHhqfHc1tbWKpjupBivkwMAD6aLU7KCO+XIRORTCCZPJIpknMJAKfeaLIDADhLDPpummnKTEF83II1U1d9Puu9L0cMFQNojecN3h72LC9SJAUAy4U9W1W44Zlvli85VUa27BFXlYECALDX/7g0a/mi/T+W+Hoose5WADwep4Pb75HxyzdM/7/v5q54UkyAT3va0vH7aGwmj88E8Fm1LhoAPK6qEkevDgpJ2LhRfDAYDuzU6oFMmhHWehFRrHrovUnLXoqW4hcSEPaQromi+pxBEVPapuP9qfgTvb20F+9rOleq0QKIVfe+NDKz9TsZXmOK6x8rarU/V2hnhMQp5HHiAr2ldtuqk86RoNlZ29ZekKrokSkF285Zvn7jgCmD7yyp1XbdJvLSHk5OOqIpPHLyg1eNcRKq6ucKPYBi9h1DI1lgb218TXtyPjDIguzG40coANHQ8bJAAXPqo2HHV9WWvXvog1K5zGPV/GCkgT/y0eQ4No/qYZklbatI9ntIPfLwgSMnNFv3y/86OahdovBi7wwT7a+wHjm54Q1DJDjyjrQ1cyzl0MQ0sTFXW7BhFXPqKMj7JD/XwB+3dkpcT3djC/rNUEmPlJp+yPlA4BgpN2atr9DzVX/ZMFraKaJlkVw44dAfL9WkWPV787UtkXyitjRFJeJzCbA6j2g2veMYPzt63J3iI1st+e8c2uaJU5SWfr3HCEMGr1gtUQ6NS+Ib8rVFG1b41JG+quPGrntI5qrNiw4cMfCHLlaPjCfpqtoqB4Bc3E/MIqH7PRufOHV86X/3G3e+ekifQRqPV+RrfaK70xQK+cSH5EfeNuS/deCD0zKiSnvktAtUiZFynpLfTYmR3a0A6Pb89I93jcSAxHkPqYLAdf60iwZm7AARr2Nvj6scICKOGPU7czaLE1UlpftKeugRXhJlsXdHq/bkF55wgVg1fkDrVcSm05q3Xig1yeNe2jwyXYBtJMIe0lVXYfnd7mkd9Tle+XVuzQ+9epuzcG+tCUA0JK6fpN1Yx4C4dHHLF5I8IAmbvTwtQ0U6Txdt+9SofPSONDEA5aMpALZk3PIREwdwodSgOedSzR48dQATuhpRIePT/7phxLghXNORon07KwopUcZD4156RBF4caCMP/TROPJ40YH9FlosG7l89L0ZbACWbPLoFauTM1RU/p6ifT8YrCr5xJXj5o3iXW6Z7U5IJGH3PqUSAZX/oeb4pU8xCBo1+K+LVQq+q/BIbRWIJz4Sxrs47ha/aF3myBSu6Uj+5lVF+sjkxzffs3Aor+fSDBqa+dLKxCQ5Vbjz5MefGkWTM1dsHp3Z+fIVsGNn3zFUDlBa9PHLJ/Mkd/x19eAMFVO/5/d95yjZqLSJQ/gEZc3dU3rezIx7ZNxLT4YpwHjg7ZydxyF98V1vrE5RsgEU0YtWpqWpmKbT2jw9d9xzd6TxL+yXS3oJkfPWjBiX4jv+7qG3nv3pP29XmORhs5er0yXQ054FQeZzoxfcLeaVag/sLM3XMmNnjFj2UkwQsJSTR/z1SZUKLMf3FB057RINSf7rusH9BN2XWLcrwFLOGP3XJ1Wic0Ufv/DTWy8czTrhi52RuXCypFM3lBU5OXPBDJmUtB5ff/IAFT17trhlBO+yyPjokSlMAJCOSozF78CiGy7AUFNxTT+gubm55d8OHPbG5P7X/Lna//xxatu3YodHzb4zYaG2oWBb7j+6fIxQc3OzxeJaN3c/h+BhzQAA8DbpHVbgShVsEry6HT/+410jDBnxr3XxMiybvsFctWHBgSMW8dSPJj2QiiN0CAAACs6c4AuCAjoBgLZBJhyy+yP8/os/H6v8ssycW2cva+7mtrrmZqyKlwxX5p5c+WyRnhSPe+kONd+6f6uRBu7QGXJMoz4RRfr9OysKT1cct4Do7rSJmEboZtDHAykwQFnVeK7txu6Gxvye+gPeZiFXTDDxdtfWwssY/NeVvg1vlR5YdeAAAAAZOztz3ii8qtAXUJbafVuL9ABESuKip1RBWCLoZtDHh+wQQghdkRs4ZIdTmCOEELopYCAhhBDCQEIIIYQwkBBCCGEgIYQQQhhICCGEMJAQQgghDCSEEEIYSAghhBAGEkIIIQwkhBBCCAMJIYQQBhJCCCGEgYQQQggDCSGEEMJAQgghdEtj3SbbedZY+n3J4apGXUVjrc3jwB2PeknI5kcHhUUFKSfHj0qVxf2BJTj0581nf3ZbtG6z1uu2Y5Gi3rbOHAFHouKKVeLUO/mKfrfDJvf9GWMpH73x9O7Pz+71NzdjFUd/fDAhIGBu6pTHM+5nMZi9fIvfS+mOba3TfAXNfixA9CfaaUbowPvChj0cwCSuw6fdwBlj+3gPqcSiffWX97Q2A1Zp9Cf5m5u35mcdr8n7x6gn4sWqy77eWV9W/v0aT0MtFh360+f1/rrfvrRVaqImLuGFxPbl076+vR9/Ls/BNEJXUWmD9ufynN680lJ0CNMIXUUuY4Wl6FAfH4fow9uWX1+yLf97rMfo6tqW/32JRdvzaxy1BXWndmNZoaur7tRuZ30ZBtIt6YfSI82A143QVdYMzV8X/nyZ7lHBfsBrlujqV75m05m9GEi3pMuexiL0x1RZ9T2/oMlYhqWErgWXpRoD6dZsNRp1WH3RDalaHksNlhK6FjwNfblq9eVAaqJdWH3RtdDgtvX8Ah/lxFJC1wLtbMRAQgghhDCQEEIIYSAhhBBCGEgIIYQwkBBCCKHri4VFcAPxAgQRZCyjd88rdFNUVUONX2TFckNXXXMAwylQVXm4QTKl1e4Ipk2hzrIALBeEgXT7SOUNDCdj2FwOiyAYjIAmu8Pv6/6x0FywVZ4xi05huaGryycIsw58nC+LSmYGbNp/VBjMk4iEQc3FnLwdWDgIA+l2wQAmm8Pmi4R+v99uaWxJowAAgsVsbm6mO4UTE/CcFV3tNGKyf4+cT5vAX1cWTDTHKOXCwMCkqPDf8ujMABar2YtFhK5jk4hu7A5gsXxeb0O9yettPfLlwYKF4wbOH6u++VdeHPb4lws/+/WBv4zkX5XlEXHJyw4s/OzAlKlxTKwa10mV/E4aCMrlLPx5T3lp2UMD06KVoQCQmpTgS7jzpl1tIur51CV71Yv+FiS8OsvjZawZsGTvgAfv5+FZOvaQbmdu5yVPlGAEBLCJXu8XpuqhKSuekpBtv/B4jAZL3s7fv95rsFJYuOhyrAGSkiP7ooeMjho0uq747Kavs/yhioykeIfTVUqHDuqp8YgOffDf4SEX657fXecxnqrP2WauacQnyyLsId16PC632+W+GgsyVjXq9B6KzZZFKsa/dPcbq5Nj+Vi+6LLnpOWHFckDAgIY1roaSXQCh83hkKTJapWIBE1EUO9OqepclmqPm2JwQrkRUyJnvx+bkYhdXIQ9pFuP3+e7KsupKt2w6GShA4Dkp80YvPC5SNlQ9UMzjG9tNTqBqRh5xwOPRiepBIFsaDI3ag/n71hfqo9UL9uQHqkv+b9FR/Mt3LTlU/42WQD2mk2LDhzQgmr2XSueUzh//uXDkpQXngqhjx/74GfRpIejk+RM67nSnW9pjms7rbhYNu4p9cQhYqWEDR6PscRw/NOTX59w0ABA8tNmq6dNlsdG8kiPvepI0VcfFuQafABM6cg7Fj6VmB7Jpsxmzc8WHlaJ6yyOXX9KcyR62F3B4dFaza98aWhqUpIgkMdisRITk2lDOGG9zNM8XefWFR3K9wEECDNkY56NiAsVDV8k1b9ap28CVnjQ0AXyxHSuiM8AB2Upt57cVFtQwx6xpt/gWM+5fxTty6V5GZFz3pCKwFvxXtF3P7ghOuTef0dEOCzfveVUrwxXUtaf1zQEzwhNTGezGprObdL+etjd6cIWobhbOWKGUBZBcsDvrnPWHNIf3Gaz0QAQIMwIGTFbEp7E5ZN+a1lj3rba08cpLwArJGjoM8r0gVwORdUfazAGYmXAHhK6yihH/p6TW3+2A7Di7lQp+EzRyMF/XZOujhcQFn3ecTPND+p378i/Lk8UmQylegCxOFJBAl+UniIAABCIk+K5BMlVDhCR4NEet7opAIDAAeqnH5UTZpeTzZZlpMx7KlpBXvq5pHjiyrsWTlYoJb6q4zXnDSBLjZy2etzsAVwApmJ85tNPxfTjW498mHe4hIy8c+DTK5NjSSBUcQuXp6dHsil9fWEJxE2OjmTjLry+2EDFDsy0VJSwAwUxw8Z5mhxf/3xw275DNE2X1+izPXG9X1SzLdd48COLFYDoFxwbzmQFBY1+JXbwsEARSVefstZTLHG6bNIrkenBdE2hB4CQxRBsYIrVgSIAAJYsjcsjAngR/GAS3OW2BlczAABfMGKpIoL0Oh0MTqhAvUiZEN7h3p4A2fToe5+VRkSQ3jJrRZ4HQvlxs2PvWcDnAbDCxeOXhielMxt+qjn5k5MdKx65NHpAYgAQnORnIgcP5HIojy7PBf0kCbHYGmIPCV2DTHLpTzua7hQE8rmiQL5yRrQSgCrJe+sZTaEDREMyl61LUg6JU0uP5Z1zjr+T30/FPeCRxcmhMbfGmRIeN0DEO+2LjeSBR593zuEa6gMAoIw7lxw4oAXF7LveeE4RFC+TkqXt5wTipcSNy2ADODWv/vjBfitNisetnbQwQzJ0hnzfaS04DEe+dtDnirJ+sMA5Ztz7KcpIuVJcSA+NSxIA6Ev+s+hovoUpHT9ixesxQbgHr6cAP+211Ihjkpp9vurTx8PTB8fzOc0cdqPD2S9GVdA80nf6CBN6249vdtbYbQ6xiM8KDGYIwqWJEQBU08lXSo7m+yBIOP5f8f0jRMlDDT9rmhxTxMJ0Lu8HUCSxwWKvaAqM7icQBzq8iRw++Ks1TXan0AcA4NdvKv3uBzeEh9z7fkSEmKcIYRS077QFBiZPFnAAHMfKd/2roYEOkN0dP+tZQchoWcQ3jjLw1fxktNFNebvMRmhiJiWqIzjh4UQeJUxOZwF4zr1etC+XZoUET1gXkyTG+oA9JHTVESSTAAAAmuSqFGwAr/64VusAAHDqjSY7AJuvkvuMpy1NwFZkiBSpcgXboz2iLbWAKFWuUIgj5UBpjaWWC3eeGyxVFh+Az1pltQIASQby218lYPDkIhEAmI3HzzloAKAcuhIXAPAixSLSZyqxWAXioc9N/+jXhR+9n6IEAJLJI0meiiQBKL3R5AAAn7XKYvLg3rvOgRQQIGkqris6CwEBksj4ypMHDRXlXDZJsJi018thc4BzRdciCQazpfNMMQJjSA4AXW0vK/cBADRR+jovAEMYw/Ya7EYHcCL44nBeeATDXd5YVkhDMC88ggiJZQPl0hfSF0LQYyynvQDeBrelAQAC2Hxm+xNpRiBbHAwAlOFwk50GgGZbjdMJAHy2LDjAW+c0NjBlo8Mf3qVesitRHQEADBafweZzOCQARenrvQDgbfAY6/xYG7CHhNpMUSexGIxATutg2L1DUvz+5hqzVVNee0XLIbnSFD4JQJmtVkcPr/Obzhr0nnBVfJhaLA70WPJyDdYU56iR8vQBLgUbrGcNegeIWhoXDwUt9+xd8Z17FASKx60c90Aqq/F43oY9RloRN/u5SFk3w0foBkhkGysg1Wao4YllcaPuJgiWrcnp9lCni8sdLldaANn7OxQCeKGBQhKAoi0NPfWq/PXOmmp/dCw3KpOQ8f1GjaO6IdBxV1C4WuAMZ0CDs6bGB8EtFajZAy1RccWB4QGmbHL0tEf4hMV6cq1JT5MpCyPiQnGPYw8J9WJnBAREhgRLha0XVyOkQfJgQV2PmdIFpmLkHQ/cyQPwlu2v1Te5tHoPAEsaLxaRAAA8hUwhAPA4tFWUy2AsNQCpUg1N4VFaY6nBUXXa0sQWD50sDwJn6Qlrr2eZ8zsNVisASERJLReXSH5kPBcAnFVWE1vUL5IF4Dy/t+j4kdpSMxAXssqppSgAUiGT8gGAKVXJFZhJ1x/HawsWcIPCo0heYEBAgNfra6yv93rc4GriGLRA97oasMKDMheK+QB0YUNlja+pnHIDEKFcWXAAAEAgqYhgAfht5R6P06Mv9ADJjR0dyKdc+kKPvdxudDBkoyXhYnCct1mael33mjyWBgAgxWkkCQAQIIzh8QDA4bHUMcRpHALAkWfOO9xYVUi31T2Pw+2mAEhSEcICAFYoNzwCW0PsIaGLvjt1fqq6X4z84kD295rCGnOvHl4XGbdoQxgNACQpVfBIgKbc33fstdAUaD4tKh2QHjdU/fRKWamDjBwSKQPQ7c0/UkoBWPPO2SdFCmRs0P1cq3f46LO1ek94XCQL7DX5VVcw467zXMHXP0c/fWfQ+OWjeacdIJapM9hgr8n6rNbqkOkMoBbw4u6MHiog1bNlBACwRemjQgryKsrsIf0U8QtXMs8bmMoBYgKrwQ2h5PvM7f7T/PspX1ikzEunyhrY1GWygZuyJDGaAgAGGcrmkwAO+/FNZiPdDMd1eecFg/uJRvw9WlHoY8cI40IBqs2//ez0AFg0TdZ7uaJQBlQ3VNb4vJSzqtof3Y9LgLdC476CGXebmk5vsyQuFYunRE0JtNuAUAwTcMBbsauuqtEnr/EAsPj9ghNHMdmZIXISABjBapHijKO40KtMZ6c8G83M87DCBTISqwH2kNAlfjxdVKo3tfz89fGzvUwjAAC2LDJIGRmkVPBIe2PeZ/tXvpBf1nLR6Nzv/3nh2OGzlHRI/PjJkXFkY96OIx+s11oBACj9cUsjAIC9pT9EGyzntQAAVEltleFK7kinHMff+vGDz6qqSFnm5PjMoXzn2fIdL+ccKPWBw3jksxKdB2SjBi5aHA17jn7wTrnOzkt/KC3ZWb7prXPn9V5ZRlic3HXknfxCOwCbyWPj11iur9iar+OqvwQAaG4Wkf6xD8wZNGbkXZKqOOpcL3pYoVxxBFccweaTXsspwzdLSn4rarlo5Dz+z5Kff3J4QkUpU6Rx/RiWU3U/rqktawQAoGpsRgsAgLXQZmkCoD31+S4AAMpVVe65kicWNdsOa3etMZSWBcjHSFPGiAQOR+GnZfv3Or3gM/xcd67aD6HBI1+ISART9prqwmovf6B8UP/mwve1mjwPHSqISmI3/VxzKs8LwGDxAevejRNgqKm4ph/Q3Nzc8m8HDntjcv8h1/Sjh296+CYv/aGBdyrJyI6dViZjZL+o8zVGQ6O9w5+OnsmrV/2GtfZm8OvCz3r4q2bd5Ftui5oh4ETko0d09gfGjWAxWR6KCmvQkJr/4b6+2aiX7L2myy84c4IvCAroBAACAq7t4zRxyO5Gcnk80GmcwOvz/3K2vPOLvT4f5cUnXaJrdnIKzbHGX0oCR/q8Po+LarYZWLqTWCzoesJAupHO1RTXUu7ez4fk8bux0NC1I3OWPews+716sZstllpKGfWFWCYIA+l24ZXXmfz10NzrXjATvymBrrk7it/FQkAYSLclRjMAPhkZIYTwLjuEEEIYSAghhBAG0m2AKb173PpfF362fXASH3gp6jd+XfjZj3eNU/X4NQuSP3L13M9+XfivxfKrNhPEtVgmupXh9Kyoa1gdbhO02XBkB1lKGassPiwN1HezLvb5xMmZzuxnyovqsTQwkNBNGkiG2n3v1mI5oL4tKDAunU2AE0sCAwldTUzFePUDs8Ni44OC2B7jWe2+9ZoDp100KZu6YdID8VD6zvdv7rTQwM1YPuX5yYLGn/f/Y4XWSnKTZmc+NDssUgJNVbVHjl/81i0vRb1sQ3pk64Swvp5md2050RTIxr2YNnSUPJJPVe3/fdM7RS0PIuLFxd37VLI6RSQTsCi7XX9Om/XOhdljL7fMlu0SDVH/dXVKHJj3rziw7UiHv6KbW0Dw+Ng5L4iYZcbjhZz00QIR3+8osxx/vyavyAfQzfywLX/qYXpWgoyaHjZ0ilAWyiIcHt0p42/b68tqmruf7DVAmBGSOSM4PIkr4oO7zqU/ZTq+2WSJUc35l0wMABA8ZbM68+vzn3/sxOlMbil4DekmHXiIS160PEWdytTuOfXdzy5RavxDq0eM7PnyDzClIwc//VRkpAQazxrK7OKRMxRdz8rc0+yurWTj75iYwbRWOZrYvMjJwxY9IucBEKq4BetGThoqkYHj/HG9nhJEDk15el3mUDmzN8sEYPJSEhctT4ljOzXvHsU0ugX5wA8ARKxsUBJdtM1QWAb8WOnoZ+ThgdDt/LDhPU/PylRMj578iFgZyrDnWSvqApRjwqf/UxUbEtDtZK+BgkFPhKcMZDfl6H5eW3uujBU+JXLyoiCuxXbuYBMNAOCp/qkuT+PF0WnsIaGrEkjgOr+3sMpQu2+nVs+3ilLGj1KIYiPJA4bu30Ny+90ZFgTQeDhn5YpSE8VNe3HS3+4N6vzCnmZ3PWdseQ11TvPWCwVaiox96K5lT4Uoh0arPjU6RyWqJQB2/dZnftpX6iPk0Y9vGJOpUI0bml9Q1dMyW4KHUKgeWpmULvGUfnZo0x4LptGti7IfX1eZW9HMLgThv+TKWFFiTF1TSHfzw3JLNfxup2cN5CbcxecAWH+q2PnvRmcgf9Dz4SmhhCKUVdXQzWSvDczAQADKo//ZkpdPw+HGghiWp8Zla2rO+4GfMiZQ7HDmbavBa0gYSOgqcRosWko1dfbo8U+17SJm4IV5YLsLJJGCCeC1VlmdFABQplJHEwR16iR1M7trBpsXKRYRrYFkrbKaWhZS5XBCCMnnyvicpkguCUCVaPO0PgCgLVat3pspYUvjhCJPT8tsWW3ZqCQZANiNR/YarbiPb2UNbkt9MwB46ppsDlCKmYEhhLCr+WH7R7CEMWx+WRfTs7YEEvPCfK9GjZMCgCbHb28Utj5AmHAaG4Jjp4Q/PDuqrfKy+Axfg6u0kIobFqj+V7qaourzrEWHGivrcK/gkB26NsikR0Y8/kBkJKXd+ur+f7+Rl2fvdpgOyKv4tHzq0l7a1V6mx6nTe0EQPvVRlRQnn0Etdb31/70dH1jSMtmrWEk0nVxb9s2a6tK2yKHdBf8q+eojY2lek6WBETJQNvKF+AdfCelmgBphIKE/d4zyI1NEJIDueOmR/dr8EhdxsfmmnHYfAEuk4vIAgM+Pi7zw3R7KZTX7AFiiSBGPBABSMUDU1SHa4+yuF8bRRK0zzJLSFD4PABwuo8NtKnFRAGSkLFLMBABCLIpTsAA8+nM2ay+Wqdtz9K2lmvN2kN2pvncIH+fiu3UFc8QhAQDADg0U8gHAZ62nbd3PD+to7HZ6Vl9Dy3yvLHEMwQSAQF7GPxIXvJcweihH2s1krwABvFBGk0a/d2nh5oV56/9RV08BESEIDg5od6IWgHvpFoRDdjcjymXUuiBVoMyIHnk3Xzo5WQEAwFONCos9V1N1zkFlsGX3Zi50FBkj44aqLr7r/F5D49DIoFHqp1fKdRQ/rvWGgo5dqJ5md4XWexDIyMSFK0U6BzdufAgJ3qrDFVqHz/nz70dmTBgfGTNvJTOthApMVaklQJ0t+u6I1UZdfpkAPmdp6Y490cseDhn1VJrm3Mlc/FLULXrKxB3wTLSsxsdLEitJoMusZeXehvJu54d1NkG307M2NeXtsaY8KwqZETU5uMkTKohNZxOWhpM1Hns3k71GW4ghL4SGUI5z2+pL6yBQHSgkgS6zNzQ0+wjaTQHwRYOfUQX+XJd32I132d1SmC8u+euNaXMpt0wefk0/4tPfv75Vd4vXpPeFD41QhkvSR4UQp3//ZEtdUEpITH9ZYEn5z9n1zhCRKkwck6EU6Yt/OM1O78fx1WgP7beYao01TFF0jCRSQdIVpVnZ3oThwRyX6fiemoYg5chpoUGU7ffvKiosnppTNXrghSbJU/vLIsJZ9rOV3/zr5M8FHj+TGzkxQR3Oqtr7e3FI3PhREoHPXvrdqU8+1ZooAJf93K9Gt0QQmRKW3F+ilFBVh8//b93v+cZm8FHdL5OMHJuojmTZz5UeOmGtL7cLBkXHxYREcut+O2a/VRuMRwfc18Nf9Tnb+mR7EcCOCU4fxmVVW37LI5OmBIeKmq3nTYff0ZfVNwNN60467EJOaJIgIjVQLGu2nDIeel9XbGgGP20spFiRPFksT0T69Hv15aQwSsl0lZjO/047qhxGFymJEYSn8qShLLrMdPDt6rMVPqfJx79DFKLkRQ4T8qvrft5kC4gPVPbj8wr0v/ziE6QEJYwWJ40OjkkgvWWWIx/qy/TN/ibaFchTxHKCIzhcY2NRLtUXb51RZs67pss31tWSbM4NmaAPZ4xF6I/oezPG9qq9EI6PfuiFYE513c4lNTVNWA1uiD48YyxeQ0IIIXRTwEBCCCF0U8CbGhBCvdVs21/+3/1YDgh7SAghhDCQEEIIIQwkhBBCGEgIIYQQBhJCCCEMpL4hmCPEHYxuSNUieEFYSuha6NtVqy8HUrwkEqsvuiFVixsSg6WEroW+XbX6ciAliDGQ0I2pWlwZBhK6NoEkw0C6NU1NGM1iMLEGo6vcIrDY0xLG9PwaacrEACZ+6xxd7faa4EhTJ2Eg3ZIihPLHBszESoyurscz7g8Xhvb8Go447Fo/khndhpTDHuYEKzGQblVz06bE48Adunrixar7kyf05pWhA+/n4ZUkdPXwZNEhA+7p413Avr15zADGhqkrHkqbygjACSTRnztUAgLmpU3ZMPU1ZkCvjpoABjPxwXWhg+6HAPxyBfpzAhihA+9PnPPvgL5+DaIvz4fU3llj6d6Sw5WNuorGWpvHgTUc9ZKQzY8OCosMUk6JH5Uqi/sDS3Doz1vO/uyyaN1mrddtxyJFvcTiCDgSFUeskqTeyVf0u26fewPnQ7pdrrumyuL+WGuC0J/EV/S7nq0JQrfwOAQWAUIIIQwkhBBCCAMJIYQQBhJCCCGEgYQQQggDCSGEEMJAQgghhIGEEEIIYSAhhBC6FdwuT2rwNzfbPbTWYtWazH4AEZeTGiYP5nLwEXcIIYSBdP3QPl+lxX5Gb2T6/U63q9zWJArkOZtheKRSwCaxEiCEEAbSdVJnbcr6raDBZneZ65jMZkF0jCCQa3K6i+tMapUSKwFCCGEgXQ8+v19bZzLodADNjbrqsLj4CCE/gMlkk2STz+9rbmZ2P2xn+33j21tyiYFPvTAvjdfS2ar+/p31+UOWvDBSQlz5ulg1H/5zr/CxF+Yl8Xr5DmfhF//a6Lz3lUfuEF3+tec+XLOdePBvjyWLrnzVaNPxD1/dWuC68N9ccULGXTNmjYzpzbLoip2vbjJPee6pEZI/ta+cNb/nu6Iz4kXEtagJdPmutz8pG/EH911v9yxhLsyr5vW7Q0VUf//O+nz1sy+MlXfzcdbcT1e9l2u7eDAKwpPUE+dOH6QgAIDWn8nac/BcWU2N2cWVhEXEJo+cctcgFQ+ANuf/kpWtKS6rM7tAKI+OTsuYOKXTnqINv+/a/fXR83W0IDxjwuy5IxIuLVbaWpD14ReHiywurjh57MPzZ8WLOrz/l03vbc8zS8f87ZX7Y3h/pFTMRz9Ylx366NI/+HaEgdQnMSinsfRcaFI6ixtYr63gS4KDSDaHZLt8fqvLI+ZxumujC07pw0eNpYuPlljT+ov+/IqI1E+9rb55y4kQj3xq6bw0HtC26nzNvl3ffrJd+LenrsaG9zKP9Mf3ZROz0q5RIBExs15edY1WvW3P0ubi7OzfM6LuUPVqGwhh+qOvLxokAgDaaa0r/v6L7e/u5i19MIVnPrX9i8POofMXP5Sg4NKmylO7Ptvyrov3yoMpUPD1lp8MSQ8++nq8nAc27ZmsjbvXm3h/X6xudzpgO7d90y69eu4rC6N5dWe2b9qyRbjkKXW7JDaf2vLF77yxT72llpg0Ozd+sSv2uccyhO3Pxirya1hjn1s3Nx7TBGEgXbU0CghQhSmDQ0Jpp4MvkdnMdedLyuQBzLgIZRPtreaQYp686zwy5GrMihH3jvWa3z1RYErOlF56gqnXfL3raIXJSRM8iSpj4qyRMTywFv6ya9fRCisNQAhjR9w7d2yCqIvz6Hvh23UbzdFJUKO12Ky0MG3y3LlDI3gAzpqc7V98faLSSYQmjLhn9qz+F1oIZ/n2d9brx/79haESAFqbvW7t+cylfxmlIKyF2Vu2/FIDQqEoVE7ToGhd99+278jKN3sBuLFj584dGyPqeoW7ayYjMsbeSxf8a9f5Gmd/EWH4bdfufbl1LgDghfafMvPeIXICnNW/fLFlT4mLJ5Qowlk0TbSm+JmvN+4+XGQhJPEDZ8y8d0Q4jzb8vufbfbk1NhpAFDVy1v2TkoTgrMnZtTdHa3bSBE8aNXLG5DuIvO0bj1YYiE/W2mY89eCgltJ2lmz756d1E557tqWbYdJ8uOYb3twX56c5O21gS+c1PIE+8zs99NlXxnp/+ebHEzU2GgheaMKE6VMzhNUXekhCa8H+7XtztDYvAEuaPGnuPZkqnrPwi653SltXdQt979KH7xDR5qMb3thiyVy6dHYsQet/eW9twcC/DDz332zhY38ZlL9p5+laumzDu9b77wYAuu7wxtWncmudvLA7pjw4d0J09407wROFp4xIFx7VFFvpFJ7LYPVK0tQpKgkBAIrk8U+9fIeVJRQBbbLZaGH0iH4xUh4A8JJGzn8l2UYIL+2csoQZE2aJ+qUoeADRyRnhWXtKzPTFQKJNBb/pJaMWj0iQEiAdMXWsZuPREnNa2wtsxbu2fp1vsRGfvWe9a/5jI7ll2du3H61xAhCS/jMeuneIhACgTQVZW3af0tMAROiQmfNmJEuI1gpwykQIRWK51EZDKLayqPfNdZ/fwoCAAD6XExYia/Y3Q0AAi0kE8fkckoRmYJKExeX2Nzd3PXx06oQrekS8RBo/UGXOOVFHXzqad27PN8XSyc++/vI/Xnl8orQyJ9dAOwuytmSbkx5a/vbrq155MFq/d8uuAmvXjQ+LtlaaY6c/+/orry29i5u/90CZE8B2btemLFP83NffXLV0DC/3i51HDfRlRooK9mz5xTv26VWrX14yK9ysb5n9zVm8/eNd2qh5r7++avWiTGf2J7vOWLtc4V4McwHQhqM7duVyx7/wyqq3X3l2AnFqy47DetpZ9tOWPZaUxa+sWv3irDRbjdlLA4CzIuvD3RWK6X//z5t/nyUu3vXFvjKn+cTu7b+4Bj61dNXbL86NrTuw/Zdymjaf+CZLGzVr6cv/eP3FR8cSZ46W2KRD750SL4kY8ugLDw9qy35eWGaa0HCixEwDAG0u1NQQyQOTWF1tIACAU1vBGvv0qtenR+iPf51tG/TUi/94/eUlj/V3njhaYW03ErvriwO0+rHXX1+1+rl7pQU7N/5U7uxup1xYEUW/CKgpNjkBXNWFNqEUDGVmGmhbWYFVmhwtbDmz4ybMmJkpF6fMWrR4ShQHwFpeYFBNX/LOv1fOD634/qdzpp6K2qo9s3/PCTMvNFpEACEeOCLK9stnW77XnCusMFhpIIQSKY8AIETxmUn0qY1bvz56prisxkoDIZJIeB06ZLyINPUdqpb4s9Xk14Eivv1AJW2qNdNieWtXlBAqhF5ThflihRAmzHjo3iRx+NiFzz41UmI6suXDo8SE5157+/W/zQ09t33Tfi0NdMX+Dz/7XTrzb6tff23pZN6Jz7adMNNg/n377jO86X9f/co/Fo8V6uucNDayCHtIlzb/TIZKIiqvNQhkCk+TjeRxuAxgMgPYJLuZwfR4fVyiUzlYy06cg/i5Kh4AJIyI3rdLUz02vH2XguAR5vwjh3MFo9LkMVMejgFwlh2tcMpHjQjnAYAoatSI0FNHS8x0ctcDULzwO5JCeQAgDY8QQbXVRTvrThXS0bPG3qEQAox87O2RAOAs7HmMK6/cGT4pI5QAIFTqUbG/ZAGAszKnkI6eMTaBBwDhmVP6H96oqbBGd17hHlvHgv3ZlUTSQ+E8W0G+gZs2ub+CAAB5xoiUPV8Ua20JphKbNH2gigcAERkjEr6vcQI49XnnTKGjnkqPEBEw5OGVLTMCxz79fyNaFxueFkrkmm1OEPEI0GsOHA2fOCRZnjb9sTQAAHNXxSQfkiw8kVtsGiqX2opP1HDTHo6Gyl1dbGCyBICQJmdmhPMAaIIg6Jqc7zWhU9QxUvW8p9QAdHnrrq0pKIOEueoIHgBIEsamS96trLHS8i53Clxo6UXhKQpvTpmNVtiLTZLMsdwzZbU2mlddaOHFxsuJui6LkSdPnzo2Wc4DWhEtAY3ZSQNc2s+25X3y12c+uXA0hg4YO/+FyXeIAIAXMWHR36V7d36fvf37WrMLhDEZ42ZMH58mIQh55mMvSrK/zMr+NkdfZ/NywweMmDpr8h2KLuuZrfj7Tdu1UTMWp18SSFablxBe/AXBBaeN7jo8aHNhbo1I/eQQCQEgShozXvHfnBN1o4bknTLJRz0WLyIApOkTx/6y/miBOUl4RgvRc+MlBIAoPnNI+Kmj2MgiDKRLA4kg4qMj9x37jS8NFYaGBTDA6fJUGYyBHHaASODyejsHkrn4F01Nuev/nv7pwm/ER8rGxqRx204hU+Y+99TR7P3f/3ffRogYctfUGUNDrTYXCIStLRhBiLjgdHk7NkFt68TlEsTFjggN4LQ5nYSQdwW7hHY6vXBhOQTBbflop81qtRSsX/bk+rYXRhms3EmdVrjDVW6gLUfW/e1Iy89ccULGPY/O6i+ia6xWIBRc4kLLxSVos9Nlt7qA4PIuhDOXABqAdtpcBFdIEB36mjm7dmedKDG33DHBzQAgJEMWLuEd/TH7m3W7NnFjh0yaMWFgrLDrNl2lTpFqThWaB6aV/KbnpsyI4jk1XW0gLQEgeK3FTyjGPrlUfPj7g1v+udslis+ccc/EjNYxLZq2WWlCcqGcCZ6EgJYeWFc75SJhdJr4x/xKQ2xdDUTNSBJWnCioNgmL9dzoEWICug4kQtSp69LdNSTrmY3/3GqOVadczBVCkjH9qYzpAEBbSw5v/yLrw63EK38ZryCAECZMeWTJlJYzpyN7tny78UNYsnR6xzFY2pCz8eMsa/qsxZPvuHTAmeBxWTR9MYGcLiDEBNFNLdPbbNU//d+iny6WhchmsdpstpJdy57f1fZbeZTNRTjblS1PxAUCG1mEgXQJJoMRJg8NDVc1E6QgNIzL4/ma6YqyCi5JBEWrmv2RnQ5BfUGONnzWm38Z39o6OMt3/XfLLyXmtPT2bUnC2PsTxt5PW0v2f/jpxo3E4qlCLtTZ6JYIommrC0Ribu8PSJ6Qx6NdTu+F3k+FAUIvXN4igACiZQiNAJq20a3NCo8FZhfd+luXkwYRAE8oEYVmPvXc/LQOTTzRYYX/vnjoJfebtd3UcAmuSAS009UarLTLRRNCEVfg5ALtcgJIAFr+TAMQPCGXrmkrAbO2hhYJzXs2ZZnGPPn2cxE8sOZ/9n9bWtddkjZ2XtrYebT5910btnxo477ySETXbXbowAzhqRPni+mCOpH6XhUBdJcbSFfnX1qciv6THus/CZyGE7s/3Pgx/cLiga2nAkIRcbGcaaeZBqGEB2C9zGmNJDZe9EvBuVw7rbhLohAm8I6eKyyoo8MnKq7GVX9R8tQpUev2fJOTsWiUggBnze/5Zkla/5aLWIQofvzceyr+ubtC73JCyTktNyEjuuV0QhQ7ctbc2vIPa2qcdEz79KMNORu35ohmLnksufNdhYQ0nEdrqq10iogAcJrLzLSon7DrukrwFEJJzIhnl15yuyCtLRFK0u9duihT2n5g4czhdmXrtLoAh+zQFbgtHh0UEBAQyOMO7J/GFQaxCNLlsJsqK1jWBqnPExvE55Mdj0PakHuiTpqecvGkkifPiOdpj5/TXzi86Jr9a1dvPGGmAQhRWISCx+VxBRHqFGlNzi81TgCwlhw+ahYmxV/BHca88IFJRMUvZww00CbNrrUb9uTb2g5nkUIIpkqDEwCchtzWM3qeIj4CanJy62gAp1aTU2a/MBjIKs7WlDsBgDbnfrNl1xmzs4sVZvVq3YQJQ6K9+UfOmWgA2nDil2II76+SSGLDuXrNKa2zpbiKzV4A4CnSU6R1p07UOAGs+d98uOaLHIPdrHdyVdFyHoCz5kx2gdXppcFZvOudf20psAIAIYlIChXyeDyiJcW83k4NojxDLTEdzfqlTjIkXU50s4GXNnzW3M/+teabcicA8CSqKAmvXb9NFD4wjaj45Uw1DUCbz/2SZ1MkJ/Tixj5CGh9NVOacsAmTwkWEOEJBF2fnWRX9wjvchkjQNP0H2mFCPmL6OGnlvj15ZhqAtp3ZtXXjdk21s3Vor/zE0Qo6NEHBBWfJvi2btrfcOgMAzpozv5S4pPHhl2yC7dyuTT/C2PmzLk0jZ83vJ85UO4FQpI9Lcp36pcQKQJtKjuR7Uyb07+b2dEKSlBFqPb4/39xymXD/li8Oa52EIn2gqObwLyXWlo/7/rOdJww0LzRB6qo4WmKmAawlOSdqnNjGIuwhdcImWIMTowOIWk15LYPJiIqK4LDJhBBxerSK3XG8zlmZc9QsGduv/ZHMU6Un8I7n5Na3nsUT4Zmzxpr3fPHhLy6b1ebiJc94KlnEI6Y+9eDXG7euetHpNNuJxHse6+muqi6a/pRZC6du/2LdX3bYvCAZ8MCTI+SEFtr6E8nZGz58uUCuikrIiI/g1dIAIOo3bor8vc/XPP+9QKLof0daqJWmAYQpcxfO2L5jy6u/AAEuWjhw7gghT9LFCveuoZQMefBR65e71vxzD20zOyWZjz1+hxQI0ZhJSWe2vLHssFAoT1OnRNRYAWhe9NSnZn69cdPfvrR4gZswedG4xDCY0v/wh++8livm8iQJIyak6L/ZtfHoY/MmD9z3y5a1P7msZptT0n/+/dE8AEWyxLp73Ys1M174y6RYXrsk6DdQ+s32sui5aS37pKsNJKB92ydKmzxVv3ffhx+4rBazFUInPDRKRRhOXFLOG1/+yWW12ETpcxcPkV/69m7OGEITFLBPKxyv4gIQoUkS108l4VPCeZeWVoKKOPC/Fa8VPjwn7EojKXzUrCGn3v0mqzB+flryrBce3Lfn6JZXv6gxu1hccUSaesYLdw1SEACTn3qK+/X3X/zfrlqzC7iSqISMu56cq45pHyfWmlMnautsm5af3HThSI+f+/pfMmlN1paSgUuTI1SSQY89Tuz5dt1fNrmk/cbN/cv4NGG366UYOf8x7/bt77y2iwCnkxU7Yb6UB0T0+KcedG354v9eBBY4Xbzke5+SEATRf8aQw2s3LX/uS4koun9avKgQvNjMol53Hgw1Fdf0A5qbm1v+7cBhb0zuP+R6bmpzc3N5fcOmQ6ecft+g5LgAPwyMUsQF8bESIIRQm4IzJ/iCoIBOWkabcMjuqg3chQgDx6XGJsplDQ0O8FBiNl5xRQihmwXrttpaPofMjFOpJMGFenOIgNf56hFCCCEMpOvUSeKSRFyoOC5UjPseIYRuKjhBH0IIIQwkhBBCCAMJIYQQBhJCCCGEgYQQQggDCSGEEMJAQgghhIGEEEIIYSAhhBDCQEIXedyuwrOnPG4XFgVCCGEg3TAU5dFWFAaLZdqKQoryYIEghBAG0o1Jo6qyAolMLgoSS2TyqrICzCSEEMJAut48bmdLGvF4fADg8fgtmeRx41SaCCGEgXRd06iwLY1aXMikQswkhBDCQLp+aSQNVbRPo7ZMkoYqqsrOYyYhhBAG0nVIo/NdplFbJollcswkhBDCQLrmaSS+dKSuMz5fiJmEEEIYSNc8jfh84WVfjJmEEEIYSNeEq8nR+zTCTEIIofZYt9XWWhvNbleT29nkdjt9Xu9VXz7BIq8ojdoyCQC05UU0TWGNRAgxWSwOh8fhBXI4gaJgCQZSX+Pz+aorigiSzWQwBMIgiUzOYrGuwad4mcw/slh+oJDHDWQwmXgoIoS8Xi/lcVMet8Pe2Gipj4hOYDBui8bhtgikJrtVW1ksV0RweYHX9rymJY2aAQKu5G3NAAGAaYQQam2XWSwWi88L5AOAs8lRdFajikkKvMKhl1tR37+GZLc1GOtqo2OTrnUaXRQA0HxlaYQQQl3iBfKj4/oZ9dUOWyMG0q3N5/PVVJXKlRHX+4N7mUmYRgihXpCHqaori/1+PwbSLay6okiuiLgxn33ZTMI0Qgj1WqgiorqiCAPpVmVtMJMk+/qN1F1RJmEaIYSuBC+QzyJIW6MFA+mW5HY3MRg3egO7yyRMI4TQlbbXDIbb1YSBdGsGkrOJZHNu/Hpg9iCErgY2m+PCQLple0jOmyKQEELoaiDZHOwh3ap8Xu+1+PYrQgjdECwW61o8YgYDCSGEEMJAQgghhIGEEEIIYSAhhBDCQEIIIYQwkBBCCGEgIYQQQhhICCGEMJAQQgghDCSEEEIYSOjqsGvWzhz7xG6d54rf6anc/cSkmWs19r5aMvm7l80bO3Ds4u90V7voAMCjO7j2iWnDh3dbgN0Vr+67Zyfd/+Y1KPU/tTnXoPiL3p83ceHnlX9mdTxFmxdOmru5yHPzVapdWatnTnrxOx2A6eCySfcsO2jCtui6wke99VRL1y5c+EVVx19HPrhp2wtp7O7eVHnwoC5hwjAl+w8d7dk5jowJauktUDqeys8XL/xcserT14ZJLzbnuxfP3aJ8c9uKYWTR9icfWXeWuvgGviI1874Fz8wZo2SDp2j7k09+nvD29pfVgiv7WFP+V1s0/EXbvp2TeMk7PSbNIQ0/c2Ki4E9tlP7Q5iyzetWul8f8oR3Y9wmi7nv17bskiutWOp6WihQ1/9P1z6YJ2uX06rlPfmUfvWr72xOUuu+enfd6jqNdVcsYM2f+4zNbjkJ75cEt72/Iyik2k4qMCQueeXxmmrTbSgW69EhKIgGw477GQLr5kIq7Xlg6M6r94cdXJHR/NNord2/4gnpmzB8KJJPm8w2fS1ZlqqWCPlJ49717IXLsOs3Bz9//YNlL5vfWv6Am//AyKbuZIpWRyo4lZM75fENWZsKYPxdIYNfZQZIQJcE06g5bmZh2Az62Mie7eEFa2+mLKT8rxwxwsR6xJaNf3rp2ghTAYyrSHPrig/eWL6fWr1+QaD+27sXXNFGLXt02RmnO2bB67Utm8tNV0y45PttXqgubh4F0Q+CQ3WXaVIEyVX2pRCUbwK5ZPfOeFzd/vnrBpOEDB42d+eLmYyaPXbN67iNfFBd/tXjcpGUHTQD2yuzVT9wzduCgQWPueeLN74rsrWM+98xduXbZvLFjFrYbtjAdXDbrpayqs1seGjdtrcYBAGyqMntN++W3Rl7nZXZmztmw+P4xgwYNnDTvtQuv8VRmr108b9rwQQOH37Ng5e58+4Vu2e7Vz86bNGzQ8In3P/Ha5mMtg0Mek2b7i/MmDh80cPikuRc//Y+fWSvV0xYtuUuhyz1W2btj3VN5cO3imWMHDRw0fOK8xe8d1Hk8lbufmLU8x6zPem7s8PZDdrrvnpi18lCVZs2s4Qs3l9DdFR3Y83e/tvCeYYMGDRx7/7PvH+wwDGbXrL7/kS+qHLnrZo2YtlZj77wCHU8gjm1efM+wQYOGTVr42lfFVLvOWhdFZ8peds/9L6xduWDS2JmrLw7tmbJfnHb/6mP21qGsucOHXxjLsh9bff+0F7P1V1QTOtWu3uzHLovFfmz1zEmL39u8bO6k4QMHjZ22eLPGdMmQnUd38L0XF04bO2jg2HsWvLi2rSaa8j9fNm/SsEGDBo5tV81ax0IHDRx+zxPrfqq8WFi6g+9fKOSFy3bndzlEJojMSLDnZOdfLLWz2RqISujyvIEtTRw2c8nTYwSVB3MrPR4KUme+/NaKucOilFHqqYvmpEFlfiXVvpq1r1QXh+wu7X13VYZdHzgIA+nGoPSHdmsUC9b/+OuB9TPNX6z9WAPqlz96dbQk8r53D/z45hipKXv1s6vPRj7+7rc/7Fo7X6lZt/y9YyYAkmTbKzXFkvnrv3yrXd9LOmbFpiWpkoT5Ww9894KaDwDms9mHyJnv7Ppx65K0yi2rP9bYAbpZZse2vConxzz65e0/7Hp3Knlw3ZrdRR7wFH2+ct1B/oNv7vrh23fnKzXvL1t3zATgqcxa9/FZyfx3vj3w46YVE6isNWsP6cCe//lLL26h7nr502++/XRJpv2Lla9nVf75442iKAAge9M/sud/vPy1n2Daql0//vDpklTz7pUrd+sVMz/atSpTopj6zi+/vjtN2fZi5bS318+JlKiX7vp104J4ouui81TuXvbSx/rUZzZ98822VVPJ7JXLPs9vn40C9ctffvpgJD9jya6j372QUNl5BS4pAtPBdWs26FJf3vrNt+/MEWiyNGaqZcW7KToSKP3ZszDzrW0fPZPa1o8TJGRGOYo1Og+Ax1yca5dI7GeLzQDg0RWfpZSZCeIrqwmX1i7q8vux22JhA2XOycpNeOHTb37c+vIY+xevfdD+iopJ8/H7WdTo17Yd+GXXuwuiije8viXfDqD7bvVLGypTn/7omx++fXuOJGfdsvePmcCjy17zWpYjc9XWH3etmkodzC62t0b6usWvHeTPfHvXj9+sfyZB/97ydftMXZ0WJoxOoDTZF+LKdDY7X6CeEMm/fE1iK4fNnHNhINdUnHNIx08bltCuG82Oal+pJom7qIldlmHXBw7CQLqmHMVb5o0YNHBQ2/+GL/i8tVdDkgkT5s8cEyVgC5SJqXxHpd58yaGu02TnQubji6alKaVR6pmPL1JTOVlnTWwAD5BRU+dMSJRKBeweGm9SMfrxx6clKqWJY6ZlSqhKvdnTzTI7H8EJUxdNVSulUcMefHyMoPJgrt7DTpzz1qcfvTwtTSlVqqfOn6C0FxebPUDZdSaPRyCRSAUCZdrMN7/8du0Epb3yUHZl1Jyn54xJVCoTJyx6ZqqkOOvgn0wke/7uDdlmZWavrs7Yi7/L1kU9+PScYVFSaeLExx8fxi7OztF7epl7XRSdR5+TXcy/a9GiCYlKZeKwOc/OT9BnXWgY/8AKmIoPnrWnzVw0IVEpTZww//ExCrKl29JD0ZGS0Q9OSFO23+1sRapaYS4uNnvAXpxrj5owOsp8ttIEHv1ZjV2SmapgX1FNuLR2UZffjz0WCxk5Yf5MtVIqTRw9574ESnOoXXFRZrMDQCCRCATSqDHPfPTdtmfSBB5dTpYGMhc93lLN7lv0YII956diuzn/p2K2ev6CMYlSZdq0x+dn8lvLMDvHkTb/mZnqKKkybdozj08gc7NydF3FStq0TNC0VnWdJqtYkHlXVLdHj0mzZctBe9SYjAvne5789+YNGjjo7oWfk3NWLRlzJddou9uhXR442GD+WXgN6XKXQTpcQyL5kVFsAApIIPlKSespGslmA0VdeuZp1+vN+uKXJv3UbmmpeocnAdhsgURyuWsdJEkqoi5cKmldfrfLBOklxyZbooxsHc4QSKIkkK8zU6CwF2e///FXx87qW6/+RmZSAIKEmQvG5K5dPEujnjDhrkx1mjotSuDRV5odZ99/aMT7F5cpSTDbAa7o2gql/+rJsV+1L8zRz6yanyYAuGyw2HV6SqBsu5YjUCQoIL/STIGiNzuti6IDylypN1flPjHui4sv5At0duj6topuV0BysUGmBBIFv7WYlQlKMh8Aui06CQCwFcpOjShbmZYq+C630j6Grakk1VPH2PM3aPT2BLNGJ0hdoGRD8RXVhEtqVy/2Y7fFkgBAkpKolpgFNimQkJS5dTsAAJSZ8x/MXrlu7qzsMaMnjB6Tqk5NlLIpc6UZFJkKwYV6GKUQ2HV6s8Vu9/BTL/xaEBWlJPUAHodebzZrXp8+/PWLHx5ZZbZDp0uEwE+dkClYmaXRZY4BTXalZMLjUYKs9oeb+dDyuwcuv3hGdt+qt+YkXthMdsLMV99JyM3Jzspa9+Ry2PTW3Kje1uTuylCg7uLAwQYTA+l6XENK/IPXuPmRD769+YUOLZ4uHwDIXi2RTfZymT1uQkvDU5m1cvkW+4Ql760ak6AkKzc/+cRPrUMW01Zsm7akUpOTsy9r3YY15NS31i8CEviZK7a9Na2n3gxJQscUttsd7baNlGQ+/vL8NAF47MVfrd2gH7Ni6dy0Xq24h6KoP9cf66roSH7q0x+tX9CbvdnLFehq9LGbojO13xuXXiBRJ8CW3KpifjEkLIqM9ERRnxdXFldWQcLUSMGV1oQOtatX+7HLYrHrgQIAqtu3SdUL3vt2jqlIk/NT1pYX16xOWPLRu1OpTq+nLnfGN2HVp29evs/CFiRMyJQsz9JURlE/VSonPBslMHdIrPkvL8qUsAFIviIqqkPys5WJw5SJwyZOHbN24YtZBytnLuj9Md1dGUo7HzjLhkmxzcQhu5sSW6BQsM3FlW3jeB6T7s/eGdDbZXrMugvjh5Sj0s6WKiWeSo2OnTZn/rQ0pYDtMRfnVjo8rT05nckOgij1hDnL3l2/ItOR81MxrVBKKF2+nmrr7elMHce22JKoKIm98qze3u5k8myODqLazoSBVKSp1Wq1etiYOUtfGGP/bvXHx3r3vQ42X6EQ2HVtG2rXF+tBmSD543fnASmJkoC++OIdFXaTzu754ytASiQkZTa3xpZdV6yjqJZO0GWLrmPLnpARZc8/eDDXrkiLlAqiUiXmnOyDZz1RmVHSP1cTerEyPRYLpc/Xtd6T4DDrKPKSfr3dpDN52NLEYdOeefOjd+crqw5q9M2SKAHoiy/UCY+5Uu8RKBUSsUTAdpjbCrOyUke1FXLlpRvRbWEJEiaMVlRmfbU7Wxd1V2bH+87ZbElCxjC1Wq1WpyW2SyPdwdfm3b8s+9JhQAdF9f6Y664Muzpw8NY8DKSbrEfFBnCYzWaT3a5Mm5DBPrvlva80OrvHXvTdyicXr7vMZU+S7bGb9XZTtw1lL5dJUblb3svS6EyVx7ZsyDYrRmcoBAIBadcV600A9qKsj7PtApIy2ymPLnv5woeWb2+5RUtXnFPpkURKxFGjJ0SZs9e9v6/I5PGYNB8vfuKl3fkdjjZB6sw5abrPV772+bFKk91Uqdm9Zvl7Z5UTHszsaihdOubpJWOo7LUf9+6rhtKECWpB8Rcf79boTLr87z74+KAnbYK6+2+/kECyPfZKs93eXdmxFZkT0jyHNnywO9/k8djzty9/5MUNGtMfXgFpwphU0Gz5OLtIZyrK3rJFY6ZIABD0pug6kKSpJfrsnyoF6gQBsCUJqWTxoUNm5bAESffv6VVN6MXK9FgslP7gx1sOFpl0+dkbtpwl1aMv3g1g12x4ct4T61puybPrzuabSYmSL1RkTkj05Gz4OLvIZKo89vn7XxRLRk9NE0jUdyV4cj7ecLDSpMv/7uOvzjouFHKmpHLLug0HK+0ej+7gusVPvp7d7aVKdtSYCcrirKyqqAnqXn+rQhKVJjEf3PD+bk2lSVd0cMuG7/RK9egrGFzrpgy7PnBIbAFxyO6achRvmTdiy6W/S3hm66czu2vHUqdmki+tnHX24Kufvjnt5Y/g/dXvv3jPOoofmTpmzooXJigBdN2fi6mnpn288qXpmqnvvDe1m3ZoQpfL7DQKNPU+ZfaL96xxgCR16pIV0xLZAs+cBZk5K5+8+3OAyKmr3lyRuXv56hcX8t/7aOkK88dbls96v8pMAShGL3lzZiJbAHPeeZtcs27dI3cvB0Vq5oQXVs3pNNjGjpq5arNg94bd6554v8pMRqaqM19YP39aWjen9dIxzyw5tHD5uvczU1/LhM5XmBKe3rrp4kCKdNiSt15Y/fp7T05fB6QkdcIL7y6Z2cO4Pztqwl0Jn3/w5KTc+R882d1LZr75Lqxdt+WJu9eAJEF91zMrFvUwwtLNClxsLaWZz7w6Z82a1Q9lUWTkhMfvU1dlUR4AQVrXRddD55gtSUsTmHM9E1ruY1YmJID+rOC+1B6/fdpNTbi0dnW3Mr0oFjsAKUmdkKpf+9DdeiAVmY+/9vQYKdhbB8oE6kWrlsDHW56Y9JLeAcBPvW/FM5lSYEvvW7HCvHrdynlfUcCPzJy56r3H1QIAwYQlL59duW75rK8ofsJ9iyak6jUOigLpsCXvvilY897KeVscpCIjc86KV3vYy2xF5tQ0gY4/Vd37uwfYUTNXrSc3fLB5+bzVZpAkZM5c9fKCtCu52NN1GbJhQlcHDraYf1KAoabimn5Ac3Nzy78dOOyNyf2HXNOPLjhzIiY+GfcxQlfOrlm9YLl+waftb69HN4HykoLr0HLyBUEBnQBAy784ZIcQQqiPw0BCCCF0U8BrSAihzgTql3f/iMWAsIeEEEIIAwn1WttTJj1Fm+dNXLi5yAN2zeqZkzrO09PlL3tH993iSdNWX+eZjeyatfdPXLy7Ep8UiRDCQLpFCKLue/XtpXcpbvY7PT0mTfa+IvzGHkIIA6nvYisT0xKlN/03D8w5n2/46qwZOzwIIQykW1TrbDQ6gJaJUMcMujBBtSf/vXmTnth97uwVzOXsKc5etmDS8IGDhk9b/P6VzWxkz9/84v1jWibdaZvZSHds84v3Txw+aODwsTOfWP1d64NfOk/QcslEQd3PjmOv/G5l63Q7izccu/CMME/R+3PHXpNpuRFCCAOp9wQJ6gSo1OjtAGAv1ugECqqqWOcB8OiLz5oVqaliotfLosxnD+ZI5rzzzbefLk2r/Hz1BzmmXs9spD+UVZm6ZPMP37z3IJmzbl12pQc8RbtXLt9sznz50x9+3LZqDGSvXr4l397lBC3QfqKgxG5mx/EUZb227iB76ltf/rBtWaY++6eqlsfvsCWZc+bPaZ1WASGEMJBuFGlqZhRVnK/zgL1Ko5eMmZDg0RSbW9KJnzBMyb+CZZES9fz5ExOlyrQJi+Yk2DWHiu29m9nIA/zUOc/OGRYlVaonTE1gm4vMlKfyp6xiybRnFo1JlEqjhi1YNFWhyzlYab/sBC3dzOxi0+dmVwrGzJ8/LEqqVN/3zJzUC/OeSdXTFsz8Q5OxI4TQlcPvIXVLkqCW2POrzHbIL4aE+aOjKjVnK02ZbE0VmfZ4pADMVxBIioTWGV7YfIVCQJnNZru5NzMbsdkCieLCnDxsEijK47HbzXa2MuFCx0WgSFDCT5VmjyDzMhO0dDOzi8Wss4PkwoOs2fyoKAHbjLsfIYSBdPNgK9WpgmxNcaX9rF0xNSFKkkBma6qqBMWeqPsSpABX1GizL/mx5VnHvZvZqPPMSZSH6rDIlv/oamajZWmXLKurmV3smpxOi0MIoesPh+y6J1BkRkFxzsEcvUQdJRAo1Eqq+ODBHLtyWJrkypbUeV4ZyR+fLYmtUPI9urY5Z+z6szqQKCTsy07Q0s3MLqREKQC7zky1rmBlpd2D9+QhhDCQbirSqEyF+VDWWTIhQcIGQVSqoPLQoUpBRuqVfvmoi3ll/sBsSRdyMmr0GKX5uw1bDlaaTEUHN7yfbY66a0IC2fUELe0mCiK7ntmFrcgYHaXP2rDlWKVJp/lqQ1Zl6xTnYNJ8t3n3MR2mE0LousAhu55IEoYp7IeqMtMUAgCQJCQI9Dn20WlXdpnfQ5GSzJmjze89cncV1TavDECvZjbqMpHSFq162b5y3YuztgApSchctHbpfYnsbiZoYdvbJgratP6ZrmfHSZz58tKqleueu38L8DMeXDQhYUslAIDHnPP5loOpaRPwvgaE0PWA8yEhhNAtA+dDQgghhK45DCSEEEIYSAghhBAGEkIIIQwkhBBCCAMJIYQQBhJCCCGEgYQQQggDCSGEEMJAQgghhIGEEEIIYSAhhBC6peDTvi/PbrM67FbK4/b5vFgaCKErwmSySDZHIBDxhSIsDQykP8VUb2AwGDJ5GIcTyCIILBCE0BXx0rTb1WRtNHuMdRJZKBYIBtIfTyOSwwmRR2BRIIT+YCNLEHwiiC8MqtNXmzGTeoTXkLplt1kZTCamEULoqghVRAQEBDjsViwKDKQr5rBbhUFiLAeE0NUiDJLYMZAwkP4AyuPmcAKxHBBCVwuHy6PcbiwHDKQr5vN58S4GhNBVxCJIvFkXAwkhhBAGEkIIIYSBhBBCCAMJIYQQwkBCCCGEgYQQQghhIN0Qprqto05u3otfLuiKx/HrguNvLTPbr87i/Pr//f7PUUXFthu1Oc4TC44tT/l1ecqv/3y2rqGrl9j3n189Kv9Erb+LP52s/GLOyRUpvy5Pyd1X6MfagRAG0nVGFS87+c8FOqOn4x/o8pr1Q099eZS6Xmvib9h7bvWoc7ldtJVUwbJT/1xQo/fg/rqopbjyTO1+xeYN2Txs1Tn1A3cT3T0GkiXlRvTnCtiMztmc919DhTT8yZzMVecyJibdhMdeDzUEoesAH656+7DZT260cyYn9gtjdIrG+mNH/fErpAo2FtOfxe0f9dB7XfaufCYT8EcIpULGLVdDEMJAuoX4vXm6Lz4znc+jWdFBo1bFj+5PArhzn/199wEfAABU/CejAgBYw+P+uiGUc6Z0/dy6ljPv6id+Ow0AwB62/Y4p/Vl0rWHbnEp7fwFRaK3WAT9dMm5F7JAkVusJ7FHtvo2mkjMeN5sdMUI66i+q5Jheth3+ht90eabAYbNF3E7do4rPDHqpdP4gTku3YP3rnmClV69jxM8Ww9H6EhNn8JtJE0aQpv/lb/yMnPl5v2RpSwtr37cgPy868ck3JYIeP9urq/9mTllJHg1KfsbzsRMm81vWga41H1hTdfKoyw1M6Qj5lKWqhNam0G8/o/t+pe58Ee0VsKNnRE5/XiZjd9qi/WVblzcInu/3wAMCbvcfrt14dssOol9/uuJoU6OHiJgROXNpaOvSPO7izyr2/a/BYG7mRAsHPx87bjyPAL/+f3nr/9XU8oX6HaN/3QEAEun8rMQEYU+bad9//j+LLW4AIIX3ZKUMaWvWTXVb7ys9bwYAgH+fee3fAMAdtfuOidKGL+eUmB5IefQxAXFhCe8vp4ZtThvdU//JXb6j+tgea0Wex00yg/pLxi+NzkhiAXjL1+Rt209ER9PVv7kcbHb87OjpT0uC2QAex6EFeYchOALsFa17IX7yZB7R2xqCEAbSrcRXsdfWb0b45BnO/A/qDqzURX8epWJzMt4bmgFU8bLfd+jCn/xIebFJ7R/3/Lk4urzmk7kG6dvp948gLw0In+E377BV6fOS6NyVJXtfrAjeHp8gBLA17F9pMI6IfuxtSZDHVXHU6qb87UZd3XnP/r7jADlq9x1dDAd5mvI2WmF8fHqnAKNrLcf2+6OXKhUXWluvBxSPxab9ULL3E8uAt+InH6g48D/L4EFK6fjQiI3a3JPu+MkcAsBVaCyuIBOeFwgul4WO3+ze5+OfeY8w/q9s9/JiVlj6lP4ssDVkP1uUyw6Z/nlyBFgPLyvb9qx3/ua4GCHQhdptT+hc42IefS+IW6H75sXizTbGJbFHeRv2lm1+3S5bmvzADP7lHvDkd+vspvHRD+wWwW8VO1ZW7Rshemg8B8Cdt/LsN3ncUSvSHuofYNxfu29loZudOn0Eqfh/d6z8f9Cw99z6NTDlq5R0aa8qgWB8v1fOgX3/+fdXXvpwGGnoQ4dDwdbwzdwi7ezUJ/9f2wqLMsaT2/Ya9bMFKiEAuEv22L1J4cnRPZ5kePxuOxH/dOKUJLa33HLs35Xfr+EqPgpXsFu21KbvHz0vS0ycqf5yecnuMPb8B1o+rtmdZ4e/X9wLnLDUif1ZvakhCF0vWPeujgDpjOiZS5RDHoiZ/jSfZWpqNP2pxQXNUI0bzxeEBQ9bEiKtbcj9jQIA2k47PIzgQSKplMUNEyQ/EJ6R1NsTCvtvupMV3MEPBHcKD2/1Dl21VDxsBKetWWdJA/uNCE4eH8hRCtJHBCeM47JMbpcHiLCgjMFQvcfS6AEAr/4HS6MyaEASefnTnsSQcQ8Hy6T85MdU6WHugj12F4Cr0FRQQfZ7WpWexAlOCh23RMKvaMwv9AJ4TUcb9aRo/NNyVRhHNkI1YTbXcbS++mKRevV7Sza+blf0Ko0AAFgS0ajHQlVhHNXdyuQwf8MZ2gVA11pOHvBH/yV29HhBsJSf8EDk6P7e4j1W+/WrNqyIGeIgXePpQm/LmUHeb/6IGeKgngdO2bzkx6KGjBAES0nZYPm4p4M55Q3atqs+AuGo5+WqMI5icsTo8Qz9nkZT63XBAFZiyMQH2vaCs+CHJlevaghC2EO61YI9OIbNAgBgcMJIDkXZPf4/kfbM4KSWpQEh5QYL/I0mLw0kIRWm9/fvfun39/eIYpIEEeOlaf057ZpjTvp7Q9O7Pqd25G1sgBGx6Umdu0fmY3uoiCXKiHaDUSw2kwUAJIPFZrAAWGwGUD43AAAneoaI9aKxuFYuk1pzj3qDZoS29avo8ppPplVVAwAAf3rSMxc7NAxOTGBwSyMrZEcoGXm1Hjf4Qed2s4kIZWsV5CgDBeyGBp2XBkZDOQXSoKDWfglLkMRm2T1Gkx+kAABec2P2vwDIwPRosncPv2WwhAS/NTeZfAG47V4A8NY2Ndjpxpc0y19qt+2DaLcHBNfrWhoRLc1IMhzbY7UPDnYfNVaToukjOJft8DWc1O3/b33JGZej9YaYQPeFO2M4Uq5M0LKXWUFJLDjTZPdAy6VBTkwgv2W72Gy5lFFQ6/aC6LI1BCEMpFuwp0kCca17nWxextt3KM406fNMuTu0Jz/RFbyV+kDHKwFddY/O6E8WctI/Cg7u1D3S/6CvEEoeGMfr5WPNBenyZOX5/ANNCdGmChN32LjAtjcSMfIHssVejx+AwRJyBH+gDHtbSdlpr4YL9pQfW14ZvTkuoTfjaWSHhfu9LYsl2YM/umP64Bt3GLB5yTMEhz+orygnG/a4OCPCoy+3Oa4zlVufMHjHq6Z/Lo1P4riPFq1/0fXHPtx7+RqCEA7Z9a0iZrEZAF3dR8tmsLoe7vI1FHpaGgva5GqwM4KkrNZ2n81RDJZkPJb4WFb65EH+6gNNl//2k8dZsLHBPUgxuH+nZtfUcGyHW/GwIlrY660RBmZM5jTsqTm2w+pNlyVccjsWKziMJ4vhy2J4wdL2v/e7y5saWgaObJ5qnZ8TxuYAg6PkcDx0ta61VXTr7HYPK1jJIoARHEOCqamxdezM21Do8QrYbctkSQQZd8snrIqKMNV/s8546Qib32VyN5i8dG9OxsICg9mUPs/V3YtZbAYAeD3+LvYpgNfTfHX61iNCosF+8jNdbgUrYYaoQ5DTNneDiXK1L8yKpkZB8MSl4clJHAL87lq3o93N+m6Ty2hvWWFvY6EXpIFtvT13eVPrKz0eg8nPCeNwLltDEMJA6mNFLEhiQ7m12tSxXSMEXJnQqz/p6nx+27hHe3i/w17bcGxdvSksOGMQCQBgMh9aV1NQSNE2d/kP+vxCkA0K5LRri/KePd75G5euQt2xPFb6Y5JOJ79+/V5dCQQPG8+/klmfWNJxUpnJcvLXXlztaDsTL6o/8FmD0eQo2KjNq+WkzxBwAbhJ0uRo6vwH2rxCd0Nh3YF1Zke0OC2JBcCSjghSUNb96wzaWrfxqDZ7p4s/IqRD14GIkU9/VeT9oeL7ve6LiWJr+H6O5u05FdW9+OYsESYdN4Oj31j2zR5rg81Pmxp+XZa/dYeDvphYbD7lKi+kOiUWKzidDXl1eSfd9J+vIFJRxghGxU6TSSke0PGioPv88t/fHn328MV9yuBEBwZRrpJCNw1A1xoPfebwtv8mm912+N8Gba1bv7f60H6/YkaQlH1xL+zb0bYXeMl3B3IvU0MQus7wlOjaB5JsvDJjT9HuCTm7L9z23XrkCwWDHxYUvH72jU+g7bZvAACSGTGeV73yzBpzAD9dMvnt6At3GzPchbptn1QBAEfJ7/d8v4kPXHaozXl+o8Wdrhqc1EX36NedLtkDMfHSK9seIkaclq6tqJAMvvzVjtbV5g8X8/cX/effPpaSn7EqYVzLZgqDJ7yXyFpT9c0cjRuY0hHKeUtVMUIAACJJNe8j1vcrtZ9MKPMK2NEzEhY83/nOcoZscuz0o2d3rCnLTeo35I/cG0bGPJ88X1mR/cH5t5f7WBJ2UBg3efLF61LcaPnocZYdizWnocNt3wzFjNgpFaX7ntBkUyD/e/8n/x+f8Fi/n3n2WEXre7+dkPNtx2tp3a5GxN1BQTvrgx+QK3rRVeX2V93/qu/7NXlv2wCkgRmzxUH/9bSLK3ECGD6ZUOEVsOMfjp9+8aYPBn+cmPPD+f/8q/mSvdBDDUHoegsw1FRc0w9obm5u+bcDh70xuf+Qa/rRBWdOxMQn/+G3l5cUXOs17AJda9g2R8tamv7QZM6fX5rrTPnGJyyqd9OnD+4wOOg37sjfuJGc8nliuvQKm3Kb9fsF58tH9HtsCX5h5arwN+w5v34dTPy8X8af+kaqt3xN3raTQfM/j1F16Ll6HIcWnD2ZFP/kio7p2H0NQbdtu1Rw5gRfEBTQCQC0/ItDdugPtXRuDyf9+dhR/Tu3NV4XWzRqaWS/K00jj7t4Y0VuBSd9ciCm0VXhKjTs+8AKg0Pib8DzEXqoIQhdf9hN78sYwYOVowd3+SdSNSNKdcW9N92WqRUVFBH9aHwGjvBcBd7ylb9/stPDipZO/8sN+QJQDzUEoesPh+xuZNcYIXS7wSG7ns6QsH4ghBC6GWAgIYQQwkBCCCGEMJAQQghhIN0amEyWl6axHBBCV4uXpphMvEEVA+nKkWyO29WE5YAQulrcLifJ4WA5YCBdMb5QZG00YzkghK6WxgaTQCDCcsBAumICgQia/XV6LRYFQujPq9NpAwKAj4GEgfTHSGRyL0XpqssctkYvTWGBIISulJemHLbGWm2pz0tLpKFYID3Ay2uXzaRQh91mqtd53C6fz4sFghC6Ikwmi83h8gUivkCIpYGB9GfxBUKsSQghdK3hkB1CCCEMJIQQQggDCSGEEAYSQgghhIGEEEIIAwkhhBDCQEIIIYSBhBBCCGEgIYQQwkBCCCGEMJAQQgjdUvBZdgjd8uw2q8PW6KHcfp+vT50vM5lskiMQBvGFvZ2ywXxun/HUbld9mZ+6WWbXZJCBvNA42cBZ4uQ7sa5iICHUlxnrav0+P4/PFxFiJpPZlzbN5/PRFOVw2FzuJlmI8rKvL9v9sr3qtM/VeFNthZ9qclSfcZmqGgt/iblvFdbYnsIbiwChWzqNmgGCxBIOh9vH0ggAmEwmh8sNFkua/c3GOl3PLy798u+Nhb/cbGl0MVxdjQ3n95ftfhkrLQYSQn2Q3dbo9/tFouA+v6WioGCfz+ewW7t7gelMlr3it5t/Q6zlJ0z5P2LVxUBCqA8GEofLu002lsvl2q3d9n6MuV/5KefNvxXNlNOk+RKrLgYSQn0NRXkIgrxNNpYg2R7K3d1f3abKW2VDXMYKrLoYSAj1NX6fr+9dN+oOk8ns4R7CW6J7dGFVm7DqYiAhhBDCQEIIIYQwkBBCCGEgIYQQQhhICCGEbin46CCEbk+0vfzE9/t+LdE3uL0svlSVPPzOcRkxAuIafmSD5tP3dxfzR/3lmUkq4iYqCpKIfiB6wsPBijAWAX5XbVPJZ5Xf77A5KGApQ+btjk8A8xczC/N1ACQ3bWnSzAd47qOVO16srbBjNcJAQgj9WfaCPeu3ahqBFRSRHC9jufXlJ7/ZUFAx68mZ6mDitioJkt1vafJDD/DAQ+mPmhuAHTFIkL40TZF0fvNKi+OSV3LTViTNnMFzHy3f9qK+GtMIAwkh9Oe5tIf3axoheMBDi6YnBxMAQDfk7f50v12nd6QH8x3F+384kFdc3ejlRySPmzJtiEpA6w6uf//HxvjRo7jFxwr0bk5ExpRZk/uHEAAunSb7m5/zqhu8fEW/4ZOmDEsUEAC0vfjY198fKjC5WUHR6okzpqbLbsqg4/RXjn+ABybzlwuKTlc0AwArOvSBzXHJMyKH7bFm1154Hbs1jRz7S7curzNgGl0TeA0JodsO3XCuXA8gTR4cfaE7RASnP/jC849PSw6GhryvdxzOMwar75k+RGbM+/aLH4vtAMAiWOAuOZEHCaMGJ/Ad1Se/+fF8A9ANmt2bd53Uc/pNnDEhmVWy77PN+7UucJXv+3TLvgJ3xPB7pg9XNJzY/cXPWtfNWBRMxbggBUDDfkNJRXPLr7wVlpP73QC8hHGB7NY0YqcvTX5wBs97FNMIe0gIoavJ63a7AVjcYG4XDQARrH7kFXVrcBEFmooSbUUDHd3yyqD+U6bfHcNq4Brf2V1irLbbFXpNiQOCBk+bMjqGS6ckZBjtLAHLpc8v0AMnYeKMaRnBtKqh+PzhgnzjmGE34Sk5R8gA8Ntr6XaPJfK7a700AEvIai0fNj95BAAANylYIa032JuxDmEgIYSuzmHP4nAAGl0NLi9Ap4E0l/b49/t+PV9hvNBEC7zgbX2jQCZgARAsDpcF4PV6wdVg9wIIgjksACAEMpVABgB2rd0N4C7e/dbS3a0L4dgd3puwKPxumx+AIQgjOACOtpQKYxEAbhPlbW0iqeKNVSXKiCmTJdNXqRqfqMLbGTCQEEJXBREcowg6ZDAVHKsYoWi5hgT24j2ffqNXjp8x3PV91ulqweAFy6dHe09sXvttj88C5QYLWGC0N7i9AARdn3dMo+fEDO4nCOYDeCNGzbwzmtsSgVyBjAPFN11R+Bp+a7L/P17weHnyDuvJopZrSOLB4zkATu1Jjwd4AAA2e+6O+ny7mx+WMrp/+PSl9s0rLY0UViQMJITQnyaIGT8xvWJHXv7WtdURCdEKgddYnF/RwIkfEiGCAvACAN2gLTCeOVztBbAbq/WNEV03IEEJ6nh++fm8gyejXYLqg98cq+YPjhk2RJGWrDh22Fitd0fHgD73xHmXYtz9KtlNWBSNR2sP7BdMHy+Z/vnAwb/ZG4AdMYgvYIPrqO7kbzRI273UbjuwvEz2UXzyjNjphZ4dnzW5sSZdZXhTA0K3ZR+p/9wnn5wxIELg1hecPnkiv8IuTZ86/8GhMp4yY/QQKavh9Def7c4TTJw5XM5yl+z7Ib/B182C1DMXzBosMx7Y8dnuY3ppxpwFUxIFwFWN/3/zR6nsJz/fsvnz7HJWv+FjogU3Z1FQTSdfzNu4xqj3kIoRkuQRfIHHWbCxaOOLdYZOfSBvRf03K3V6D5nwfNy44QTWo6stwFBzbSfnaG5ubvm3A4e9Mbn/kGv60QVnTsTEJ+M+Rn1VeUlBWETU7bO9tdWV3R3RmlVDb6ENUS8//md2+nVoOfmCoIBOAKDlX+whIYQQ6uMwkBBCCGEgIYQQQhhICCGEMJAQQgghDCSE+szRy2T6fL7bZGN9Ph+Dyey2KEjeLbPXyECsuhhICPU1JMmhqdvleQE05WGTnO7+ypFG3yobwpVFY9XFQEKorxEIRS5X022ysS6XUyAK6u6voYMfYHJEN/9WMDnCkMEPYtXFQEKo7wVSEJPFsjY29PkttTZYWCyCL+g2csQpE4Qxg27+DRHGZoqT78Sqi4GEUB8kC1EGBAQ0WExul7PvXU/y+Xxul9NiNjGYTGmIoucXx9z7hihhVACTvFk7R+ygpLExM1Zipe0BPlwVoVs8k0KVdpvVbmukGsz+vpVJDCaTJDkCYZBA2KvhuLhZ/2c6/W295ktPQ42fct4sW0Hy2MHhIYNmS/tPxeqKgYRQHycQinrZZPd50gH3SAfcg+Vwq56CYBEghBDCQEIIIYQwkBBCCGEgIYQQQhhICCGEMJAQQgghDCSEEEIYSAghhNBtHEhMFsvr9eI+Rgj1DV6vl8nqy08z6MuBxOHwKI8bKzFCqG+gPC4Oty9Pp9SnA4kXiIGEEOozPB43FwPpVg0kbuDtM58mQqjP8/n82EO6VYmCJDRNOZscWI8RQrc6Z5Pd56WFQWIMpFuVKiaxTl+NVRkhdKsz6GpU0Yl9exv7eCAxGExVTJJep8XajBC6delrtZGxSQGMvt5i9/kdGcgXhsgjKkrP49gdQuiW42yyl5ecD1FEBPKFfX5jb4sJ+gL5wsTUgdUVRS5nE4PJYLO5JJvDYuHkhAihm5HX66U8Lo/H7ff5vD5fv7SBfb5vdBsFEgAwGIzI2H62RovL5bDbGt1upw+/M4sQuikxWSwOJ5DD4wXyg/r2XQy3aSC1EAaJb6u9ixBCt1LPAYsAIYQQBhJCCCGEgYQQQggDCSGEEMJAQgghhIGEEEIIYSAhhBDCQEIIIYQwkBBCCGEgIYQQQr10vR8dFBAQgIWOEEI3s4ALsIeEEELodoSBhBBC6PYLJByvQwihW8h1brSxh4QQQuj26yEhhBBCNz6QOnT9GAyml6ZwByCE0M3DS1MMBrOHprtv9pBYBOF2OXH3I4TQzcPtcrIIou/3kDp1mBgYSAghdFNxuZoYjBuWCzcwkAJcTgfufoQQuokCyelo+V5sXw6kts1r+wIwk8mkaA/ufoQQunnQFMVkstra6g4N+C0fSO23pP3PDAYTmkFfU4E1ACGEbga66nIAaD9k110Dfmv3kLoMKpJkNznsTQ4b1gOEELqxHHars8lBkuwb+ASDG3Dbd/ueIEGQ2ooirAoIIXRjacuLCILs3Er3tdu+u+v0BQQEMBgMXqDwfN7JJrsVKwRCCN2QvtH5vN8CBSIGg9FDc309wsJwXa7iNDc3d/63BQD4/X6vl+YFChThUVg5EELoutHXVLicDiaTaLl01H7iic7/9qlA6pBGHX7w+XwBAc1MFsnh8rjcQA6Xx7rQf0QIIXRVeGnK7XK6XE1ul9NLUwEBAQwGsy11Ov9wPXtI12mCvoCAgJbgafmhZds6/MBkMv1+P01Rfp/P1mihKY/f78PagxBCVxGDwSRINotF+Hw+BoPRNkx3w9MIrueMsW2Z1OE37TeVyWS2dBsJgmSxyB56WgghhHrT8Hb1SwAAFovVm6G563lTA+uGFFBLDnX+t0P6dPNerGMIIdSbxvYyKdXhh+t/0ehGBlKXA3cdOkAdRvO6LGLsJyGE0B/oG3WXSd2N0V3nWGJd/zJqn0k9hFMvCxrDCSGErjQ/esieG5VGcAOH7Nq2tje9os4dqT+wAxBCCMOp81+7TKC+P2TXOZM651MPydT+LVjbEELozyRTh9/f8DS6YYHUvnvUIYo6lwXmEEIIXaNk6iGWbqNA6txV6pxMmEMIIXSjwum2CyQMIYQQugnD6TYNpJ6TCSGEUN/OoZsxkLB7hBBCtzMGFgFCCCEMJIQQQggDCSGEEAYSQgghhIGEEEIIAwkhhBDCQEIIIYSBhBBCCF3G/wdoB9qcfha3GQAAAABJRU5ErkJggg==';
-const PG_IMG_B='data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAjAAAAHJCAIAAAAU5pR0AAC0FElEQVR42uydeVwT59bHDyGTIdFMkAwSCCiJVYIUgsqmohfRKmp7wbZatLVqS63aq9XWKrWLW7XYWrX1Vr1WW62tIrYKfRWxVuAqXgXUAlaJG6FIIEiiZKIJSVjeP8IuS3Bfzvfjh05nfZ7zPHN+c87zZMZOXayE+0ltbe1DORZBEAS5HTs7u4dyrC2wH6oUWXTFl/+6cu3GLXMNsNhcvqu0z7M9Hdm1tQBQXXEp48TfTMO+LA7l5PKMl1RMEdVMYcbxy8xtp+OK/f/h162yKOfouRtkz8BhfQX2AABgvHFVkf+3Wl9ZVQMsDq+bS8++fdwEhPUgk+rMyT+vVQG/5+CgZ7oRAGC8eior93pX+ZABHtwWV6jfubFQvG5Orr28PbqT9vfKbtUVl4+f/Ltl7TguQYOf7U5W3yzKOXq+ogbYLvKQQFcSAMBUnn08r8wMLCevsAHuvPqCVDOFx09eYWqgiyQg1Ku+ug3n5/cKC/Hsam+tEcttQEh/Z8KGUnFc5AGBrlwAsFRczDh5tcaj/1CfbtYjKyuK27BzQ7Fbdj8XeUggfTPnfznFJif5kH4e3Nar30USMNSrq7Eo5+j5CrJnQJh3XctWG8svnisorrhpqgIWt6uzqGcfqUjQtB6WG+dOnlHeApag99CgHl3trY2Y9ec1c8uysCjfQf17khVNC2O9hvqyIl/F3DJXAYvN7eLYs08fiTPX3mazNLej/nLWKcUtyjfEv5VrNadtewJYtDn/yyk2AlfsP9hX6AAAJu2Z4zklZK8hIZ711rmlvnyxvuScLnxKKPbs00Pg0FYTG7XK/Mt/XzcYq2pYHIeuVDf3npKedTVt2fOtJnOUBQz05Nt3UBibjm16Twlde/aRunUj221Hy428/50pMt5WjS49hwx6pqu+aSfvsB3r+yfLsW+Iv5SyB6jWFZ45rjCI+oX0d2HfuHDqhLJS6BsQIO5i/3gKSaue+Q5OaD32/skS+yGq0XXFn/8r0NUAh6JdurKMNzS6q+eybzD+A5+lG+8ZNuXmKiBqKnXl5RWaq2du1RADvbuTgp5Sj5vVUHNL+7fGABxHdxc+wQIuzbOrrYW6S9fW1tbWAlSWK06cVt0CFldAd+fW3Lx+XXs1/zhjHhjg2cxh6FWKUtegHjZ1OC7tKurCrq4yMuUarfrKTegyxN/Z4R63DOXmKiBZDZfs1rVZW1VVlN6odBU5AFRWlFWYW3EvTGnZzRpOF27VrWtljFQgJO5Jscxll/++5iTrTt7mPduzsz3p6NqnJ98ENYbrpWX6GrbAxc2RYw8cRz7bhuqzujo72LfiQEvOnMgvMwO7i6ObC1l9U1euPFeuuRkc9ExDZS0VZepbLG4XtlFfqr4lfoayB2ALxB4SrhlqzDdKyyqqWFR3VyGXBayu1O1PFdW3/v7z1FlNFbC7OnfvwqrSa69rFKcZRh4gd+Xa22CWFqczqC9f1tVQkmfcutqDpb1dbey3xtLLxR7UM47E7cpX8OeZ85oqYPOE3YUkmHTXNUXnrzNVAQOl/NaMqT5z4lyZGVhdHF1oEsy3KjSl5zU6Y1CAjxPRouc3argjp+mp2ixMx8dyhGJnis2qrjLeqrhe/nf+jVs1Q/s1Pl210o4sB1HPnvbGmuoqfZmqwgQOzmJhVzaL1UXYSiPY2I41FVcKykW+Il4zA9l383zGTZ1TfPlvLd23oyZ+mNmmzupE0xN26tja2tr7pEnshyFF1mcSdX6hroYt9B3oZ32GqTaoc078VXL1otJd4N3Qp7nd+3h78u0BLLq/TmQrb2lLb5qdnRx79nEEAEv5ebXGUE259vFx49WfuEUMpryougUct4aeV9c1lQqVc5Bng/xwuByz9rKy3OVZUccdjtOtZ28fZwIALNcvZmRdvWU0VlUD3NtnJ65zH1n9w91tD/Mkl2Wq0FSYRCLSwlzTmdgOZE1lM/9muVly7SYIenmLb+ScL1dVSITO90CRWFwHuFV6USUWSvmdsjNBuT1DAUD1jQs3yvSVXV17+njWu0WLjdWvbhGtai8ry8xA9ew/0Nvqoi03CvLOlN7S3bII6/qP6YZaa2Q7+vbpdjVXWVJ6U0IJ7MG+q4unjwtA9a0CprxC5yCU9vJp6G/NC2O4djlfU8US9GqQAatOlFxUujs1+qY2zdLyGezm34XXq9hOkh5diY5yBzb1W7YDWXXz8uUyUT/3rtCi5AUXm5e82qi9eLmc4EJNK13Vor18pcwMXTz8B/oIHeoeGIvOqcwUq6bVnt+aL2mzMB0fy+rq/ozMGiZW3yzO+t8F7S3mZg3UC0Nr7WjP7e75THcAMKozyyrKWQJJn8YHgmq4g3Zkcbkso1qp7CH0cWI1O550lHhQJRfLrpT1FPZ4mEFSZ32v7bLR2dDnPoVKrIeiRgDVt7RlN2qAdPEQ13sde56z1JUHYLhWVlnd4qS1tbV2RFeS1dnCVBmulesBunT3FDqwrOdh8br3dCKh5kbZjcqq2roCsxzcenYnzWX5BdfNVXXraluj7sxQW1tbW1XJlBbfMAJ0cezKYdXeQ5rWu7VtrC6CrqT5hupGZZVZV6I1k3yKy6ovVm1tbW2tmVFfu8Xq2t3JqZtLN3ZleanO3Mb5m9aow1KRAo8eAqgouKzSNzOTLXZup27Q3OBtVr9phzDfUmsrgUW5u/PZdZvZjpL+4YP8JIL6FZW6q+WVbIGzUzcnFz4w19TNrNDGhZoUpvJGKVMFbKFHd8f6U5Ld3HsKWGC8ob5p7tAsLagy3Ci/BSy+sxPBarXiTfa0od/WAnCdernxqjTKy+WV9RduKHlFi5KzHJxkz3r1EnVl3349s95qzJ49BGT9OnY3D/mzvdwFHFv6SbuFseHYBiOYGfXVMl0NsPmOXexqbWvH1vsLQGfa0Rq0ufd0Zhv+vqCqaNmMrC5C565QoyvTNevMD4lO+cBOHdjZS9zzYX72A5ci6561NUZLDQBJNhMZdleSBQaLpaoGwK6hGwNAtUmnVhZU1ABH0L3LbQ9Z1p7ecHpoPLCmqsoCwOJ0aXoZgu3ABjBVGS1NH/3pnr2vX//rqrJY5NWRUcylp48daCizwL2vpBtxz5929Ff++8eVxoDBvd+QJmMShMDZ8fqlimuM0V6rNbMdewpq9NeaZdxLNbdYXb1oHsFlu/DZ5ZpSrUkouvtsA5vX8xlR+emSS8rr3cSNq222851Vn+3sFxjkymm2Q43ZVAXA4pBEmw+shuul5WZ2N1cnLsFx7s67dOl6id7SzcnmtqqusViqADhcskmPsGeTJAugymSq6dAsLcMQo95UA2QXHtHRM7bN9mQ7SiSumnPFV666+wmal7ymseSWG2cz/yy6VZcq6zuwn6RF6N3cmNXM3/87caVuGK+L+6DgPvU9r1nPB5ajX2j/JqNfbRQGbDi25nre0dS8hoBE2KtfX9eGvNn9b0dWQ1axt6RMe+nvS2q6d/Nz2JO8LhxgKvWmGlfeww6R2nG27Ycsto8e2R4A3dtQiX2/DdTWbiwuwQIwmUw10JjRrrppqgEg2PZ2DXvqr6QfbnBMDq59pDSnifhAB9dlsdgEgNF8y9QY/oOlqrIKgMXmNuvRLJ7bM25F2UVXlBrPjsJKJ4l3Lyc2QJWRKS+6Upx9smpAkJeo6ZgCVN9QZP7v78qOM3M9B/xDJmilhzuInpW51J+SRXRpnuQhKRdHTtn1smK4aWJTbo6ckmbZLKb0WiXUVF448d8LdauuF183iVzvXpFYZLeevbpr8tRKJZ+6EzvbSNPqs1i8LpzbCsIm2ABms8lSDa3OKKk2alUVVVBV/teJlL/q1pWVMn2cbB5Ns2cRBAugymiqAqg/qNrqwjjNH6VaN8vtMlMNQHLZHUb6ttuTxaV7SRzLLhRfLCHJtkpOdO31bD+XqsryixcKb7V6vXpjmqqBtLfv0t0vkDKZtFfOF11vvedbL8Jp0SytF8amY7t6PtvLmawqv5xfqGM7eYgaB4IeaDuyKXEvt6u5xZeVQpfbTMQCsJgtNfAoY2PWzkZl6pQs3RNNYt8PE9iwm70DRfHgxs2yqyqmmydlX1tbW228VlBqAHBwdHawb8gCc12f9erOtQdgsXlduna1fTJbbW1tba29gyPfoYi5dU1Z7s6vz8WrC6+bAPg0vz7PVqdtbIH7M6JrZ0r+LnKoqT9Dq5Vgk926OVtvB6GAXXE9p1xTwkhdHJp5KH6PvsHCqo56L4vdpQur+XXqchgEz0no1PRB1hpZ1qdCCCcXin1N87e6hi30FHBqS5okSEwVpdfM0MWtT1+RAwCA6boiv1hbeuOWyIXXcP4W0XlHcXrjUSwHV2mPIs3lYmUVC4AAazqoQzu36AXNsyqN69qpfnWzNBCb69SFXVzJ/H1VJ5bVjZIwV//68+8aF1lfGU1WG7XFuiqWwN2vlxMBADWVJRcvqjRlNyqdnMk2y9J8pT2/G491jdFeVV137mW9hun61b+tE3F47GYJp9bMUnubDRszV7dVvFm36NCe1Q3Hsig3zx5Xcwr/vsoFALK2tZKzuQJHbvWtm+zbEgp1bqDBmDdc+wpJlgPVzQGMpqJmeeDmPb+1XtlGYWw4lsWhujk5c8HRXq89VVR6UXlN4GVtpk62423d1aZ2bOxaLI7gmV5O6nPXLpdxmnmBZgnjR0J7bBSA9mcu2KJMNorNPdEk9gNQo1b3Ifg9ZB7lZ65qzx4//jfdrSvLeEPDGGuATfeUCojGo9g8IS1sY2y/ebdr9WqkY69e3a+fu1Z6NquiyMmRW3Pz+nW9GYDTvZfo9sibdJb0cLp28Xpl+4Nr5oq/L5/XsAGgxsyoy6uA5ejUpaUl7bkCIfcuLGvUXLpgbnx6Y/FcPERNTsgiHWlHtkZTxXYRUSSLaTbar7puBp67u8jZ0Tqp1eFmcUn+DfV1I83j2rdfI+sIs6vEtZ0spD0l6u1Wkl1sqGl44Oycne8JXJfenrT+sqYoJ03jKHTksS1MWfnNKp6bkE8CVBuvX6uoYjm6ubnQ1lFoC/t6saroerHO5GzrTCn7rm5ST/VfBbqiE8c0dLeu9lU3tTcMVcBy7Ol++1yuVszSYgeCDQBVpqpm0wpqbhZfucDUR02sLrTErRvZKXsS3Tx7dS85e83YtOQiqac6z1pyJ5rqyqq6odHozQAcB5Jl36Yxi/PSNJSzU1e25eZ1LWOsATafR7Da6CcApEDUw5VPdFAYm48FIBzde4uunSkpUfwtcuwjIB5CO9rzukt7FVVc0JubuceaKksNAJvDZsEjQlu+t31paV+Z2jrWxlDp7jWJ/VDUyJqUFfkEDHa8cvaCqkJTxlh9ruQZmYRuGTLc1RiafRe3vgN5jvn5BaU6jVEHAGy+i6dXbzdnh7rLNB1yZfG6e7mXnCi82VbMYF1h1KoLtY0DX2KvPmIe6149ONWdpoopLW4qM7xa5+5ODqz6p2xgEY6uArZGR3UXcFj1ucva2toqw/XiG1XA6043FInl4NiNB7qK4vJKkQevfldo8oDfvEYsqotbd8fmd17zB0R2N0/P7tfOW3/MU1tbWwusDu3c8kmiyWB300Cltnnx2i4DsPnu/YN4hRcKrt6oKCupAACOwK2/7zM0p7a2qrK8hKlh8WhBw+XZXYSO3KISraqi0urJapsVBlorDLAdvQYEOBZczC+6rik3AADLwalnb2lv69SAjs3SvC86dOWyrt3SG8xVjmz7hmuZr5eUNGbGeCxXV0dObUf2bG4lrrNnr26a/Bs1jXbjOHoNCOBfvnxZzVxXq6+zHfiC7j270S4iWujQSldtYsybZSUM26ErJXTz6E67ujjxWG30EwC2sKtI1JXdUWE6PrbxduPQnj3oaxc1RZeLRf6evE61420jybWda8e6gI3dVfyMqOjPEmP9GQCg2mS4aQY2vyvH7mFGSLYP6txZyq5DWbrfmmR3x29q6LBZ2tmh1U1t7X9Xsocgjw4W5nzWmb+raHnQs25cNMdjRM3Nv/OOX2Qc+wQE9OQ9mtO+bZGBtvZpdX07J+zwWnesSXcYId2xGrU1LHP3eoaKhTzqsLuI3fhXL2uvam51d+fZo0EeF6pvFZfoatiOYmeS9ZBciY3z4to/pFOBUTvRUodh0B3HSXeSEL3fatTqRPgOZ9Pfq5n7CHLfYFFiqUdXuF5QoDbWoDkel/CIUV2+ehOcpFIR96GNIN2Bf2tnh7tcCXeXIWtPdzubsruzctgiRfchj4f3EoIgTxq2xB53mZ2zZQ3ch9zdPX51kC2ich/E6T4WHkEQ5D4LTGffQdexULU127vVrN3t2blW17SaA7y3bw9id9IQtZ3a2uGaOxOnDoUDpQVBkMeFO8xutSIPrevTvRKhtoaa7v43THciSHepRp3dwXYd6tzLnQC1CkGQxyR4go5/VNSWRDVsb0eZ7kCEbteYe6hJ9+vVQZ0Sm47+txMKhHqDIMiTEzx15NCaKlZbv0BqS5nakiVbVKpTmnTvI6ROTcK2XW/a3WRTGTpWIEzfIQjyhERMdu07wFb1qS1l6lCW7pUm2S5XNgnSvVIjGzfd9vv8WptECH8/iyDIE6hBdh17uQYVaeIbG8SpLWVqS5buTKLuiSbd31l2bUtO67u1L0Wt6NAdTZBHEAR5XLDpYxNN97lNnFooU1uyZIsOdahJdwn7bsxh+zQH25ahpqa6proa7Oxqaqqqqyw1NfjjQQRBkHsJi2Vvz2azWGyorWXZs1ksli2hUluaZHskZIt63XmE1H6yrlPL1v9WVZlZ9izSwcGB18XBgefA7cImCOw9CIIg95Aqi7nSaKg0GozGW1UWc3VVlT2b01aodAf6dDdhUwdvarA9PLobNaqtrbFYTF0pR1exJ3YXBEGQB0ZpsfKmXkcQDnZ2jTrSVFE6uwx38WLWO3w1092oUW3j98mgthbADiqNN908pKhGCIIgDxhXd4mbh9RoYMDOruH7L7WtfUETOj8toLOw7iA8uoNPxLb2dVDr3xrDTUbmG9ilK4U9A0EQ5MHTpSvl7RdkuKlrCBXa8ttwh58It1U+7sHLazssa1tqBAAWs6mH1As7BIIgyMOlh6SPxVLZwkW3qkm2O/97GSF1Vt86ColaqlFVlaWrwBFjIwRBkIcfJ/EFXfmC6ipLh5pkow7dgUSx7vJcNoZETTbVLVRXV9vZAY4bIQiCPCK4ukuszrmFu7bFt8NdZ/M6HSHd5W+SmkpuTU0VzupGEAR5pGAT7Jqa6tsG+zv3Zu07DpJY9yQ8siVZ1yIArK2t4XXhY/MjCII8OnC78Gtra6CVCWg2Je7uMki6x1/kbb/Q0PytSg4OPGx+BEGQR0iQuF1u/1yFje797umEIN3NTPOWGgu1VRaLAxcFCUEQ5BHCgcurslga3oPXIr91v5XiXk777jBZ16BGAFBTU80mONj8CIIgjw5sglNTUw23vcy6w8Td/Zr2XXuPvuPQqk7iB/QQBEEeC6zu+g4injvex9YIqcOf3bY9aNTa4fiFCARBkEdXi1oLJ2o75/w7pU+dE6TOV6fNZB2qEYIgyGOhSe0n7u45rDsqZ+fSiLcn6/AbegiCII+wGNW2CCRsfi3cXQ0psWyJrTp76vYmZqAUIQiCPD5BUqvr7kwUOlx5v95l13p4VFuL4RGCIMhjEyQ1ceCdDVfu5bvsbFemWhuGv27bipqEIAjySKtR25MUOqEID0iQOlErnMuAIAjy2KpTq0HS/YgrWB1GWHf/AlcMjxAEQZ6kIOleaUSLlXf7tu928nUYHiEIgjyRQVKrUxs6FIjORUh3o0yd0lsMkhAEQR6L8OiOvf0dwLp/sRiCIAjy9AjY3e/Gvg+i2mS5eb7uvoZHtXd6Zju7hretIwiCIHXu2s7Ozvq3zo3b2dVCrR3Y1W8COzto3OFewO5U+e44MLqbF5LbQsnN6pOlZtYd2aWmtjbElePW1R67IIIgSIMatfW/th/YqWPvMEKq7eTHMe6rFFk5VWZRXK+a3a8Ln9O5UTG9uWb9n7fYLLt/thQkJnf3V1sTj6XlqQBov8FBfmOmz4zyprCrtgOTs3XOO1tNY77+z0eB99JS5RlxMQuSqZmbv50swxZAnhZMN0pvks5C3m1e2lB+zUR170Y+YFmyBkl3eKxtsO6tVLSSr7vPUlR3coB/9nI4VFh5VV/drEWram+Za25Zam6Za26Za4xVzcpwVV99qLDyn70cWisZJX9l6ZcrpvhxgBP4ry/Wr12IamSLJDGMXm82me/5rWnS601mExoYeVqoupH338SE3/7v6N/6quZqVPi//9t5IPH/FJqqBxYtNXe2Lefa3cPzs+/V6Wx/gcR9Uia3rvbOPNavF40hrpx+3QmrOK/NMqUWNUoU18j8OEEo6MKpra3985rlZKn5pT5cgmV3RVeNN8Ad6URx4tKV2lfWviknAQAo/3l7z86795dxDl2ccnYxmht5imDzPZ/x5Ksunv3vIfvwMf9wt35e21Ccmbz/QgV07dVX5Mi+rwWwPWvXcrTpLmDZLoz3UAnvU7DkwrOf0peXp7GcLDFX1dQCgPpW7aVyS1m5XqvRazX6cg1jNFVV1dSeLDHnaSxT+vJceI/M0JGpODtxc0JWuS1xiDJj19bEHOahx0OK+J8yVMzT6zQelYZAnkRFoqRDokJ78au1OanJ/y01AJiKTx1KPK+t5noOey6s733VowYXff9UoPVK34Wo1NperQc2L7wLhzXuGW5yQaXaUDnKkwSAGqNhYUitxIkNACx7Jwcu5/+uVFZW1Y57htuFcw/enGRSHd0Q91WKwsQhzWYT32/yooWvB9NgUiavXhb34ym9LPIVfyY385RCaeLLI9+LWxgltaZ+TZrMhDX/TspW6U1MiR74oOcELtm02rlVrcrY8dXGxFyNyaQpYUg+mPgjPtv2ojWFyBQc2Bi3OVWpBwCg5W/GLpogd2YUe79YujIpz+Q3IdpLk3s8O7fEJA54ZdFn80aIybaPyt21PO6rlDwy8j87XmP2bt3xh2b42k0xYsWP7328JUcLFAdMfOmQyfMWTZCTyuTVq9bGX9CaS+ZPOC72fi12OpW8ekPCkQucMV/vXRtO1xXu4IbFG46ogASziUMHTvkkdqKMAtDk7IhbvO6ggj84ejStys7IvKAlPcOnf7p4eiDdsvLK5NWrNsQfVzqP/yHx0yCqw6o1osncunTxhlQlPXiMlz73VJ5KzxcHRL3/2byxYhLaqKw3tN6g7TaEqTj12yWrdhzTyBf9/Kksb8d3Cbn0rM1x4ZychLivdmSrzABAigfHLJprTfyaijN2rFy3W6E3MXoz5TVhydfvDaUAGMXedXGbj6vMJj0DbkPmro6r7yzI06lJTr3DoqD614zCnMPJjBiKi7TVXPdhzw33u8/RUdvRkg3DSA0730HMdN8+0Ae1DzJf1xQByRrvxc0pN++9bKyuBTs2+wbpWMZxKuM4OQn5h6+ac8rN4724AvJe1F1zdNXb76Xyp3+/P+X/9qf+vDhIuTZmxpocBkjJmPlzx0gAgB8YvfA/Cb/tWhNJ5++JW5lUYAIAMBUkzH/ni2zxrG0HDx09dXzbdAkASYvpVsapmNxv33n324KAT3cfOnz89H+/jaTNwBe78a3CkrN1fmyCZshnu1IPHd79iSx/1ezFiSoTJXtxwTsjhAAc8ZDJi7fs+XX3J6M5p3YsXpdR3t5R8omfvDNCCJqMb1f+lOfsJ3O3ukN9CchjE9KOpqbvXSpX7VsVt09pIiVj5i+c7M3hyMavTvhlW1yUTBr+3tJZ4XSzhN5Hk5dnyRbuSv2//am/bZvtlr3yjTnblSYA2n/yvOmBfABSFhHz+ff7D36/MEif+tWybzNvizZIyZiPPokJ5tf/fwdVawod/Nq8iTIOAD1i1urEtBMHN86Sl+x4b0bcUQag9cq22aDtNgTpHv7OotdkHHPurlUbkvUSmYQCgPKMuPeWp8KE9YmHDh/8PoZOXfrOF0fKAUyKHe8t2A2v/efgoaPHf/tmDF9vNgOA5o/ls1de8Fv68+HU9N8T5spAb0aXjJrk1Ht41EB3XrW2oEhr5rgPfW6En5D94HSo9WgEHqUP9LVVYhu/k3G/Jam6pjb1qonisJy59jW1wCIdvjxhnHtAN/eAbnXiFamATXFYqVdN1TV3Xw6TMvnfSSpx+CtDrM/mdOiUN0PJCwmbj6sa9qEkEqmYomjZ2DdfD+brCxQaEwCYVJmpuXq3wDEBYhIAKNmQcAmU5B1rJf/FqFIzFGbxkHCZMwAA7R8eKDYrs/JKTACgyYtPuQCBr7zoRwOAs1/UEDftsaQMVf3wP8l385bQFCX2j3x9oh9Ho8zVmDo+iu83+fPPYqdMnrdoZihNAikZ/daboVISAGhZgIxv1uSr9DYl9LZmMF6vTLQGPaR4xKzJ/qbs7VuzG5WDpKUSqTNFuQdGTR8tgRJlgd7WmQutV61V+LRUIqZIShr6+qKFo+nCgz+mNtS1WWX5Je00aLsNUYfkxYUrlr75+uyFsdFe+qyEVJUwdMpoGQVAikPHhfJVqYlZGihXZBWY+FIJTQKQdNDsT98JogEYVaZCA0KZmAYASjo6dtFoCYZHCEA1NA5xV1c9sOHuDh317fMa7j7eYNlcuNq7rt4DytqpblbnXrNM9+vyXE+SYEHVrVvTXLUfyyo+llW8EujUvzsx3a9L7jWL6ubdt2x5bkaBmXSWNcY1zpJAKUefm6poZSiI5HAATOZ2H3ttfia2TmQzaRT5JUDRYmu4BCTfneKYSxTlrbhmDocDYAJTJ46ipHKZMwAplgdL6qpI2uwjTSW5WYVmSiym6w8hhXKZG6hyMwpaG3SxxTxt0Fi1DqHc/MQcff5xxW1FoKRyGXSqQZs0RMu60DJ/fnnOBT3waZpTV0hKSIFepdKYnGVBYvOF72ZOnbU2MUdjImmaAgBKHCzj69M+eGXaou0ZBQxJOdOoR4ipNO/QL1nFBnthH0l3jrn0fynJx0sNDzpf98DOwH4oJb5/4mSw1By5anpe6tDwgyQ7ll2An0ev7iQAEFBTC8DnsJ6XOhy5anqlD4tH3EWMaDLr9Xrg8Js4aZJPUSQU6Dt6zidpbz8JnMo7doEZGkiBJjs+UcnxemWE1+0pO4oOlIm/P5h1qoSRU5RJdSwhQ8WXLxosIQFMJsYEoDm4dLLCKi5mzQUzCE16MwCnnYJ37qhyRfK+pIx8lZmkaShR6G01TwkDQPKbnJEk3SkOqJiHmIsi+RQFUGAymTrdoO01RKsPF3oTQEnie29k8esSn0oASbnJRMonb/me/9Wqtfu+/+jI93GyyNi4BVHeFD3ik23fusWt/D5p5amklW6D3/pk8exQMYrSU4yh+NSh/zt7zcxxHfTcqMDuUC5KTzxReOpwclXjvLv7JkKdGv65V+9reBATNWof1NSG6pravZeMvR3Zfbo11ovF5S05WUPYVwKAw60buyfSzo4OfbqxtZU1ey8ZJ8rupFU1GdtT+eMmyDl8PgfMTZ2bycwwJgA+vyM/Qvm/uXKJcva/131k9qNBD+I3t6WOlju3dphzaOyauSXvJMQtVskoMHH85iUuHO5tfXwmaYoD4sjFCZ+GtpQypj057MRRqsTFb3yUG7Biy2dR3hSUH1T9cVxhm++nKQBVU/ExmcoZM5DNROpBP3DqGQaAJFuN9Mj2G7S9hmgtUcjnA9ATvv35Pe/bdnEOfCXul6j3FUe2r4v7LmnpYi/ZjskykpKOmLd5xJsFmSlbVq5K+u7jb/1/WTmCRr/8lKpRYeah/eevVXPdhz03wk9IAoCzbPhL9kcSMwpzUpOrw8cMdefd99GkVmYodObnsY+SID1w/tJYXLrYN32olNjr3ZjyBi9rV22qqRUCgD3LLlRMGqtq/9JYPKjOGoFRZBxThI4DoCQyMRxXKTTMaLHVs5tUCo2ZI/WTdPgjWuZCcrI2cOnXNngcTfa+VBjz2Te3v/6ApKVSGvKVBRpTKGXzs3SnjmJKchV6vnd4YDu/CzYBkK2lraRCyFepNCaou4peVaAFfkCg+OH9xJgpyVOZOdLA1huogwZtuyFaOxftL+H/eEqZrwFvcfMyKHNVfLk3TTrLxsz/jNS8POfYBY3JpClQmKRyMUlJgycsXmtSRq5TqvQmwMTdU0t1tX1Xz/DnhjeZ4c126j08CtL3Z2mrqp/EH0/eF0Fqa4od3M8ZDbcsNdcMNUPdmz18zxwqnNS/0XnY2YFTk9hlqJhztNjsxK3p5EO26oKiHMIBgJK9Mjvi4OLUxJzJ8qE0gKngj4QMlXD4++FSEtod0jCp/tiakJXHMS1blCmmAIDkuEkDg4aEym6b9m3KT9qyN0/hvGGZWUZzAIBDu8v8hgwOklIAtF90hNe+7zcs3iD9fFaoOwlgYsr1ZAfDD505iqRlYk5CTsrBzMAosb4gK7txOgDJoWnSnHVBqTHJWxE2OnDKrMHH1iX+oRg9XU4BMPmpCVl6ydgJQe4PTY5ykxOyGK9X3gpvfTp1uw3abkO0gjhoQrg4LemrVT9KP33FnyYBTOUaPUXTTO7u9VqIe1NOAZhMeg0I5QES0qQ6sDXRe2HsWDEJYCov0ZOScLkQ1eiphec5KOqtKja7pY9mO/UeMUnSyob7kuRqEQs1BkxQawf3Pk6yn//eXLh3g0C2r6+tqXIW3TPHdPFG1YkSc+QzDtzmY0L2LFYXB3bDP54Du2mik82yE3Vh/Zxv7ObA8nJit/Rdu1eu2vBbZom+uuR0RvqBvbvjE3bHJ+zevnX9psNKfv9XxoeKSDbV5x9jgviK5L2/7tnxw+ZtSbldQv/1SeyLvUmTMnn1qh/+W3Kz/HIRQ/v4886tX7n2twsV+pIijfDZoGelUg9OwX8Pnzh/ITcvLzcv78yfx48cSPgpmxwU3l/UzAuxnXv0YJ87fOjUub/y8nLz8nL/PHnscNLPSQr6H8N9u3UR+QRKzZfSdm34euOGf2/csu9MWZfeA/z5RXu/+HL7n2V67eW/mR5yn6pj/477d2qhXltUZHAJCny2j1+rR13atXztz2fL9CWX/7pqoP18evLY7G49vF00ufu3bdr+67HL0Kd/t0vHT+VfvcH3CfSViviq//6S8uueXw+eKOJyinZ8uzVVUVHxt+JckZGW95f29Bk5ygtOp/y6Z9eWjdt2HbjgOGrhirnDxSRocnas/mrvOU1FUX4JR9pfov89buX246qbNwqKTJKQgT0bE6mm4oxti7/64VihvuKqQqGCHs+w//d1O1Xr3Szgrb6Rm5Rw7HzeH7/u/HnXzu0//V7gNu3LL98ZTAMwubdXFtpu0HYbIrTbn/9ZvjFVqb926cIltb3UX0aTAF16BMppjeLwjq//veHfGzdsP/hXBS0PktGkXpm8ftm6hOTfDhxMP6mSvLb8oyhpFzDcyNyx8ottew4ePJT631z28AWfxAQ7s9ExP8WwWKxObrgnlJepWKw6V2lnB/ULdg0LVpmyClL96sbd6p/+W/nf25dbrLRTFyvBho/L1rbxCYmG/231qxNNtrbcrbqqsq88+F5Z8Kq+OlNtZt9RZrOqtnbQg3/btyl/x+zFeVFrPhvjXv872ZyERTFfKEds3BUX2iyLx2SveWed/q2vFw9t/Hnmt++9u4N5bVvCPDm+YK9dMxdsf+Ol1aZ3En6O8b7rYAMbAnkqOJ+bac92sF2QWux2N4L0EB7A7sfUBg++vTuf+xh9D0lzZPNPSvHCIHeyMTUmltAkp4QkOS1c6oENieV+q/0bRYp0l0gpEkwUiQkdWzDDvXi3DzYE8lRxbz90ZGtMeL+15IH9/MgOgGVndwf/HsrX+UxmvV5ToGzyO1hN1vaNqRA4eYpfy0dts1mvUSobf/VpUv2xdUsOf/j0CPzh5IMVNmwI5CmXqPt9SOdSdrVtzORuJWXXSrKu7me91oV7m7J7/Kh7m1munqRpWuzmRpEk7Tf8xYjQ20fIGWXy+lUbkhVA03zKTSymOKQkaEzE6GD8jUoHNlb9sW7pyoTjKrNQNmz4lFnzXry7rylhQyBPBdaUHTQfH2qRuLNm7qCjlB3clruDeziGdK8Eqba2tqba9FQLEoIgyKMqSCx70s7O7sELEutuQq3Oz83DtkYQBHls6KzTvkvhYN2LEqPOIAiCPOXSdQ+EgIV2RBAEQR4FbBKkTknf/ftUBoIgCPKohESdcfU2ish9jJAwlYcgCPKk6dD9dOysx70CCIIgyJPhxllPZK0QBEGQx85d46QGBEEQ5JEABQlBEAR54gQJ03EIgiBPFffW7WOEhCAIgjxxERKCIAiCoCAhCIIgKEgIgiAIgoKEIAiCoCAhCIIgyD2D/RCvfT43ExsAQRAEefiChF+MRRAEedR4iKECpuwQBEGQRwIUJARBEAQFCUEQBEFQkBAEQRAUJARBEARBQUIQBEFQkBAEQRAEBQlBEARBQUIQBEEQFCQEQRAEBQlBEARBUJAQBEEQFCQEQRAEQUFCEARBUJAQBEEQBAUJQRAEQUFCEARBEBQkBEEQBAUJQRAEQVCQEARBEBQkpFNYin7/bNanPysM9/cyhks/f/jBZweKLcDkbPxwXtwxrQW0GV/Pe/f7HN0dnK7xJI8ljdZ49HnMTY0g9wz2k+P2tWeSExJPXyy9bqwCNuXi0aN3wNgxQ2UU8ZCKczGzkO07QCoAwjVkyvu9ea68+3tFnjgiZpZB4EKAsWN3XXQ6VyMO6C8i8BZ4+FB9oqbPtgjvrKfe46a0qE9s/DpBM2Bm7Mt9eE1WfvN1gq75ysfTSTTclQhGSPfxebhgz9eL1x8u5vUeOv61N2dPe3Wsn8iSu2fV6u2ZD+e506I7n5KYdlFnAQAgKI9eEuF9v5N5wl4SD9oWv2QoTktOySwzYP9/NOC5SqQ97lCP7nFTEqKASZF9dJkJB5SGBi+e+du+K9TQSWMebzVqcVciGCHdLzm6cnjn74XCsFnvTelb/+gzYOCw4L6J6VrC0nDnntjz6/7MS1ojmxL1HTjpped9hQQYzm2M224IHUXnp2Ze0lr47v3HTJoyRMoDAKYg7Zc9B/KU2io2JfYf+/L4Yb0FBGgzvl2VSAT4MqcytJIp82eGcq9m/Lbv9/PKq9ctXJc+of+cMF4uLP191eLfigHOL553LOzdBcOU6+MyJHNiX5XxLLpLR3b+cuysSmtkc4US/7EvjR/mzmuvGPXFP7tj1Zbrw2NnDXUlwKBMWP5VKjy3YFmklABLadr65Rku06Ng94/K0HcXjqXatRaTs3H5piwjwHcLz/Se9PmsgcSlIzuTTyiKyxgQSgeMmhQ5tBfV8rE544f1O7Xyme9M8OXqFGk7d6adu6qv4jpJ+o+ZNCnEo4WfsjDnfv9lf0b+VbWREHn69B/2/NgBojZMyiv9fVVcmijmw5j+1osy57as3lI0YPYnkR663P3bfzuqKDNWcYVewVFTIgNdCbAoEz7dcFEWLFRknoPg9z55WVh6LHFP+rkrZQzw3X2HjZs0zKdtVbY2X/gw9qkDZ4qNbKHXsEnj3XN2/nKiQE+I/J6PeW14Lx4AGK4c27PzcE7BdSNwhVLv8PEvD5dRltLf1yzPFA4Tq9PyjP2nL4jpy9O0VsJmplAmfLpB6TvGvSjtxIXrVVzxwEnRAbrDCQfyyox8SVh0zCS5kGByNn6+XTfm4/eHQOa3qxK5o0YSpw6cVjIglIZExbwU6EpYipJWxeX1eT92Qi8CAAyK+BXfFA+JnSY6ENe0KYfyylrr5GAoOrlvT9r5Kyqtxcld1ndgu5kDgh4wYXzeqp2/Huo/a1wvnkWTty/xknDYrFFt9V7D+Z8//aF45PvvjRQRAKA7vfHTXyzj588MFbawhfZs8s87M86rjVyR99Dx0c/3FxIAuiutNV+d3f7ZpzT96F9lRq6LfGz0pLG9bwts2rlJW5rR35LW9K78aEpvorXmu72V6y5quPTz8m8vyt5ZOKW3tb/rzmxescU46pNZw2kmJzF+f8alYqaKTbn0CR4zYfwAEWFRp21YlciP+fwNHx4AWAr2rF5/pvfMT14WnmnhQ4QoRE9ShGTRKs6roffQkc37KyEKHB8dYU1lWLQntnyboOCPmvPxqi/fHe/LnNj4w5Eia/hiYf5KO8cLm/H52vWro0WK3/akFVvAcvX3zev3lLlHvbti3cdzotzViZu3Z2gtAECARXvpomFAzOcfTgoWGq4kb995nhg27eN1S9+b0tuY8dP234stPUa+tzBUyPWMWrp2RX33tZb01JbN+68Iw2d+vGrd/Cn9LTk7N+87y7RdjCYP0T38PAjtxVIjAFg0l5QGJ6GlUKmxAABTdEnNE/uIHGxMEPnHvD/JiysMemvVd+8OpZlT23ccKvUc9/6yVSunhwsuJXzzS3bzMSedImnLzmLJlOnjfCmDImn9V2lG3+iFX678aOYw4ZX4TdtzdS2fD5ITDpRJxr+74tsvPo4JJc78sr1tk4Jr3wDXKmWmsu4kuuJTCqMoeICHIXdn3A+niOCYT5auWPraEOL0zm+SLhrqBfKsSjj+3RWxYzws5xM3/lZAj5n9+coV74/xKE3esuWkup0nYAIs2vMninpPWLZyxcJh1JXD67/J4I19Z8W62Ak9ivdvz7hqAdDl7tz46zliwJSlK1etnDaEd2nfxvhsTd3BFxW84e9/smBSb4GunRI2xajMzOONnL5iXewUX+OJrRv2lXq/umzlioUhkPlrXes3K15eqsLl+diV6zfHjuKd3rm9neo0b0oB03ont6hP7fz1PBE6ZdkXa1bPGicrO7Tll3PtDSsSwuCXxsu0R3dmFOi0OXuSzgmeGz9Wwmun99ry1KhI+uabjKr+05Z8+XFMKJzYuCHhLAO6dprPqMzINAS/9vHmtavm9FYfiN/fchS2/Zu0pRm1rs3vyjabr3krN0mJD+zvwpw9ebHOdMzFDCX06u9Dw9Xff9j++3WPqHdXrFv63nhPJm3HlkRlezFrcx+CKvSkCRJTyoDAxUNAtBOqn1BAn6iXh8pEAloSOP6lgXTZiYxia6dhiwZEjJV7CAiC597HFbRXtAZL2amMMl7wy+NCJUKBqM+wl8YFc5UZp+tuFbaTz8jQPjQlIIDXK3L2snenhEqEAqE0eEy4jK1WFLc1hmPRnD9xBaRjXxrqKxII3P2jIgNo5nxmsa6tYjQ9WODu42q5erbMABbtlUuWHgPkrgZlkRGAUZ8tJnrIPag7s54wIGb+x+9H+vegBK59h0YNEFlUSk3jlQ2lx7ZvOU1FTZ8ULCTAUJyZp3UNGR8l96ApD99h46P6WhQZ5zXNXKZRpzVaCELgJODxhL1Cpnz++cKx7kRbJgUX/2AXw5XTVkXSFZ2+aHAJ6O9iUGSeM0hGjR/m00Mo7CEfPmmMhy7vqIKpl+fQUf3dBQIeIeg9/pPYOZMGeNCUUBYyaqQESi+p209gsd2HRoX0oSlhj77uArbQ97nw/u4CgUsfXyHoirUG0CkyL+pcwieNsdpk+PhhHoZLp65o6x5zQsMCegkFPELXbgmbXk8oa7wEl+0ycGzD1Y3qUsZyW/GGRA3zceURhFAicwKNirEtw9R2JzdqdRYLwRMKeDyByGfsu1+sfsO//UEUQug/6WUf3eGt32zec5YaNSlUyuug93aoR8rMPC0d/PzYviJa5DNy8oyY53wEbGiv+diU73PPh0qEBCFw9fYgmLJSYzNLdHCTdmDGdpuvsZWbPhN6BA8QGc6fsO6ju3TqCkhC+wqh+FRmMdH/n1HDJEKBUBoa+Xx/rvpMXkedsNGHIE9ayg6gWavqzny/Yv2ZOsfA9p7y+XS5RqUz6i9uWjRjU+NuXMF1I7gAEASvfjyZAIIAsFRVGbRanVGb/vV76U2fR8sYC/AACIISNfQjC1OcmbQ/LV+prZMhtpcFLG25DJXOwu3jyq07mHCS0sQpjbbK4tl6MZo/Dkt8RVWZSq3BRau4zvMd46+7lKAo1vlyzxVZXIZ5UnD9DvVccyllz+FcRRlTdz0niaWhwHl7vrl01fWlhcPceQBgMWo1jPHq4RXTDzc5gctVHQykm0ic75hRvj/s+2zxuWf9fPr7+fSSSHpQRJsmJfr4DvBITMstYvx9oTjzkqXHcz40MGe0jFG1c9G8nU06q0RjsEa1XNqpsQEUafsOnL54VV/XANz+HfQVHkURBAAAwSYIgiugeHVGZxNQZQELo9FaeC4NTUwIXIQ8i7rIaOkBQHCpOi9lYTRtlbBFNoxgC6wtTgDBJnhcild/dQAwtFI8YYMfJAgAi8XWdmyjkxN+A6NCLm7/YfGHaf79B8h9PaU2jGgStN+48adXbTovfHm+NY3Zdu+14RnfYtRqjATtXnddgpIGh1iFqu3mI7gCqtEQBFhaWKL9m7QDM7bdfK5NW7m5TVz9BvY4vD/jvLb/AFCcLiZ6j5cJCUOxVgdUcINFucIeQkJRV4w2zdvUhyBPliARVA8KMouv6ix9eAQACGRjZiwcYrRYDIrDO9MaH0mGvB/7qqxFJzGo23mQHjN/4Xj3Fr1GCwAEwW5MGvywJdHoP2n6lP6eIoEx55vPt9+vqQKEUOZJ/X6puNS9oJTtPtLFxeACiZfKSrlKnVDeiyLuTJB0uTu/ir/oOmxSbGifHkKiNGlV3On6bVVV6kLDsxLelfQjCvmrvlSdm/B66eP3hwjbuZt4kuFzlg01qJVn87Izfv3mR2Of19+f2b9NkwLhHdDj90OZxboecEphcY/qKyRADcCl+k9ZdtuzvEVZ52HqEkG/bdxymhcaPXuOtwdNMGkbPku8z72NaLxnWi9hK4fc86SApa3n7tY6OUBw9MLgl7RF589lnj608Ve1IHRmbLSPoKPbytWTYheLety7eaoWAEuzp8f2m88Gu7V9k9pAq81nKc1v0cpNb0GfYb33b8/MKfXkZSrZsskSAYCu1XqyO9GNkCcrZUeIfAd4QGFqYl7djDqeSCrr7ePbt0+Puqc5ghYLCGNxUUPUbjFotIZ2njx5QqEAmNKyxgN0Wl0rBzDFijKQPff8sN4iAQGGsnNF+vbGLwRiAWFszDxYrhdoLDxayLXtjifovu686zlnTist7j40j+faW2gozM7MZwS9+7jeodMwaC5dtQgDxj/n30vIIyzaK4XaxoQjmysdEzPnrSnD2Ke2/5KtsQDBFdJci6awMR1hYbS62xTYwGh1FoIn6hM88tX358cEsZWZl7RE2yYlhD6h7hbF6fNnTl60SAbKhAQQFC0kDKqLjclDg1Zze+7KwhQVMzzvUVEDpDSPAONVhdp4t1OorJcuU9fPxbLoytQGrrClX7axhPcKLgGWhhDBaGBu74xtd3KLTqM1WAhhD/nQ8W8sjP2nh+58Tmmnn5va7r0EEGCxVNVflWEMVbcdXNdz6ue8MgUZvx85q75+N81n603aTit3tvkIoSy4D6/4VFpGdhGvT6inAAB4lFAATFFDgt2oLWIsAiHFqxPUhkYz6hic3vc0CBIQrsHjozx1WT8s/nTzvkylVqe9evbkvi1ff7ElD3r5uQsIQtB3oAyUB37df1ZtsFi0Z5PWL9+8/0rb9yThEhDqbvkzKSHtktZgsZSe3hm3elPa7ZNrCS6PbSktVOsALOrsxN+LCS4YrussAASbbWG0OkbXZI4pQfcO6AUFB349qtDqdMXZiUmnNEJ5qKetk2l5Lj49LMqM80a6t4gHhMC9j0B9PlPN7tW3cz9CIQiCAIOOYXSMhaB4Fqb4CmMBi06RsT/TQLAtjK6qIdtEAK/P2OhRgvw920+qLTz3YD+R7nTCnpMFOovFUHx04+o1W043H3U3FCR+/dnyH44WGQDAois+V1TFo4VcXjsmJSjZAInlfMrv+SAb0IcGABDIgn0EZSd2JmcXMRYLU3Dgu1Vxv5zT3J7g4oKhTKkxABiupiUd1RBs0DOGu7rxBbLgPoKy1J3J50oZXWnu/p1pakHvgTLq9t1sKeG96eECFyHPqDxbZgCw6M4fOXDJeHtT8lrv5BbN6e3L49bvOa+zAIBBfeWSFiiRgACD8ujO+BSFrbMS2uy9hJOUBu1ZpdYCYNHmHMi4WtVa1BzsJ9Sd3peYe1WjPvf7L9t3ZigtBPdums/Wm7RZ9rThrrzD5hP0HujLVaanX+T5DexhzfW6BwS7W878lpih1Oq0BRlJ+85UeQQP8CAILi2mLKpzRQYAMFw5eeiMvgoV6SlI2QEATzr23Y9dkxL2ZBzalHcIgCsUe/SQhM98ZWB/EQ8AQDhwyizDzvj9az47BGyhR1/5pGnjZLxWUvj1Pddj2LQYXXzCnq8/2gVcoafPsMkxI9150OJHp1SfsSP7fPXr+rkZAPw+L0+fEnMpYeNva+LgvTkD/HtkHFqz+HzQW/PGNsZyA2OmGbb/un/V4j3Apjz6jpozfXh7xWgB5eHrbjmeR8ncKQIAnDxcCe0Fy8D+Lp38fQjVJ9Sbt2n3ivmZUZ9MGxV6esuuz2bvArYoeMqcafLff9i56fON8K+BTVNwU8acj/tt+++S2WMjY2Jg5574L+b+BFyXPv2HTRk/pLkc8qRR0yZA8tGNi3eqjQBAeT03ZXxvARCCNkxa7+yqtv7JDhhfP69JIB8/5zXYnrR1cTqw+e4y+bg5//Snofn4HCHsP3Jo2uZDny04BCDs98qMmAGntvywc/kGy/yRd6FI8kkzI3duT16/6DAA1+XZ4Jj3I/0FYDG03K31Et4PBH3HTQn9ec8PK84AgLCPr5+L5vptTfluRGudnIABr8YY9x9IWjFrA1MFwHYJmDRtoCsBmrKcjJNGOmy4jT8eb7P38gImRRdsT17/aTpYwMXX20d4+vacIk8WOWcO8fPOn1YdNhLC3gFTpo/rL+QZ2mi+2DG2FMi2m7RJGVwb78oFM1tvPktpB65GEurnkp5BBA+o/7UD4TFy2hTdT3u2f/VRFbApT//xs8aPdCcACNnIV6OYhO1xiwGqBJ7y/mL1lSrUnHaxUxcrAaC2trbFhqZrGpZbLDT/W78AtXV71G9tstB4SE21qa88GBsAQZDHCd2ZHV9sZ0bFTh/q+qTOSjifm8myJ+3s7ADAzs7Ozg6aLNctgHUBGvepW9/8b6sLLZabrsF32SEIgtiERXv29+3b87jBIwNccY4cpuwQBEEeDnWvOBH2e2XG+N48tAcKEoIgyEOC8p/55aaZaIf7CqbsEARBEBQkBEEQBEFBQhAEQVCQEARBEAQFCUEQBEFBQhAEQRAUJARBEAQF6fGEydn44by4Y1oLaDO+nvfu9zm6e3bCB43h0s8ffvDZgWILAFiKT2xZvWDavz7afqm4k/UyXPll8azPU4o6VwFLadqqWZ9uP3uPP8txjxqlHl3ulvkffJOmfUTffmnRnvjqw4825upsMvjvn8369GeF4f6XSpnw4Qef7VEaHoUWRJ4E8IexbUL1iZo+2yKkCGjjfcgW9ZnTV2m/wB6P6K+2DUWnczXigP4igieOiJllELgQAIYrGSlnjPL3Vk7wpUD30mxXtkjweDaPb0PhGxtCl7l5xU4Yv2x6oAA78P3vV2gLBCOkBwbPVSJt5+tklrITB5JPFBkf1TfKG4rTklMyrW/j5wl7STxoAgAsBsYITlJXLgFACNylvUSP6UtQGgvftCEINkFweegpH1C/QhCMkFoTB50ibefOtHNX9VVcJ0n/MZMmhXjwwFKatmZ5hijKT5eWcV5t5Ir8np8yjEj7ZV+WysgVD5w0eXyoO8/6gZmdyScUxWUMCKUDRk2KHNqLAmByNn6+XTfm4/eHtHZXXvr506+PaQEKFs/+/Z8ffTJSWHRsz87DOQXXjcAVSr3Dx788/LYv6FhlLHv76tTMQqaK6x70z0lThkh5AMAUpP2y50CeUlvFpsT+Y18eP6x3iw8cazO+XZXIHTWSOHXgtJIBoTQkKualQFcCAAxXbr80WN+7BfDdwjO9J3068uqG75Wh70zlJcX9eKkKYPsH8/aHvTuzV/JXe/jWj2ZaNLn7t/92VFFmrOIKvYKjpkQGuhIAFt3Z5O3bM85rjVyR98D+3Nvenm8p2LN609m+sz+J9CDAUvT7muW/McGzFsT0FQBoMzev2ske944EAAyKwxt3ZpxTGwmh99Ap0c/7CgkAMBSf2PPr/sxLWiObEvUdOOml532FBBjObYzbbggdReenZl7SWvju/cfUG6pZwuezPfwpHw45t7qxId4dR7AJggAAg/LIzt+OnlWWMYRQ2ls+7LnnQyUtpNeiOZ2w8ZcTBXrgin2G9W38YoJFm5MYvz/jUjFTxaZc+gSPmTB+gIhopwla734t0F05lrgn/dyVMgb47r7Dxk0a5kMTYFEmfLpB6fvPPqXpR/8qM3Jd5GOjJ43tLbAaZ+eOfZkqBviS/iESQ1Vr38S2aM8m/7zT2r29h46Pfr6/sMX2VutiKDq5b0/a+SsqrcXJXdZ34NgxQ2UUAW11gwaYZv1q2RgAsOgu7fvqh1N/XTdyxfKolyeNtH5ApOMuDQAARuXvm/dnnC9mgJIOGBcTPdCVsJT+vmZ5pnCYWJ2WZ+w/fUFMb2PmrzsTcwvU+io23903ZNykMT5E3sZPfyEmfRgTXHerbjojHL/s3eGuBFiU+5ZvOOf77sKxlqOt9YHW62hRJny64aIsWKjIPAfB733yshRfV/cQsJ//3tyHcuHa2mpnkfs9emZT7Pv6q//ZDYqePv3loTKy5OivfxS6BgSKiJuFJ45kX77pNmbKlOiI3jczDx48cokV+nJMzPNBTpcO7r7QNbhfT15F1uZNv13rG/2vmPEje5NXjv6aUuI8qJ/YwaQ+lZFr6j10UE9QZR49T/oP6ydyaHg+F/oFu1z93xXhax99OsW3283c7V/tVPAHTZ4TM35kL5Yi7bcjKufAAeJmfdqkPpVx8q9SU6+RU2ZGPycznU05dMrgFezbVf37hq/3MrLxMW9PGe4n0GTuTVbwB/SX8Oyb3ril2enH8ouJfi+9PW3yK4HkmV/3nOniH9yza+uXHjRgkB91Mbuk17QlyyK9iIqzR09X9Bg0auTIoT2Ks846RX/+0ZRBzpai+nqZcn9a+cNZp2FT3p4UOcyTrTicmMZIB/UVGnJ++CqpVDJu9vuvDpMYzxxIVzKUbNigZwQNRbMn7VWZGWXdgvv15NVUnD2cfqkGakjZIFk3e0aZkpLrMGiMvCo37cxlDekX/WbM+MDupRlJv5d5DOonstee2Px1QqHr82+/+VrUANHNnEN7c8A38BlBTXlu2rHThdD3+clvT54w0uXKnj2n7PsG96GaGcRa+JEjRv6jsSFcBO7P+PQS0cTVxM0/nXeJnBkz5ZVhPk4lx3amlksCfWiiacL1+LffHbr57KsfvBM9zLk8LeVkSU03eWiwhChJ2bTpgN5r/PSZ0yL60+WnElPOWLwCfLpVtdEErEutdz+HZnJ0fvdXuwt6jJv5rwkR/lRZxm/J5yn/4J5doeJc2tE/L91yGx39xswJo/qUHf7pqLZXoB8NBYmbNp8gBr79rxkvBVCFRw7+eR3EA4Y2P61BsW/NuhOc0Gmzp4/yts/f/9NRraSfD6/4+NGibsGhfjRcbbUufUynNm896fDclDlTxo/2Exkyf917RRTcdjdoNBsp8m/SrxyYc2lH/yqs6DZoQsz05/vzL6XuyWb6BPrRcNWWLl2UefTklXLWs+PefmP8MPfrJ1JSzvJ8B0m6GopOHPmz2CIZ8/a0qEFuxJWkdd9m2/efMPOdCRH+VHFa8iEF5T+ot/2l/+UY+gT7CwlD0dGUPxn7KnAP6u9OWq7lHDpSJhk7tGvGD630AeJ863W0rziX9r9zpfbe0dOm/9OP5hP2T68qlJep7Fhs/PzEHecQMvO0riHjo+QeNOXhO2x8VF+LIuO8xvrEy5UMe86/l1DgKvHpwWfTA0aF9hUJhB69elNQdlVjARAGxMz/+P1I/x6UwLXv0KgBIotKqelcQkKnyLyocwmfNMZ6kuHjh3kYLp26om1t6KP3qKgQKU2J+o8c1Z+rPXtarSs7lVHGC355XKhEKBD1GfbSuGCuMqPFZ1it4az7kKhhPq48ghBKZE6gUTGWzly63fKfM0hGjR/m00Mo7CEfPmmMhy7vqILRKU4rDe5DrAX2HTZupCebfXti09uDKLtYZAQwXj3LCIMHuFuKizUWMGjPFVlEvp4UAQBsj2GRz/cXCWiJfFhfoaVMqbNYdOdPKKBP1MtDZSIBLQkc/9JAuuxERrHV9GzRgIixcg8BQfDc+7iC9orWpibhCT16CHlgMeqMFiAoWsjjUR79X1749ScTZLzm4VH+qSLoM3ZMQA9K4CofNX6Ai7VqluJTmcVE/39GDZMIBUJpaOTz/bnqM3l1X21vpQna7371CHqP/yR2zqQBHjQllIWMGimB0kv1X4JnU77PPR8qERKEwNXbg2DKSo0WS3Hu2TKB73Oj+osEtHtgVKS/sJWer8zM09LBz4/tK6JFPiMnz4h5zkfQpIXarItRq7NYCJ5QwOMJRD5j3/1i9Rv+gja7Qfsm5/Z6bsLIviKBsE9waB+etfA2d2kQyqOe8+9BCXr4PT+2N1F6+mKd3QhRaFhAL6GAZ1Fm5mkFA8aNrzPduKjeUJR5TseVyITGIqXWAhaNshh6D/Gl1IpiAwBTdElLePr0IFrtA+3XkdcjdFR/d4EAk76YsrvzdJ1Rq2GMVw+vmH64yVqXqzoI4AEQXIGASwAAsAmCIAROdX3NmtixWH3TpZQ9h3MVZUxdQspJ0sl5ZIxGa+G5iOpTEoTARcizqIuMlmBo0bO5tERY5xi5QlchcZZhGK1WZ9Smf/1eelPdKmMs0OJggkcJG+4UggCwWNq5dH92p8rPGFU7F83b2aRnSDTMdWAsPKf6kxNcVxcBUdzyaIG7vAccUpQZZHCulHAf5icqPX+xyBjQo1CpE8plQgIACErUMBpHsAGqLBawaFQ6o/7ipkUzNjWxj+C6EVwACIInrDuAsNa1qjPf2uRJRj7nv/G39R9e6uPrF9C/t0TW26N5wshi0OoslI+rtW8ATyAR8TKNAGBgtDqggutbCbjCHkJCUcZYQNBqE1iMTBvdbyDd3MiKtH0HTl+8qq/7nim3f0PDcgVU40kJsFgsYDAyBoLqUf8tYJ6Tu4B7rpWebyRo97qyEpQ0OASgyTdP26oLuA+MCrm4/YfFH6b59x8g9/WU9pIIeW11A4MF2vmkLJdydeESLQpva5cGrpMHzWvoXZQlX2uwAA+A4FJWVairo2d9lEZwaRfKkqfWwUBZbyrtUrEulLhyyUAP6NO/8FTiJbXBnTlbDL1ecufxiFb6ALRdR+vJnVCKUJDuHoLr9dLH7w8RNu9NHX2N2Bod5O78Kv6i67BJsaF9egiJ0qRVcacfVKmbxD5j5i8c7/4QbwYu1d86mNTUfurfbTmU8vAVGjOU6iJjscXleVcXbg/iqEKpNpxneJ5SmgBd212N7TTk/dhXZS2y9Qb1XVeH12NIzOdDJmmUF8+cPpG4eafGPSp2VkQvXjtt0I5gd3SftN79mmeVf9u45TQvNHr2HG8PmmDSNnyW2OT4u2l4C4DFtno01oUQBUcvDH5JW3T+XObpQxt/VQtCZ8a+RLXeDTrqxa1f+m67NEG0ZfOq+tC8t4TIu1h0na24zpN5ilwJoeGksrRYe8XiMtadB0C00gfe8mmrjhbl3TYEcg94AlJ2BFdIcy2aQrWh8WFUq7M152bQXLpqEQaMf86/l5BHWLRXCrXGTpeAooWEoUytqwusLLoytYErbG2GnlGjrM89WZhSBnhCihIKBcCUljH1YZlFp9UZLPf80h2dRHWxMVFp0GoYi/XJ3aJn6gpjYUrLdK2UixD28qZ0l05lXjK49hbxeEKZCxTlnTpbxu7V173tkWGCFgsIY3FRY70NGq3hHs1ZtOi0OgPwaIn/yJdnfvJOOF126sx1S7NwUyggDFpNXWMbdMq6/sOjhAJgihoyhEZtEWMRCCne3XQ/C1NUzPC8R0UNkNI8AoxXFeoOZmfyuBTPwmj0dXsZrhfrjG1duv7HU0xBxu9Hzjb5KVWbdbHoNFqDhRD2kA8d/8bC2H966M7nlFra6AZ38Dhgc5c2Xr9abyuL5rqR4ApbZMta1tHClJYxhFAkIIDn7tMDrp45nVvEdu9F8QTiPoLrFzPzLhpEPr0oovU+oOfdqzoiKEhtdX/3YD+R7nTCnpMFOovFUHx04+o1W1pNWLfmT3gUz8IUX2EsYNEpMvZnGgi2hdHZkh9iE1DFlDIGnYEnC+4jKEvdmXyulNGV5u7fmaYW9B7Yyiy7KmDy9yeeLtAw6jPJ+zMZYX8/kcAlINTd8mdSQtolrcFiKT29M271pjRbp9UK2ro0QRAEGHQMo2M69PICWbCPoOzEzuTsIsZiYQoOfLcq7pdzGuD1GiAhlIf2nCzQMOqzafvTyqpal5beEl7xqTNaXi93igCea2+h7nzuFfDo344eASHoO1AGygO/7j+rNlgs2rNJ65dv3n/lDqYTNzZEvdcqPvpN3Ipv0gp0AAC60vNKHVtYn52rL7O3vEfVucSkE0WMrij3UGKe1lo3wj0g2N1y5rfEDKVWpy3ISNp3psojeIAHcVfdj+BxwVCm1BgADFfTko5qCDbo22sYwkXuK9RlJu0/o9ZplNmJyed0rWUmg/2EutP7EnOvatTnfv9l+84MpaXJU34bdRHpTm9fHrd+z3mdBQAM6iuXtECJBERb3aBF5NJxvyJs6dIWALBA2ak9h3OKGF3R6cTE8xbXAc0mnjSr4+mrOkatyNh3QEn0CvahCQCuh6+T8ezJixaXPjQPCErSg608k8vQ3n1ooq0+ILSljmDRnkn6eedJNSoVpuzuRJFkkTExsHNP/BdzfwKuS5/+w6aMHyIiwJbuRLiGjAo9vWXXZ7N3AVsUPGXONPnvP+zc9PlG+NfADry4ZGB/an3yVwvPhL33ycuTZkbu3J68ftFhAK7Ls8Ex70e2lvdgU14hAYbkNR+UVQHfPeilKWMlPADesGkxuviEPV9/tAu4Qk+fYZNjRrrbOulUIG/j0lSfUG/ept0r5mdGzR/b4UnGz3kNtidtXZwObL67TD5uzj/9aQDwmxATun37r198sBuo3uFjB7gnKo2tPRH79IDU44S8lxMBAAJ3CU+fq/F+vgfVrumFA6fMMuyM37/ms0PAFnr0lU+aNk7GA+ikJjVviD48AMJ9aMxrTGL69k+TypgqAK4kLHpccPNZAYRo6JRo9ZZffl6cWQVO8jHD/EuTGQAAwmPktCm6n/Zs/+qjKmBTnv7jZ40f2V7qqa3u16yq/UcOTdt86LMFhwCE/V6ZETPg1JYfdi7fYIkd09ZZpWOnTdDs2L/+s1RguwSNCZdpUy1Vt196zhzi550/rTpsJIS9A6ZMH9efgsZMdet14YHLqzHG/QeSVszawFQBsF0CJk0b6EoAtNUNmmVoG/tVbGRbTethS5e2AEH5hfcq27N4kRbYlDRkUkzo7bctTzYmZkrVzj0/rDgMwHXqExw9e3yIyDoy2asvZchX9+rrwQMAnlDmAodV3P69hQQAtNEHCGHrdbQ0D7AVeScyxf5RIfjr3weLnbpYCQC1tbUtNjRd07DcYqH53/oFqK3bo35rk4XGQ2qqTX3lwdgACIIgjxTnczNZ9iRO+0YQBEGeXlCQEARBEBQkBEEQBEFBQhAEQVCQEARBEAQFCUEQBEFBQhAEQRAUJARBEAQFCUEQBEFQkBAEQRAUJARBEARBQUIQBEFQkBAEQRAEBQlBEARBQUIQBEEQFCQEQRAEBQlBEARBUJAQBEEQFCQEQRAEQUFCEARBUJAQBEEQBAUJQRAEQUFCEARBEBSkRxFTblyEr4/XqKWZDBrjUTejSbEm0tfHK2zR0XtzFdWBGSFevv0mJxSY2ttNc2BOiJdvvwk72t/tYfGIFw9BQXr8sLoGn8i1uQ03lUn544QBPl4DJm5X4o12Lyw8Z6jvy1vyW7GlqWDH1IBBU3ep0M62mOvxKjmTnxg36+XnAnx9vAYMjZi2aHs2NjOCgoQ8ZDeVe+CU1tx63KHKTM3Vo5ey0VyPU8lNBQnzJ3+y48iFEpPQjSa1ylNJK9+YvT4XswEICtJdwij2LpseGRbi5evjNei5yBlxB5QMMLkrXvDxGjB1l9IEYCpOnO7r2xhUFR+cHeDrE74sq/n9ZyrP2DLrhRAvX5+AF6avPqVp6ndMyuTVc14MH+Tj5evjG/b85GW7c1revJo/Phjq5esTsar+tKrEWYMaLqrJ2bFo8gtDfX19vAaEhL86e3Wq9YGUyVn7vFdjYUwFOyZ6+foEzEkub3p1xY8TfH28Xl6TY2q8kNcLcTkMAGiOfvycl+/QWQc1oMndtWx65ChrFaYuTswtb3LO8I+P5ByMi3khxHfA0AkfJ+YzwGQsDY/44Ige4MLaqICh81I1TWqTPGvYC0tOmcGcvSSif/iqLMYmI3RgxrtorON5bdSilRK0XU5GkbxizsSIQf28fEPCX52/PVtjaijYxxMHD/DxGjA08oPdOaZWdPg2c2nrNpiVx7bOjgzr5xv24rwdWfUNZyrO2DLvZWuLD42cseaP2yIQU+6aCF8frxeW7to6O2JQiDVDaFIeWT3j+cEDfLx8Q8Jfnr25voQmVdb2j6dGDLKun744IZcBAFPB9lf7efmGzDqoaZJRaJlsbFny/Sf37jiuB+Hw5b+fSj98/H+/rxnGB7iQnKJARUJQkO4CU8GuBVM/3HNcoecHDQsPEmoUx3e8N23ZAb14iFwI5oIspR5ArziuMFsdR64GgFFlK/QglIdKqWbxwMEPF6w9Uqjnew0OEuuPbD2iany6TI6d9sF3aRdUHL/hEYOlZmXWnmUxC3Y3z83TQROGSwCUGalWL1mcdyRLD5zAqCFupvytsyd/kZRVaBYPHj1cxi/PS/3u3bdXZmhsrCXpJg/yBFAqCjQmYAqO5WkBAEpyc7UmMGkUihLgSIf4mY6um79kz3GNJGrJggne2uz4T95efFAFAByS5ACoDi59b4OCI3ajzNrcpKWLkxQgGR49TMIBAL7fmNdixkr4jZfkyMZGDhYDAAiDIt98a7CYtMkI7ZrxrhrL06mNWrR08+2Uk8nd/MEHP6YpqYh5S97wM+UdXDljfrzSBMBkbpz/YVKeBtyCBsspRWL8qVaiILKlubpa5aggIW7lQZNYTJu1F5K/WLY5mwGA8tSlr89cm1wiHjv30/dH06rjW99599uW+k0CCQCFB7/aoXQePHqIGwWqxHmvzvnuOCONXLjkjUCOMvWrdxftVZqAyV3/7tsrkzTeb65Y88WsIWRe/PLZsQdVtvafFiX3CZn/f+cunD26IUpMAoDJKr8cmqZI9JsIClKHKL6f5Ofr4+Xr4+Xr4/fPVbkNqQdFYvxxPYDX69//uuOb9Tt+2fW+F4D2SPxxxj1AzgdtfraKYQqO5Wn5fuFBfH3+KUU5o1Fc0ABHFuTFb/ZcfzwxUw/gN2/Hz5s3bNr244JAfoMfPZ7whxbALfLbX3Zt+HJzws+fDuGA/vjuvcpmDobyihrhBVCY8YeSAdDkHszVA39IRKjUlBefkGcGjnzBtqRNqzf8/OuW8W4AygMJWeU21p8SB8ndwKzIUuqZkrwcDUcybLDYrDyWqzFpFDklAJJQf5ok/V55642FSxfOmzh53qLxXgB6RbaqsYh06JKft23YtG3LG14A5oLjCkYcGj3BjwIAt+HT574+QtLEHVHSsa9FyfgAHOmYme9MDKVVNhmhHTPeo8a6rRblLZ5Q2isn6R315ltzP1069/WJs2L/FcABsyJTqQdGkZyqBBCO+XLXjm/W7/h5dbRna269DXOZ6Fe+/Xnzhu//sySAA6DKVWhMoMpKTFUBRz5zxdI3X5n+yerZfhy4kPqHstUIhD/is207vlw8PZSvSk08pgf+sNjPP3194rwVca9JQJ+9L0Nl0isVSjMIZSMiRo8d/frSjb8eTNkbN1psqyC109CmggPL5yxO03MC3lk0XoaChKAg2QDfTeblVffPU9iYiyhRqgDALWiEhAIAIGmZTAhgVik0fHmgNwdUCoXqQkZOCUcaPnqEF0eTm12gVWQqzSAL8qeb3n0mjVJjBqDdJDQJACQlkdINuReFygxA+w2X0wAApFAmcQOAkoKS5s/RlOzFyEAOKI+lKMo1uX/kaUEY+mKo2KRVFWgAQDYi1OoJKLGfhA+gL1FobB2hoaWDZXzQ5l8oUOVlFJjFQ0YPl/H1+acUKmWuQg/iQD8xSXt70fq8hNh/9vfyHRj1/QUAMOkbx4A4kiApBQAULRPzAUx6xtyJ8SEbjdCOGe9NY3VUi3bLSbl5u5kViXFRg328Al5YcsoMYDIzJtCXlOsBgPa2xoiU2FvMt9000vBQKQlA0mIJDWBmNHqTSZNfogcw537xgp+vj1fACyvzzACalh2mrm/LhsjousIrVWYAfdoHw319vHwHvvK9EsCsUWpMtN9wPz5oD74X0d8r7MWYdUfyS5h7MLrH5G6eMem9JI33+BUJX8f4U+g1kfsG+wmqi2z86oR5crJuhODHyS+vyu3wqVAol7tBljLjWKqmAMRTAuRBIOFsyD2WbSrQg8QvUNz+06AZOh67bukSSGl41JCN2UcyUnP9mFwtiCOj5DSA3gZ/bzbXL7TuZ5xlgd6c1PyMjGOkwiwMH+IXqPLiH8nNyBQqykE4YrCUUiXPe/ejZK3b8AXfRMtIVcLSJSklzQrH4TQskreX/c6zpndtRtsai7nLWpiAyVg7a0GCkh/41hcrh/A1yes+ir/QUEwAIG2uVVM4DUUiWx7Nkb224v3whgcf0lnSms5x+HxOc4UKmBf3ph+/4TBaRpHUxK93ipN2xKcqVCXKY3tWHduzVj53147XOC1raeqESYpTt2w+pecP+3LNp2Pc0WMiGCHdJZRELgYATa5Ca7I+oCsUWgCOWEaT1jSXNjv+oMLsFhgkEYv95M5mRfKOI0oQ+g8WN38cJCkJzQHQlCg1proT1eeCSHeZmAOgqc9/mbQKZQkAuPnf7l/EoS8OFkLhkfiEDBW4DYn0cwYghdYwQZmVax00YlR5Sj0ALZHTJEnRfABgNBoGAEBTkFvSjsvW5x2Mz9bz/UK9xWL/UDdO4ZHtKQozXzZEQjOavHwtgDAwevTwoYEy584pToeD2TYaoR0z3sPGurNycjQXFEoAvl9U9OjQYD+3xgcFPi3mA4AqX6kHANAosxTmuzIXRXu78QHMJqD9A4OCA+VSPglAcvhkB4WXiDkAejOIA4OCA4O83SgAkuSTACZGD+6jYzf8sCvp0H+PLA+nwZyfkasCks8nAfSqEo3JWvKSTpTcPWr9qbPnTn2DaoRghHQvIGVRsyN2v5OSt/qD+QWBYpPyyL4LAF6T/xUhJQG8B8v4SakqLfAjQr0poCShcmFCcqEW+OFBErrFmcSBo4M52cfyvp33gWoIrVdkN/gkUhoxK3rHtB8Ld7y3gBkuIVUZicfMII58Z1wrKXc6aMJwSUrCsVMAXm+O86IAACj5lJmDD3xy/NgX8+flyWmzIjmpBDiB098MdQaSlMklkKc8HvfhKmYEZGw/1UY8RYmD5G7fFZaogBMUKqOAJP2CxLBDWQIcv1B/GkizxJ0DSm32vtQjev3BzdlmANAoMo4pZP7tGJBP8wE0FxJXLqeiX5swVtbE8/MpigOgz/5ueZx5wuRom4zQjhnvsrFs1Nd2GouCEjENeRpFcvJBDv/4jmN6ADDnH8/IDBw+ZrAkfo8yedl8MlsGyqxjelvMNbztYoiDosLFaUnKnz6Kpd8ZwRz59/ep5V5v7vhe5t6eJJFia4Sd923scpjip9m3bkcWDF7y83qxcu2EN3Yo3cLfn/uKnG9SHFdqAGixmE/S3oESzvE8xYZFizmv0Nk7jmlsb2gmf+3UqO8v8CO+OfjlcGf0mAhGSHcNPeKz/3z7RrhUkxH/0459x/WSYW9++/U7wVYhkIV6cwCA7z9YRgEALRsi4wMARxLoT992x0qilnz55hA3UB4/kqWXTZk3QWbNgJgBqKD5m35YFOEHeUk//pRwpIQOGr/i2wWt38OUV9QITwAA2egx3lS9l4xaveOLyUOEqj/27PgxKRu8Rr//9YpoGQkAVGDM0gWjZXx91k+r1iukb80M57eeM6K9B8v4AACyIX5iEoCSBPoLAQDEAXKaBFIy/K3X/PhQkrx8TmwiZ8rX3yyJ8OIXJvz7p7M321f08X40aLOSdv/RckjMb8qs0TI+qI4n7MrWmGwzQntmvHeN1W500mY5nQNipg8Wgvb4Vws++I4Z/fnGL6P9hJqUb7dnM/5zVyyJ8KL12X9kFJAR770/WAgAt2e/2jNXixRreOyWLyYEuWmOrPvowySV7I1vkr5/r8NBGlIcFbfx03F+fEXS2g9XJZsGz/tuz/qJEpIKnLXhi8lBptSvFrz9+sw5K1NUkmHzPp8b6Ayk9/jFSyP9aLiw74u1x6jJ/xrtdpclR5D7gp26WAkAtbW1LTY0XdOw3GKh+d/6Bait26N+a5OFxkNqqk195cFPrd1VybPGf3AEBi/5ef1ECc5aQhDkkeF8bibLnrSzswMAOzs7Oztosly3ANYFaNynbn3zv60utFhuuoaN1n/AaLJ2bU3Yl3okVw+S12LGohohCIJYQUF6wJhUGdt/Oqi0zpKaGYRzaBEEQVCQHg6k/L2Us++hHRAEQVqCL1dFEARBUJAQBEEQBAUJQRAEQUFCEARBEBQkBEEQBAUJQRAEQVCQEARBEBQkBEEQBEFBQhAEQVCQEARBEAQFCUEQBHmseKLeZafX648cOVJYWMjj8QwGg1QqDQ8P79q1KzYzgiAICtKD49y5c3v37o2MjAwKCnJzcyspKSkvL1+zZs348eO9vb2xpREEQR5xnpCU3blz506fPv3JJ5/4+fm5ubkBgJubm1wu//TTT7Ozs8+fP/9ASsFkL40YNHG70gRMRmxYyOSEApOth5qKU+Mmj+rnNWh24h9xEYNe3KwwAagOzBg6eE5y+YO1pSk3LmLQi6sVDN4dCIKgIHUSvV6/d+/e119/vdWtr7/++p49e27dumWbN87fMdHX1yf844y7kgHKb/rX/1kaLrb163sm5ZGtiQVeiw+mrY8aMnntxpVj8MN9CIKgID1+HDlyJDIysp0dIiMjU1NTbYpxFHuTlM4BXqbs3Vmqu1IkqVwupW0WFRNTzAAtl4lJAFLsLZe5ox4hCIKC9PhRWFhI03Q7Ozg7OxcUFNhwpvJTu49oZFNmxQyB3PjjDQk3U/7WiQEvLM2sS2Ix+WtfDHh5TY4JGlNtvv0CXpi9OU9vrtulScrOVHBg1fSIsH5evj6+YS/GrDrSMpGnSZ4VMe3HQr1i3Ut+zVJ2zSSrOGPNrJeH+vr6eA16bsIHP2ZqrKtVf6ydP+GFEF/ffoNfmDpvbXLB7Zm21gtgKtgxNeCFRbt2LJr86osRo4ZGTIs7oDQ1Cxa3TgwIm39A06DWuatfDglfloG5PARBUJDagMfjWceN2kIsFnO53I7DFNWxhAyT34ThfqHjBlP5CYn5HQ0BmZSJSz7eXR64eHfa4YSFcsWOgyp9y5grZ9382ARN8MJtR9J+3zFXXp4wP/an5uMz9JgNKT+87smXzf0173/rRzu3ppQZS2PePQijFyek/H7wi8lixdr3liUWA5QfX7sySTNi4c7U4//d/VkUmRoXm9RCytosAIcEU+HB+JIxn3+/N+W3bVMgcfGqg8WNB5LS8Ff8zVn7MlTWEzLKI8dK3IZH+uFn1xEEQUFqA4PBUFJS0s4OKpXKaDR2qEfKI/F55JAJQe4k5R8ZLi5J3ZfXfjBgKs8+mAOBU2aO9qdpaejk9yf7cTgt9EixL1XpHPnev0bL3Wmxf9Q7s8P5+QeTbZ/tYI2hcpMyNH4x818b7i0WS0NfXzQrFPKSs1SMXqNhzEDStDNFucuj4v7vaMJkGWlzAUi+PPq1QHcSgBT7h7qBSqFqUmNSEjguAHKSjqhMAMAUpGao3ELHylCPEARBQWoLqVRaXt7eHITy8nKJRNLBWZj8pMQC4fBxfjQAkLKoaC/mj4T2pzaYNCrGxBdL+VYJIGkviXOLsR99iUpPimVu9V6cL5WJQVOi0XemgiaNqkSvP7VsdICPl6+Pl69P6IJUjbYkXwPS8JhoP9XqV5+PnLN0c+KRTKWmpdK1XwA+7UzWlZjkkGA2NT9cPGTCcOpC4l4lA4zywHGNNHKMNw5uIQhyn3gSfocUHh6+Zs0auVze1g6JiYkLFizoIAjJjj94Qa+98PrgHY0r+Yl/qIZPFN8mEG2c4376apIetiLxmzG35fNC5286PFtTkJOdkZwUt/4T05Dl29ZGSW0uCaf9zZRf1Bi3g38kKaLDU7M0suhQnPyHIAhGSO3QtWvX8ePH//jjj61u3b59+8SJE3k8XrsxSHHG7j/0knHL//Pj9z9Y/333xZtBkB2fojQBkBwAc4MOmTUlepMJAEhaTJEmTX24Y9KUlDAtxIrvJuabVIqS+tX6AoUKaJmY3zkxErtxGGVeYz6N0RRbYyFGU6wxkbQ0ePTrSzftWhtBZqXklZvuXQEo2YuRMn1GYnxCht5vzBDUIwRBUJA6wNvbOyAgYOnSpX/++adKpQIAlUqVk5OzZMmSkJAQLy+v9g83KY/syYPAmH+NDg0ODLL+Gzr69bfC6YLExByG5EsklF6RpWQAgMlN3H68xAwAQDoHjvY2Z6zfmJiv0RRk7Fi9Q6FvET9RsnHhkvKUNV8dVJRrVDmJa1anmv0jQ6Wdc+y0PDLUuTBx5cbkfI0JGMWujye+vuxggYnJ2To9atpS6+w4kyr3mEJPudEUeQ8LQErDo7y1Sd+lmORRoe54wyAIcv94cl4d1Ldv3/nz56emph49epTL5RqNRqlUumDBgg5iIwAAJi9xl4I/5MvQ5r/+of3Hj5YePBh/Kmbt4PeWvLn0q48n/QEmoANHRHjlZ5sBgJREff6J8sN1S6OGmcFt8FuvjS7YmNtCkfznro4zLftqwUvxAHw3vxEL/7NogqyzgYZzaOyW5eTidR9E/QQcoVdwaMyaBVFSEmDW6qXmtdtn/OO9Ej0A0IPnrZkV2nzWQVsFsHlahThwXIDw2IVA6+gagiDI/cJOXawEgNra2hYbmq5pWG6x0Pxv/QLU1u1Rv7XJQuMhNdWmvvJgbIBHHyZ39Ruzjw1ev2OeHCfYIciTz/ncTJY9aWdnBwB2dnZ2dtBkuW4BrAvQuE/d+uZ/W11osdx0DX5+AmkHkyZ37/KP4vVB0yegGiEIcp9howmQNkOjuAmv7VDyA9/fGDtWjPZAEAQFCXlIUPLYlLOxaAcEQR4QmLJDEARBUJAQBEEQBAUJQRAEQUFCEARBEBQkBEEQBAUJQRAEQVCQEARBEBQkBEEQBEFBQhAEQVCQEARBEAQFCUEQBEFBQhAEQRAUJARBEOSx5Il627dFr7ma/h/m7zNsLlVlZCjJAI9/vE10FWIzIwiCoCA9OK6fP3I5aZn0+Q9dAl7q4iq7VaowaAr//CbqmReXO8nCsKURBEEecZ6QlN3180fK/kwK+vC/VM/+hrLLxf/9zlB2WdCzf9CiY9dO/XpdkfaAymHK3zox4IW4HObBXI7J2To1/NU1HV+OyYgNC5mcUGBqXtrihKkBoxb9oXlIraY6EvvC87MSW5QKQRCMkB5fLHrN5aRlQR/+tzx3/+W9n9ZU1Tk4FuHQ+8XPZK+tz1wxeMC8/Wxet/addvbSqDcSVI0rOGKv0OGvvTM7SvYQv97N5Cb/YZaPDRSTt20qz1gbu4Mz5Yd3/DssH+U3/ev/gFhMAoAma282OWS03NnGEmiOzPvnnGR9kzUcoSRw+JQ333kxkLaWilEe2bd1996MPIVWz+G7Sf0Cx772zpRQcQdbxcMXfZo9+YNl8bL/TJGReDMiCEZIjz9X0zZJn4+tMlRcSVzaoEYAUGOpvPJ/K6pNt6QvLLqa9h8bzsThSF7//sSFs+cunD2T/dt//jXYlLx8emyi6uE9wmuyftqwPbW1ApgK/th6BMJfHyOxxZVTUrlcSpMApuKMLf/+KVvTqSpx+PK5v+adPXfh7LkLZ08c+T72RU72ynfnxytMAACq5Nhpc9YrxS9++p8jaf9N+uKdIMj4aubbq7OZDrdSfpOnyAq2/5RRjrcigiBPgiAxRX9yackt9cVqs6HFpirDjZuqczxaois81bmTkpQk6MVZsdNl5qyU7HIAMBUcWDU9Iqyfl6+Pb9iLMauO1GeaNJlbZ0cM8vHyDQmfsfZYE+1gFImLX30uwNfHN2zivB1ZdT6XKTiwavaEUSFevj4BL0xfcVDB1EvP9g+mRoT18/INiXh19opEBQOqvdOeeydFqfhpWuCg2QeaJ9YYRWL8BXpEpJ8zMJnLnh88bbe1PCbFlkhfn/BlWdbTlh+cPzhs9oFCa8pOkbt14vBPjqvy1kYFPLc4w7qLviBpfmRYPy/ffuHT4g4oO1Qqyl0+ZvrCWUNAcSBbaQJglBkKvVf0J7FTwuXuNC0Njfro623fLY8ZQlvDo/a2AikeMiEIMnYfU2HeDkFQkJ6AOrC5VBdXmVGjbHWrqULVxa0v24F/d6KXs25+bIImeOG2I2m/75grL0+YH/uTggEoPxj33oZc6cwfjqT9+nm4Zm/SBWtyy6RKjJ2x9JhbzJaU3xMWylUb57yzVcEAk7/no8WpMO6LXzPSfo0LN+/7eP76bAaAydywbL1SNn/T4ezjv659TZy1btH6XP6Lm3a978eXvPZD9v/Wj6Wb1Up1KlslDBoioQAoaaiMLMnO1wOASZWXpXdzA2WeygQATH62AmTD5U51kY7szW0/vibh+81LPHV4aSgFAKaSjPgMevamwxl7VgzR71686mCxTQYxmwFIkgMApFguhgvJG3ZnNogKKR0aFTVUQnW4FQCcvcJloPgjT4M3I4KgID3+VBmZW6UKLi1pPdRxFN8qOV9Vqe+8COUf3LBdwQmKCHRmFPtSlc6R7/1rtNydFvtHvTM7nJ9/MLnApMk9mMXIXp89IcidFgdHzpseaBU+U/nxxCxz4Ftzo/zFYu/R89Z88ekUPz4JlPdr6xO/X/GiXOxMy0ZMjhnB1+QqNCYwazSMCTi0G01RYu/RsUnpez+StzM0pFcpVKRYJqasPj1UZlJkKRkATX62Rhrxikyfm68xAaPMymPEg/3aGy7iyKIXzhsho51lw6NHS0ClUHU4RcJUcGDdt8dANiZQTAKQkqjPv14oL9nyekR/37DnJ38Qtz1V0ZCCa38rAABfLKXNKoWGwbsRQZ5ynoRJDZRkgFFb6CgNsSe7VJtuNasez7Gr2Of6hf9SngE2PfYrf3xj4I+NK9yGL1i/NEpMqrJVelIsc6uXCL5UJobsEo2WUWnNlJukbnCf5EslNEcFACaNUmPiB0r5dRvcQ8e4W525RpG87tv44wqV3mw9l8xsBqCHvBkz5OO1kyMygsNDh4eH+vvJvem2B4dMJkZjBrru7ED7DZGY9uWVMBLNMSUV9Fog/0LysQv6EZLcXI14RKCYhJK2zkTSYmn9hUgOCWZTK7kzsz533Ut+65qsEfpFf7LiRUlD7V5fG/p6HFOQfzw1/qcfV767YyXH6/WvN38USne0FYDki/mg1+rxZkQQjJAefzz+8XbBbyvYPMdekZ+y2I1enMUme/3zE3uyS8Fvn/UIn2nLqTjC4Qu++e77H378/ofde37POHV4w2SbZ6PVnYHTbmyhiF8wf71C8tbXv2acOnfh+H/GudWJCiV/fcP/nTz+8+JoL/OxtW9H/fPt7QqbYwZS7B9Ka3IVKmVGAcjkEom3F1mQrVDlZqtoudyt/VkPHFsqJY781GqWbz8ZLeEIh8xdsWh0y4l/JCX1Hx0T9/PRC2n/ed1NuW/rkaYTutvfiiAI8kRESERX4TMvLs//abb3a+sFkiBdQZZJV0oKXAXSIA7VPf+nf/WZsIrNFdiiJkCJZYFDA2/LlfHdxHzTMUWJCaQkAIC+QKECerhYSIGQY9Ko9CZwJgHArFJqzNbAQ0KTemWB1hRMkQCm8uzEfSrJuEBNpgqC574zMVAMAIwiK7+kziszGpWJL3aWyEdI5CMiwxe/OufA8ZJoSVsKRFI0B/T6hmEZcYCcn3jk2EENI4mRUhQESmDjkWMqJcfvFSkFcLfpMJKWyIMDZSQABMpo1dTJXzTM1WbyEzdsvuD3/twx7g0CRcuCJfz4Er2pg61Wkdar9MAX8vFmRBCMkJ4InGRhLgEvZq4YrFNm8bpL3f/xFq+7lCk8lfnZIFHQK936DLnL81OyceGS8pQ1Xx1UlGtUOYlrVqea/SNDpSQtHx1E5u1YnZRVrFFlJqzZfEpr9eDOg6OCOLnfrd2dqVLlp+748OO1B5RAkhQFpoI8ZTmASXVk89Y8EIJJpTGZFPs+mPjKB4n5DABA+YWMfC2HduOTwOFzQK/SaBiGaRZP8MUysanJeA8lDvWH3PhUlXughAJwlgSJNRnxeSbvUFmLCI/kcEwaVbmGYe5QpSj/NxfPlijWL9+RwwAAJaZN+T99FPPBmr3ZimKGKVZk7F27aGWaXhzoJybb3woAAHpVgYYjltEU3o0IgoL0hOAkGzZg3v6bxWcv7fv0r63TLu37lCnOG/D+wbtXI6sXnrs6LoI6tuCl0GEjYzYq/Rf+59vJMhLAOTz289ckBeumDR828p2DVHSkHx9MJgBSHBW3afEQ/Y53IkZOWJbMmbD621lBFO03ZVaoac/bob4+fq/uoCaviJs1HJJmR61ixny2MppMnPfPfl6+PqFvJEDk4kXhYiDFwZGBkPbB6Ij5B0qaKhIpDggUa3NzG1bSsiAJqLS0zI8mrVEIrVGZJUO86BYVkY6O8tckvBXx/OLjJXdqDPmUT2Z5K79dvDGrHIAKjd3w9Tv+5uzNH0wcPnjg8PGz/51HRX+xa8fCIKqjrQBQfiFVAbIRfjTejAjytGOnLlYCQG1tbYsNTdc0LLdYaP63fgFq6/ao39pkofGQmmpTX3kwNsAdYyrYNWPqdsnKhE9DH+PYwqTa++7Ef9OLd3823BnbFEEeBc7nZrLsSTs7OwCws7Ozs4Mmy3ULYF2Axn3q1jf/2+pCi+Wma/DzE48rpHTEm8Ph+I82/JT10YXJ27FdIZ3yWiiqEYIgKEiPMc6h8+ImmL9btiPnMf0Jj+rIymUZ4rmfRuOL7BAEAUzZIQiCIE3BlB2CIAjytIOChCAIgqAgIQiCIAgKEoIgCIKChCAIgiAoSAiCIAgKEoIgCIKgICEIgiAoSAiCIAiCgoQgCIKgICEIgiAIChKCIAiCgoQgCIIgnYX9xNTklvqC6UaxqaK0sqK0uvImNi2CIE8w9g5dHbq5kZSIdHLvIvJCQXpUqDJUqLP3VF4vxj6KIMhTQnXlzVulF2+VXgQALt2j+4CXCZ4ABekhwxSe0uSl1FRbHIQeVA9/oivNoZztOV2wvyII8iQLkvmWmSk368v1RTlGTdHVI/+m/UZTPfujID00KgqyNLkHAIB+dqRj78HYRxEEeUqw53Th0l24tKdAElhxKUPz1+FrZ5Jqa2oEkoDHt1KP8aQGy63r1//6HQA8hk1HNUIQ5KnFsXeoe9hbAKD961CVoQIF6SGgztpTU21x6jucdBRjj0QQ5GnGoZu7k/ewmiqz+tSvKEgPGqO2yFRRQjq6OXkNvWcnVR2YEeLl229yQoHpAVVDc2BOiJdvvwk7HtgVEQR5QnGShZGOokptUeWNx3WG1+MqSJXXrwKAY6/gRiHxafw3ICT81dkrDiqYR6S0mozYUf3Cl2U9/PKYFJtf9vHy7Tc5UdWkeMmzBvl4+T6/OpcBJiM2zKeZMX37DX5h6rytRwoYAABTblyEr4/XoNkHNOgAEOQRQyAJBIBK7dXHtPyP66QG0w0VABB8uulKvpvMjQ8mTUGhVpWX+uOCbJXp17VRYvJhF5ZRHMkqMT9eBua4SaR8DoBZr1GpCrOT12XnKr/Z/dlwCu95BHl071u+MwBghPRwIiQOv3uTdbLxqxN+2Zv0f0fPpu18348DoM9KzS0HANDk7Fg0+YWhvvXB0+pUlaleK/Z+PHHwAB+vAUMjP9idY2qSOTOpjm6dPWFUiJevj2/Yi7O2HqlLq5k0mTsWxbw81NfXxzfs+ZhVyflMwxFZ2z+eGjHIx8s3JPzl6YsTchlg8te+GDgzQQWg2jMtcMD0varWqlOSvXfV7Miwfl6Dnp+1Nau8LnDJ3bVseuSoEC9fn4AXpi5OzC2vF7j8g2tm1Rdg8gdr/qivDTCKvcumRgzq5+XrEzBqYmxC7p3GZG4vfrIz6Ze9Sb/sT00/eWR5OB9AlXEwt/2oyFSwa1o/L99+MYkq9AwI8hAgugoBoFJbhIL0QKkyMgDAYnNa3UrLhgRIAMBk1ptNTP7W2ZO/SMoqNIsHjx4u45fnpX737tsrMzQATObG+R8m5WnALWiwnFIkxp9qiGOYnA2z31qXmlvCkQ8bHcxXHlk3Z/LHycUAxalL3/ki6ZhePvuTeWNp1bGfPnhnXUY5ADC56999e2WSxvvNFWu+mDWEzItfPjv2oJ4OjRrnxQEAjmf467OivPm3F9ecm7D2uzwQS8QcvfLIuvkrUzUAmqPr5i/Zc1wjiVqyYIK3Njv+k7cXH1QBQPHBZTELtmbxhy/64sulkZLylK3vvPttDgNgUmx/d+KHe7LNfq8sWjDZH/L2LZ9tPeRePX3h/Y4gjzT2ZNcG9/g4wn4C24QpyEhYn3QBAMQSGW3K+yohzwwc+YJtOybLSGAyl730+h7lgYSsf/nRyalKAOGYL3etDaeByVrx6rQfC63nyItPuQDAH/LJtm8nSEnVkcUfb8nXKwo0w6X80Og3JOLAV14MFZvcVFkzE1R5WRpTqLNeqVCaQSgbETF6rJgcO3j4FD1Ji2kKoqIHJ+y7oHQOnDz7zaBWU150+IrdXw53BiZz2aTX9yiPJWaVhweRfq+8JeT4R70yQmLy1+RGfX9Bka1iRvNV2QoNcOShUWNHy6nRw4dMUJn4YncKTLnJe0+ZwS1yyRexQykYJ2FGz0w6djC3eLTYvdM2LNm7fFIOnwMAYNIXFJaYASSjx8hpgHYEjpRO/OHPiegUEARBQVJ8P8nv+yb/7xk5/005qd1doAEA2YhQCQkAQIn9JPw9JfoShUYrLdcDAO0t4Vu3eIv5UGgCAJNWpdIAgGRIoJgEAPHwpT8Mr8tLySTOKYnfvbt1SUM0ZTKbTAC033A//rFTB9+LOPie0GtIeNS40aFBYtqWyEPsJ6YAAEixnxtnj9Kk1ehNtLcXnXxwS+z3q/QN19HrTUBJwwPFe5S56yYFruOI/YaPiRw9YrDYnQKmRKkCgJKktwYnNVEWhd40Bjo/jGYuUSoaC+j3+pcrZodLKQCcDYggCAqSDVgnNQBJuUnk4WNeDA+VUmDSt+t2AaCZt+7I35oK9n48Z+VxvSTy028jxaDYvfiLVE1DfPD1TnHSjvhUhapEeWzPqmN71srn7trxptud1KUkefG7HyVr3YYv+CZaRqoSli5JKbFucQ6N3f2TfPtPyVnKElXewe/yDn4nHP3tL6vl1s3C8EWfTpY1JAb5YmkzNeKQJAfAbNLrTfU1N+n1ehMAcCiyYVe36I2/Lg2lQJU879UPkrVKpQZIvFsQBLmvPEmfn6ib1PDLrh3frJwfFSq1Bh1CiZQGAGVW3Yg8o8pT6gFoiZwW0mI+AKjylXoAAI0yS1EX9ZBCsZQGAFVO3aaMFTMmRk5b+sfFi1kKPYBkyPjRIwIDZaSJAQCzVcdMjB7cR8du+GFX0qH/HlkeToM5PyNX1XFMYS7ILigHADCp8pRmANJNDExevhZAGBg9evjQQJlzU6Vk9CYqcPqXmxN+2X/8+A9veQFoc48pGdJNQgOA2cT3kgcHBgV70SQASTbXEZISu/EBIDcpOacuzczkJybmmAGEMil9m+iIh8+eNZgP+mMb1h5QYXSEIAhGSHcDJZ8yc/CBT44f+2L+vDw5bVYkJ5UAJ3D6m6HOlGnMYEn8HmXysvlktgyUWccawikqcMprgXu/yE5eNp/MlpjyDibn6fmDo6Q9Pb1pSNYqjyWl/qEs2LtDAQCgyf3jlMKdn/jmGzuUbuHvz31Fzjcpjis1ALRYzCdJoGkOKFUpaxfzX5nyZpT/beNI+rwNSz7Ok0DBkaQSALcRo+ViSuPOAaU2e1/qEb3+4OZsMwBoFBnH8rpXbXjrk+Mgfy12+mA3jiY1twSAQ0tpknIbMzFgx8pTx1cuiNOPlxTsWRufxx/+xa61kqaXooNee12eujb3wtbXIw7K3PgmfYmyRA8gHL7wnSE0QMvBUFIa8d70pOyv8lK/2pgxpGHatz5j5bQXNzfqF+X95qdLw2HvjJeWnIIhy/dvicK3ZyAI0kns578396FcuLa22lnkfseHX1ekA4CT9zAAAP2l/QmHrprpfi+NHyi6TWLZ3WT/GCIxq86dOfa/k2culPC8Rs9c+tFr/buxgXTv50OX/PXXhbxLN/jeE2aMqz5xpNBMh7zyotzZWR46iL5xKS87/fifl8pAEvHRN5+94k3RPWjN/1LPXT6bmnyqOnj+yn/53Pgr++SJy2TYm7MmyMyX/pv0y2/79x04eOyyQTJsztKFo/vyyG5i2nD5zF+XLysumwZEjvSmGsp441JSwqGrEPT2e8+e2/JD2mW90GvM7JULo6RUN5GL4cwff14+d/Rgmtpn7pfzhhgUp08dza0e+sGiKFFZ7qG9CfsOJP1fWp6KHxi98OM3BopINu0f2p8qUmRlHj2Sln3DY/T7n62b9w9Ri6iHFPUf9Q+xqURZcPlqiVZboTfTXuEvL1z10eieXQDAVPTHrv0KI//Z518Z1oMEACDp3j0q/kjKK7mgMPiNHEKeid+bVwHVhgqtRtvwrwR8Xh7vZ5+/PyG9BHqGT/qnDH+whCAPg2a+8Y4oL1PZsdh2dnYAYGdnZ2cHTZbrFsC6AI371K1v/rfVhRbLTdfYqYuVAFBbW3ubYNTevtxiofnf+gWordujfmuThcZDaqpNfeXBd2yyy/sWA8Az45Zi/0MQBLmHvvF8bibLnnwogoSfMEcQBEEeCVCQEARBEBQkBEEQBEFBQhAEQR4pnpxp39VmQ5WhoqbKXGOprK2pxqZFEOQJxo5lzyIcWGwOm+doz+GhID1CmJkysx4/0IMgyNNCbU11telWtemW5dYNDt+Zw3eG26auoSA9BAzlBTVmIwDo/j59/Xyq4dqVqlvXsb8iCPIEw+Y58VyeEfZ9juopN+vLqypv8rpLUZAeemx0rcZstGOxS078ZGdv7/GPt7q4ehFdaeyvCII8wZhvam6VKjRnfzdcu+QaHF1jMZr15dYP9D2+PN6TGqrNRrO+HABKT/zEobo/E7nEsfdgVCMEQZ54OF3pbr1De7+4jOAJSk/uqns6t1SiID00rKk5puiMnT2754jZ2EcRBHna6Dlybm1tDVOUAwCWx3y04vEWpJoqMwBoz6UK+47AfokgyNMJ/exz2vOpDS4RBekhCZKlEgAM1y53cfXCTokgyNNJF1dvY9kFAKixPN4fiXm8Bam2tgYAqm5dx3EjBEGeWjh82nLrBgDU1lShICEIgiAIChKCIAiCgoQgCIIgKEgIgiAIChKCIAiCoCAhCIIgKEgIgiAIgoJ0N6gToz1FEZsUD/Q1TxUnY0Nk0fGFLZfvWaXio0SiiG334pyVik1hjp5TE9X3zxqNl6jMifV39I89WQEAUJmzbWqIyM7Oc0Z6xYPuFfejURAEQUG6G0eZsi2xXqkqchK3pRTeG9mqLDx5ssIzzF/UYvmpQn0yPj69hcw5yGZsS9k2w98RACrSN8UlVkYdVCo2hTk+6JZ/WhsFQVCQHlEqcrYtiYvPqahzn5uWxCXeG0GqLDyZUigKC/F0aL78VFGYHrdkXYq6hUEdPP1D/K22qKxQVzp4hsgegmWe2kZBEBSkRyEWKkyJjZA5Otg5iPyj16WrAdQpU2UDV2Ve2D3R1c5/YdxI2ej/5F74z7BuDhGbCgvjo0SiqLh1M8JkjnZ2DiL/qLh0q2dVp2+aEeHv6Whn5ygLiZqxqX514lRPh/pMFID6ZEqhKCTM06HpcmVOXIgoZO6muGh/kZ2dnaMsIi7lZGJdqWQRsYmFlVCRPtffUTYjpSGuqMxZF+boGd1aPs0BKhWJt5cQKhTxc61FtHP09I+YG9+QrFSnr4sOk4kc7OwcRLIwqxluixnjo2Ui/xktlFmdGO3pGbVu29ymNqysPyQxNspf5GBn5+DoGRIdl66uhErFuhDZxKQLmav6cUVNS1+fslPnxIW4Tkz6uyxpmsTObZC/wLNJ+qyycFuUSBSxrWmWtVKdvm5qhL+ng52do2dIdFxdLFup2BTmKItet25qiKejnZ2DKGTqJmsrVKTM8BSFxa6bGyETOdjZOdZZ+PYGQhAEBemBUnZyW3xF1LacQmX6EtnJJTOWpFSIIrad/CHSpWfkrtLanFWxv6Wv/YdLz7fTblSmzPB0AICypHWJnrGJihvK9LiQwripcxPVUHEybu6Sk56xiYobNxSJS8LUcVPnJhYCgKMsKnbJ3Ig6B6fOSVc4+IfJHFssA1RkbotXR23LuaFMWyI6+eHoqHUwNV5RqEyZWrltbmyK2jFkarRMnbKtXioqFSnxClHE1LBWUkuVZSfjEx2mbsspVabEeuYsiZ6bWAhQkRIbNXVbRVhceumN0vS4sIptU6Nj0ysAKhWbpkbHnhTNiFeUlubEz3A8GRs9Y1vzkTV1SuzUuTkh6+LXRd3mqyv/TloXL5oRr6ioVSdGKJbMWJKuBoDC+KkRU63FKM1JjJUp4qKnblOAbG5K+kK5QL7wT6M6Pur20jv4x54s3fVKT5fIXcragu/nDqxM35ZSV5jKwvT4kw5hU8NkDk10ckb0kkL/uJTCUmXiEpkiLnrqppx6Rbywe126f1y6olSZssTzZOzUJekVAOAAUPbfTfEwIz5HXfrntqjKbTPq69u8URAEQUF6oIiilqybEeIp8gyJnhohqlAo1B3m5ryil8yIkIkcPUOi587wrziZmK6uVKsrKsBB5ClydBTJIuYmFhbGR3sCgIMsakbs1DCRgzVESckBWYR1nKTJMgCAS8SM2Gh/kaOnf0iIJ9kzbO7caH+RyNM/xN+xslChrnSQRU0NqUyvG8yqzElJLBRFTA1p3XOKwmJjp4Z4ijzDZiyZ4V+ZnnhSrT4Zn1LoOTVuSbS/yFHkH71kSbSnIiU+p6JSkbLtJIQtiZsR5ikSycJmxMWGVKbHpzdGQhUn102dkShaEr8pWtZK5OBAyqOXzI3yFzmAoywsRFShUFRUVhamx6dXhsXGzYiQWc8aF+WQE9/JoTgHWdiMMIeTdcN5lYXp8TmOYdFhnk33iN52Mid+SYRMJPIMi46dEQKKdEVdPApk8IwlM8I8RSLPsKlzozzVKfVpWNIlIjY2yl/kKPKPmjEjBE4mphdW3t4oCIKgID1ABJ7+DY/8Dg5QWVlZ2fEhMlHdIQ6OIpFjhVpd4RgWGxsN2yI8/SOmxm6KTz9ZWHH7gRWKlJyKJnpU0cT1OTiK6k7q4ODo0Ph/4ODgAJUVlQAOsoipYWB1zhU5iYmFntFT/R0rUmZ42llxCImrCw0EniGedSd2EHl6OlSq1WVlhYUVjjJ/z4YLevqLHCoKCysq1Ap1pUgmc6y/oEgmE1UW1gtzpSJ+bnRsTkjcuhn+beSxHEUNZ22wYaVaUVhWljRNwq0rnevo7X+XFSo6OxTnGTY1QqSI33ayok6PbgsKKxTpdWk5Ozuu98xDuspKqGysfL0dwdFTBBVqdUV97RvK7CgSOYK6sOL2RkEQBAXpQeJwB4MFrflUR/8Z23Iq1Dmb5obByXXRA2Vhc1NaDMRUFqafVHuGhYgcmi+3VbLWnXPOtvicwpzEFLVsapTMARzDlqTnW8mJn9FqAAN3Mx5SWZaZXhkS5pgety6ls9O/yZ5T9pXWNqVwU0Rnnb1jyNQoz8KU+JOFipR4hWdUdHO5KIyfGzUj0SF6XbryhrHWqPxhlEuTJm376aKy4vZtNjQKgiAoSI8UusKc+uf8yopCdYWjSOToUKkuVFeAo2dIxNS4benpG0PUifXpoQZ3dzK9UBQRVjfBrmG5E4hCpkZ4FqZsit+WUuE/1Tow5SDylNXhWR/ktFJCFxdPT8eKwpyGyK2yMKew0tHT09FRJBM5qAsVFfVHqBUKtUN9FOjQ85V18dviN0112DY3Nt72+MZBJPN0VDdNgFot1Hkc/aOj/dUp2+I3xRfKolvoUUVhek6l/4wlc6P8PR0doCInXVHWqDSVTSpcWVGotgZDAAA6taLBEhVqdQWIPB3vsFEQBEFBur9xk6MDVFSo1eqKikpr0kxdqK6oqPPZf8cvWRJ/slBdmL4pdt1Jx5DoMEfFtqlhjdO4FCfTCytFMpEDQKUicVPctnR1Jahz0hWOIdb5xE2XOxkuRMsU2z/crg6Jbs9x3l5Ckcg/OsJTsW1JXGKOuqLw5LbY2PgK/6ip/o4OsoipIZASF7stvVCtVqSsi4076RgxtX4eBjg4gINjWOy6WFHKXOvYf2VhYtzc2Ph2f1Ds4BkWHSbKWTd3SWKOuhIqFNtmhIVNjVdUWnOSUNHUoB00hiwqOqRi94f/UXhGR8gcAECdvm5u7LacCgAHB0+HysKTOYWV1rn62wodBVChrj+vKddaYbUiZVPsNoUookHPylLilmxKL1QXnty2ZEkKhESHeVbcYaMgCIKCdD8RhUyN8vzvvH6uYUtOVnpGTA1zSJrmLYqyvtTB5R9ToyriIiSukmFxhf5Ltq2LEjnIpm7bNtcxcYa/o52dXbd+cxVh6zbN8HcAqFAkxi1Zl1JYqc5JyXHwj6ibYNe43EmllEVNDRNAz4ipTUf2mwViAOAyKja6cl1dCUOWbFsXJQIQRcQlbpsK8dH9XLtJBs5N95yxLX5JiKP1J6nxcf6K2GESV1fv0ZsqwtbFb4pu4ZcdQ+auW+KfEzt13cmKSnV6/Kamsx5axTN6U+KmKIiP7ufKdfCPjneYsW3bDJmDdTAspGL7OIksOvFvk02Vjpga4QIuYXUqWanOid+2LVFRAeDgH71kqihlmjfXzk4UnR4St21dbIg6NiwsLtME4NAzcqq/IjbE1dU7al1lxLptS+p/ZyuQT412iI+WuEoGzj3pOXfTpmhZxR03CoIg9xU7dbESAGpra1tsaLqmYbnFQvO/9QtQW7dH/dYmC42H1FSb+sqD77jcl/ctBgBR0AQAyN0wYfCKc/fYMOr4KP+5lXEnU6Z6PpyWqTgZGxGVHpaYEhfy9HjOypx1EVGbZJvSN0XY/AKFSsWmiJA4z20nt7WcW16RPsM/KmduevpcfwyGkCec4x/5yGclAIA6KwEAnhm39I5PdT43k2VP2tnZAYCdnZ2dHTRZrlsA6wI07lO3vvnfVhdaLDddw8aGfBT9svrktrlTN1VEbJv7FKlRRU587IwlCv91m8LwdT4I8jSCkxoePb+cMlXmOnDmSVldBu7pkOCTsf7d+k2Md5gRv2mqDOMZBHkqwQipDUTRieroh3Jlx4hthbXbnjJzO4TE5dTG3dmhshnpFTNatWTYptZ+JYYgCEZICIIgCIKChCAIgqAgIQiCIAgKEoIgCIKCdF9hO/ABoLbKDADsLk6WmxpsSwRBnk4seg27i7DRJTrwUZAeKByBCAAslQwAdHHpfatUgZ0SQZCnk5ul+V1d+wBAlZEBANLRFQXpgUIKRABQbWQAwKnvsPKzh7BTIgjydKLJS3HyDgMAi1EHAByBCwrSQxCkW+qLtTXVVI/+diz237+vw36JIMjTRuGhr1gcB75Hv9raGkPZRQBwcHRDQXqgdHGVEV2FVUbGeO0yALgGR1sMuiuJi29cPGbR43gSgiBPOBa95sbFYxd/WVRlMooCJwCAQX2xyqgn+EKeS5/HtFKP65sa7OzZoqAJV1M3MkW5HIErm0uJAl++WZRbkrHtpvpS1S0t9lcEQZ5giC5OPFEfoc8IvrtfbU1VlVGnv5oHAK7BE+3sH1fH/hi/OogUiGi/0Zq8g9rzfwh69nMQenbtIe/aQ449FUGQp4jaWkO5Un81BwCc/cZw+M6Pb1Ue73fZOfYKYbEJTV5KRUE2qb3K6y5hkV3ZDnw7Fr6jD0GQJ1qGqs1VplvVlXpDudKsK2MRpLN8DNVzwGNdqcfecVM9B3Tp3rs0e0+ltsikU2M3RRDkaYPrLHEJeOnx/fnRkyNIAGDPpdyHvmm5qanU/m3Q/F2p+dtiqMA+iiDIEwyb58ilPbl0D67Qk+gqfEIq9cQ0D9GVJrrS/Mc8YkUQBHlqwXfZIQiCIChICIIgCIKChCAIgqAgIQiCIAgKEoIgCIKChCAIgiAoSAiCIAgKEoIgCIKgICEIgiCPBU/US0grbmh1N8orjYbqKgs2LYIgTzD2bMKBy+vm1J1ydEJBeuQoLVYCAO3sSnJ5bDaB/RVBkCeYqipLpdHAVGgNt/Qicc8no1JPSMqutFjJZnNc3SVd+AJUIwRBnnjYbKIrX+DmIWWxWGpVIQrSo4KuQgtg5ywSYx9FEORpo7urR01tDXPjOgrSI0HF9XJK0A37JYIgTyeUwKnixjUUpEeCSqOB5PKwUyII8nTiwO1SaTSgID0SVFdZcNwIQZCnFjabqHoiphbj75AQBEEQFCQEQRAEQUFCEARBUJAQBEEQBAUJQRAEQUFCEARBEBQkBEEQBAUJQRAEQVCQHgpMwdGEpTEvPzd4gI+Xr49v2PMT5sTtyihgHuEim5Q/ThgwdNZBDbYegiAoSE8I5dlbJv/zhfd2aGRvrtjy24m8U/89+PW8cbTiu5kvjJ7xYw6DFkIQBGkNNprg3oZG2XEx7x5xnvnDwclBzvUr3eXDJ8qHj52wO/bdtbHrpDs+/f/2zj6uiSv/99+ESSbBTCAyQUKEmnSBgNek1QK9Qm1X3PWB9sJ2rdpttdqyXevTXW27eu221j546a5bt7W6rT/sqrQ/td222F99vMJrVezrAj9twVuJsE38EUMoGQ1kIskkIbl/8BSeAwZE/L5fvPI6zJw5c86ZM+cz3+85cyZTjjWFIAhyF1tIzOmXZ01bWFDNdZgyJS9lzHh8j54DALDrj77zfM4j9ydNuz9j4fJNheXW9lictbRg1WOzpk2bmjRjVs7LHSaOvfLtxx6c90bRl+88P/uRJ7fr7QAATPnOd0rlv/9o19I0qbl4z7rHM6ZNTZr56KrCY/tX/mLRZ8rNby2Snj9cbu5I2lz89opHH5gxNWnag7Of2vxlWyJ2/Z6nHnxgxYH2fHLmo+tmTXts62kGALhrJQXrVzyaMWNq0rQH563c2n4IwLWitRmPPL+n6N28xx5MmvbgvJX5R/Xm6s82t5Vo9or802YOADh9waIZs1YVHtjy1C8emDY1acYvFv2xqLoPo62fUveOZyxqT2rmo3nvHOtMijMe27LiFw9Mm5o07f6Mhc9vKWrPaJD5RBAEBemuhTn95tpNJWT2aweLTxzcOp/6/q8vbTluBgB75a68/7lDr1ldeOJM8Yer1VU78v5w2MABAJAkZy4p2G/WrHlryxKVFIAzlBSco5duzlGD8fD6Z7eeUy5798SZ4+8tlZ7I31nBTtaq5NoFc2jj6SsMAABTuu3ZdYcY7dZPz5R+vX0JVbpl5RtHzRxINUv+sEhdVfCXIwYOwFqxa+d/Sh/fuHoODZy+cMPLOyrJzOdf/fOuN1els8e3vLzjrL0tMwDXz+//hFnw1hfFn2+6z1i44akn15fQa//+f4o/Xq82Ht7yt1IrAJBCgOvnPimlXvjo+PkzRa+m2o9v3bS3sofcDFDq7tVWvGXlK1/adUve/PO7v8+Eklfy/lh0jQPOWLR+xctHYX7+12cqTny0JlZ/6NW120qZIeQTQRAUpLsUu7lMz8gzFi+ZrZms1Mx5bnvhP3Y+r6UAzOf2FunpnM0bF9+npCenLt68MYusKDxYZQcSANxuMvXFtzY8nqmZTAJwxnPH69U5mWrSfHpHQWXSpv+9MTddSatTc9c8oQGITdPQJEkro4Bh7BxwhpKCo4xqyVubsjW0XJX5zKsb0t3F+0uMHIBUl/fiIvr73btP60v3/LUE5m1ak0kDAKlZuuvrU4ff2/RM7oI5uctefGG+vL6y3NiuJhxQuqdXP65TTtbMXjJPBW7pnBfy5qjoyakLlqRSdn0l06Eo0tTFz2Sq5VI6OXf12gzKUHK8+3SL/kvd3ToylBSeZlM3v//2S7kLshetf33j4jSaYzh7ddGBc2zq2tdWz1HRUmXakxs3ZFH1507orUPMJ4IgKEh3H1LlQzra/Pnmpevy9x8vN9hBrtLdp5SC3XjuynVam6Wj2yPKkzKTSaZS39ZnCqkknVraaS7oy+qpdA0N5sqjVZxuvm5y+w4SAEhao6FJAI5zAwkAwFaX6tnYzGxV+/EkrUlTgaHCYAUAkKY/t+FXVPGmZ1/6ipu/eVXHmBPHGkp2bVg4a9q0qUnTpqa+8JnZzTKsuz0FYaxa05ZRUkpTQipWTbclLqQoKbCsvb2jF6q1HWcFSqmigTWb3YHyPHCpu+yj6lI9G6VNjiXbTjp59qYdry2+T8oartS7Y7W69u0AtDZdJbQbDW3HB51PBEHuMnBSQ1uXOevVg4cfOLBnb+G2PxQCCJU/X7/rrWXJbrudBebEuswT3WKrGLatzyRJiuy0F1iGAZoSAsfqzW76IRXVaXBUlui52NWTKQA7U80AHSslObud5eBq4eKMwsCUhVrGzQGQAHTqk0t1h96skM7LSqY7LJIjm1f/qSr52bcLF6UmK6VcZf6iZ4sDjiblZGBaJNn5Lwkg7IpGUp17SKmUBJa1cwEiMGCpu87AcXYWhFKa7FGXHMdxXLftJElRpJthhphPBEFQkO4eAnthkr4vd8Pu3NV2Y+XpooIPPn5n/d80n70glQqB/vnGrUs1VKBBFauSgrFXckJS2NZfSwP7W05ffOj8dWmOiibBXnW8nNOs1dBAclKKhNis119dpA6ITVJqZdu/TMX+QoNSm8SceHfPfO0rqVIA5vuSKi5p0Yursu4jAQDs9WbWPZxi2xmuQ1o4O8MCRUtJEjqTEg5Q6kD5I6UkuJleDjaSJEmy23aOZVlOSPaSLgRBkEDuKpedkCSBYzpkyG7WG5m2XthuOFt07HuGAyClqrTH12958edRjN7IQKxORXFuqUablp7a9qdRxqrVSmnvxEmKptyMmQUyVpMcVX/uiN4KwJmLd+6tolVR4GbtTPmev5bKF+Wl0QBAq3WxQg7kms6UdepYpVrV1mszZ3fnH5Xm5r+3ffMDzFfvFHRNciPb3VvAGc4dqRjWW6xuQ0X7cA5wrMHIuCmlMtAuIYMsNaVOihXWV1XWt1eotTQ/b+XW00zP7cDozxnd8iQNKhKCIChI7R3oZK0SrhYfOm+wc8z3RTu2nWAAwA4A7vriv728dGX+wQqDlTGUfbZrz3mW1mpoqXrOc/Ppinf/1+5j1WbmWuWxPet+k/tsP1OTad0cFXP6uN4uzVzzWp6yYl3mtKnalcfVqzatXaSxH1mXtXAH88Tb7y7VSAEASPW8vDlk8bY3Cs4aGaux/Mt31i5+Yu1fKhgAsJbu2nYCsn+/7D5anb0+L7n+s22fV9qBUqto0BftL9FfM5YffPONQ6BVCVmGGfKYC3s+f8MbRd+bzd8f37WngtPMnq8O1BpygFJz14o2L1qx9agZAKTq3GUPURXb1720vaj47PGCLW8e/p5TKSlpcu6yh6iKnW8UnjUyhooD61duPcdplyzSSPF+QxBkAO4mlx2pznkt35i/883HUv8AVNKiF1+YzbypB44DOvPF916zv5z/+rOfvQ5Caooue+NHv83RSQEgc0vhx6n7P/ls9RMvWyE2+YGsrR+uylaS0FsESOVDT2fu+WP+ntkfvZSat/sfeV27VHv+cxFwdjtIu7x5pHJB/sf00U8KP1i5q5KhVNq0JW9teSaTBqb0g3eK3LO3r0mlAYBU5b743PGle3d8lfH+My+8vZnN/+CPv/6S1s5ZlJf/B1X1n17a8uqvl7IHd9BDEOa0p5cpz29dPM8Nwljd/C1bn9NJoVuB5P2VGjj2ur66irS7OQCSVOXu+JQ+tPfAwT+99G9Ap83bVLBqcTIJoMrd8Sn95d4Df1mxQ38dhFMyfvvnTc+gHiEIMjC8hmtGAPD7/T12BG7pDPcIdP/tCIC/PUbH3oBA1yG+Vi5Flx6SMlyuLAtVUreK/fvClzb8rV7z3Pq1OZnJNAkAnN3w/fmSQ3sPnGZ0+Z/uzFbezvxxxgNLF+6m3/pm93waGz+CjB9C2A1erizjh5E8Hg8AeDwejwcB4fYAtAWgK0779u6/fQZ6hAO34Cy7kCK9b+meoszSo58VbVuxtfrqdRYAAOgpqQ/lbvosp3O+HIIgCNILFKTQi5Iq88mNmU9uxJpAEARBQUL6gVQt++zCMqwHBEHGIrhSA4IgCIKChCAIgiAoSAiCIAgKEoIgCIKgICEIgiAoSAiCIAiCgoQgCIKgII0wYYTA6/XgtUQQ5O7E6/UQhAAFaUwgEoe7nC3YKBEEuTtxOW+KxOEoSGMC2US5vek6NkoEQe5Omm03IqOiUZDGBNLIKD4/rNFiwnaJIMjdRqPFRBBh0oiJKEhjhRjlPT5fa/01o4NtwvEkBEHGPV6vx8E2met+9Pt9k2LvGR+FGj+Lq8Yop9ibbtywNricLahJCIKMbwhCIBKHR0bJpRFR46dQ4+kKSSMnSiMnYktFEAS5E8H3kBAEQRAUJARBEARBQUIQBEFQkBAEQRAEBQlBEARBQUIQBEEQFCQEQRAEBQlBEARBUJAQBEEQFCQEQRAEQUFCEARBUJAQBEEQBAUJQRAEQUFCEARBEBQkBEEQ5I6GGGflYU2VP134ytn4Y0vjj15nM15g5JZuD3FEePS94dE/i56RS8XphpGCz9fK/FTf0uLgnC2trV6sUuTWCQsjROJwsVhCxyj5/HFlVPAarhkBwO/399gRuKUz3CPQ/bcjAP72GB17AwJdh/hauRRdeghL4vNydac/MJfuA78PmywS6huFr3xoxT1z1vLCBMEf1GRjLCaDNEJGEAKBUBgWFoYVidw6ra2tHjfn8XrszU3KOHWEjA5t+pcry/hhJI/HAwAej8fjQUC4PQBtAeiK0769+2+fgR7hwC3jxEK6adFfOfSik7mKjRUZEfw+89m9TTWlCQu3TVBogjnihvWn5iZr7OR7sPKQUFtIYWHicBEARUVct1p8vlZZ1KTxUbRxYu5Zq46hGiEj/tzTcMVadSxI26jZ1jgxSo6VhowoUXS07bq12XYdBWmswNZ9Zz73MTZNZBQwn/v4pkU/cByfr9ViMkyko7G6kFHRJLm57ke/bzwMVYwHQWq8+DX0GgNDkBHB728oOzxwFKaxXhohw6pCRo2ISJm1sR4FaUzgsFRji0RGjRarYZAINx0EIcCKQkYNgiCcNx0oSGMCp9WILRIZvfbGDNLeOGeLQCjEikJGDYGQdDlvoiCNCVo5B7ZIZNTwOAYZQG5t9eIMb2Q0CQsLGx9vueFKDQiCIAgKEoIgCIKgICEIgiAoSAiCIAiCgoQgCIKgICEIgiBIfxBYBaMDj85JXrlNRlRe/XC5ucHNi8lRZ6+m1UrCWVz7wUuNTe6xnNsRPJMo9d6V+2LkjPWTx2uqr2M7GaN4Gs8XvH/MRCQvfvFpHTW2UuvrBHUn3v/orDUybcWaXLW1K5wkDn36oUoTQUEaHCry119Mna4EMP/0yfJ/VdcDABBJ96z8crLCUF/wG6OR7f9YIXn/dm2O6sanv/mxlvU7jEz5YY7Qsw4AoCLSVseolT5L0dXzx1iXGysaCRFOQ9H7e8ttALK05atyEqkOAXj3mEk+a+W6ufHBLiHhsV34dOdXrqx1z2VEj91lJ2wXCnZ8bvQqfrlmVZrrmw8Kyhyq3N8vnzHCZxXIEjNmeW2SxGgCADz1Zwp2nxX9as2KGbhgFArS6KCUZy1tNL5jdwVftTSVqBMKuPZ/XVWNp6oaO3YJKQqAa6k5XP9dFS7Dh4xEV32x+EJa3COK4T7AOwyVJhfcScuVEyICYHQWbaLUD85Vdyi31VBt8YIKmxwK0mjh8wBfkRs/veiHb6/00A9e5Oz47NW0SiUSkz6nucV43HRy1w1X6r0r98TIAABilv9fumbrpZPclLxtMqLy6r9tI351eLICAEDy8MGZaWVW633yeHCcWf7/TlW1AggSXtMuXyxii698+BLT6coTae/JOzhZYf7pHzs8KXnRCbFe03HT0QKnIk+VNZ+SsGx5fu2pEs4LIFLRszfFaVPDKdLHGpqrdhtPHXcGvMTdlr6w7t2qvXtvEtp78vZNVpA+Q/73+wud7f8ar33+eXv7kOfeO3cprVL6mNJrR7dajNcBgBeZEZ+9ITpBIxRwbmvljTP5V7+70tqVw/yb6qWxyTqhV28tyTeWV7X2rLGM+JxNMYlqwmNmLxW7A9ugKImevUGZopXIpOCxuyylDSU76mvr/QMnPliR78YbmwCv6Z8nq1KeSu9l33hsl4v/o7jK0NDkAkJCxyXNnDsvPT7QdcbW/OO9/RcdAGA6+u7r52c889uHO56r6sqKzp+tqnOIFNPnPrFAFy0A8NiufHvyzEVDHeMAiUI9PevR2SnRAvDUffPuR9/aYmatmEtVlZyvtLgoVdqjOVlTu5sRHktZYcGRGq8i45nlj6mJurKTp8tr6hqaXIREEZc445dzM+OpIIssJgggxKJgJMlp+I8PCs47VI+uWZ4phzYXoleU8MSap2fI2v+V/3LNqpliQ99F63DZPR13vuCLGhcA1H6+ffM/h2SDIr3BSQ3BwN28VOTwSCNmrZbT3dcok6ROeXr75BSNCMzNNeUtXqUkJS9pyXppWL2tqrjFAwBcS01RQ5Xe3dU/Xm++WNRsAwDwWoobyo8y31V4gQxPzBKLAIASJ6SKAFzGomZHgCvPy3k9HIBSnr0+UsR5QRquXpyUdzAlSwcsyxcoIzLWT1ZFARFL5+xLysgUOoqvnTzQ7FLKMt5OmKkNXMfGa624yQJfphNLhDyJhookAYAvT50gEfIkqgmRJNj09htOAACBJjp7tYRgXF5SqMhSZ+dJRQCSDPXyPZNTVN7aA1fPF7slaTELt8cnRAXkcEssDZyD41O6SQvWR8d0rzEiVp69bXKbGhnNvIRcmaxrF529MykjUyIDh6G0uQlE8QumLN4eG0cNlHgQRb4L9UgxPT2OcNUWn67t6VRma45+/OnZyw1NRFxCSoLcyxgvfL3v4HmrJ/C5QJYyI5kGABDFaWdmaOVkuxwZi786ayFkEsLbZCo/UnTR6gGP7VLRwVNVBm9cxoJZKSJrzdlPCk8ZnO2qCNBQ/vkXF20iGQUuW+3Zr052y5DXdvmbQ0dqXJKUnCXz1JSzrvjzr8trXPIZ/2PxE79MEVsufrO/6ILNE5wfjZLHx8XFxVHBPGWL5YlxEvBa66wu8DhMtVYvALgsV6wuAJfFaPVCZHwc5ei3aJ01pZgxPUECACBR3z8rIwF9dmghjQbWY6aL2uT0LOXMTNsppuseiFtEK0jwVF7d/zuzieXROUl526IUC2JiC2q+PSzTZoXLGPu3+f9Vy/LoDpO+9XpT+S6hanaEjHTVFBhOVUFki43NlNOpEXLKYVXJ1GoAc9PFSk9fz/iuqq2Xv64g7t+pXZhJEEzj4eX/ZVUpn9k3JV4pltN8my4mgQZP5bV/vGJucIeZQJu3jNJmicurHB3ORr9Db7Pao9QqSkaxkkyx2O6oqQ9XaSLkVDPoxGJwG0ud7nYV4S6u/eFUFag2avOWhdMasUTIKXInygGsh3/84h27S9jkUGrn6iYma+qM7dXirt5a9UWJRzL7Zyt3TpJpIuS0paE+wDxKpVU0gLnh0yd/rL3Oi1k0NW9LhLhtV2Z0shLAbjvym+pyo59IUjxzUK3WRd+vabDY+0u8wZs5aJHvxhtbPmNWWt3+b6tOnnlQNVcS4MkzlFdZAUTJi1cv1skEHlvZvve+NhrKL1jS5nU+2wvkKZlply9UMy65ds4vM6IFnnZnM8TNz1syQ+Y1HNm5p7yp0Wh1pUeCKDF9poJKSE9PlLkoa83hapvJwnrUHX2zbMbylfMVAraq8C+Hqx0mg82ZIGpvzKZ/Hr5YxhCKWUuemC4XALiaHE4AkTwlfbouWqBLSclgCYmMCtLkoKbm/HZqm9U1eGRRdKJCdKnWYrI54xxXLC5RXLLcWmuptTnjvHUWF0gSE+UicA1cNABRrG6m9sLF2hpQzMiah2NIKEijBNP87e7rKdujpq+Orc7v2Cgk5UoCAJiKJisLAH6H0ekAoCiRnOaZgk3a31TeeNksT9dEqVSNkBVJA1iLraY+p5xxnoZ6L7h9DrMXgHAYWBsLXoZzsAB0mIQkKJVADAC6KWu/m9JlxsUKRQCdvbOXuWmq96lVExTqCQqN0GNsrNbzVbkSlVrs0giBY416t1cLAOAxNlcbWwF4Nj3nhHBCKhJTApmSAAD5smmvLutqRjKlkGgTJI4zGb0A4DLfZDmQkYSY5AF0+jn5YrWAAPCYHbauGmsTJD6lIsUATv11g9kPAN56p5UBtVIoUwmJyv4SDwumyHfjnS1SPTxn2uXCS+XHy7WPdTnI2HqrC0AUr42XCQBAIFEoKDC6HFabCwZ1NoniUtQyAQDIYmQENHldTi8IJAo5VVV1/tOz33Q+QXm8XQ9TEoVaIgAAkVwug2qL1+X0gqjd3vq2DAAIVfr0uLaRLiouOV5Udbn2yLuvHxHRCVOna7WJibKRmIcHAokiUU7UWkwWq8VichCxM7UKT22ZyWhtIuocIFIlxFKDFQ1BQbpt+Jhi09nyiOy0mNnzrwMX0rSvs5eOO6bnTUjOigBtuAAcl0tu9t2Zcj5PuwfPBwDQ4dPrcY949A3HCmxs53wKM9ttPXSWM1a6H9aIE2ZPlNG+pmKboULgWBwVN1vmVfE9RtbEdOhHm6MMAKDn1yhtxwwnj3Md5/U59C4v1S2H4IYB7tyuXcKhtMH+Ex+kyHclVGJWVmLtFzVnT1ZqvaG50wmiZzoe64UvDn1jdMnvz1mqlXmNZ746a3R1P6TjCveeXiGS02BljKeLLyct0ckAQKZ7co247GzZ5Tqrran2wqnaC6cUD/8ub3586OdWCyLj4iPBZK35obqJJeTpifHxTZLzVTUGg8jmJeQJCsmgRUNCDo4hBY/75sXdjRaOiF8sp9t86m7OavYCQKRGIhECAE+iEksAgG2xMgFzHwb/NE6r5Rhj4fiK2TFaHd9TyVTrW4enmqzR4wQQUGArv1FdYjMavV7wgdvXvftuG0YSxi2IkpNuU6mzSW+3MERcFh0nBUdls22Auexuj83sBQACPKbSG9UlzVbWB+BzskHOFfQ5DR4vgFgpkVEAECbTTJB0Zl7POQHE6ggFDQBAxIrlNAC4rUa391aLfFcikKfMmxVHuIznq6zt1SGgYuUiAJe1xsoCAHhsFosNACLlMlGfDw6DGQQuq8HiAqBT0qZPTVTJRUMwIETJOc8uXzgjEhyXTp6+3JYdp8Mr0y1Y+vzaDRs3vfzkNAmA1WRxeMBpqzMYDHU2Z+hqRyxLVEjAYay6bPFK4uIjJfKEeInLVFZudEBkfJxMMOSiebDJoYU0mrgq6ouPT3w6V9Th2vAYC+oNmVPUmVOWbKcsrFAxW0aB11BgMV4HYL0uDkBJz93ikxWa6wZO2Xjju4rJ8ZkRCvAZjjdZ2OFl0N9U2mhkIlKUMTnbfN+W86flxcST7JnlP3T/pFzHMBJNANNcY/R6GdZo8KWkiQTgrq246QIQ9W+kGI/brAsmyReofs2S1VzEzGUymaFh33J7U5A5rGJMdlmiMiZne5ixnk+nijsq08+UXLuol2Vo5NnbIdEIEm2UmgS22FRe2dr/pNogi3yXIo6dnjWjfF9ZU2dfKkuclRZXfdb03T8OQooC2JpLRi9EarMyevjrRCKRGMBhKvvmCKQ/nKroV1UkskiAhqaa7y7GM9aycisAQFNNjTGFEgXR/8gS5sxNvnK4+sLJYq0qmyoveP+URZIwa/5MtcRrrbG4ACIVConAaTr96b4Ljsj059b+Sh0qa6l9GMnmAMm0RLlYQCkSYkVVNYwXJCmJcjEQwRWNoCgCwGH855GjzpkPpyfKcJYdWkijBVdbcK3GHiAkV+oPr/vXxUpvZOak6bkRkUxz2dYfDh++6QJw6RvPFLEsEIosOlk1mPK7XTXHmlkAsDdfKm0Z9tO9t77xyNp/Xax0yzJjszdMFFfVH3ryh1M9J163DyMBgNNgszB+cLtNVS0eALDfNOoHeRB0lBgPbW4wmAn14inZuaTt8L8+XG6oDXqRBa/RevSVeoPZJ9PJ4miufEejBQCEfAIAWPuptT+cPObwquTTc+UqqavmwJV9rzCMOwRFvmv9dqpH5iZLAjUqPmvZ73JmxBH135Wf/67WSSc//NRvn0jpOVAjUKTPuT9OAk2G78pqbP27qAWKB7Omy8FrKT9SeNQkz17+5CyVxGU8XXLZFtQlEMiS5z2iEgFTfuKsRTZzydKZCYLas5/v3/f3T49eaIpMWbBwTvwIrYUgkMQlygkAEMWmKCgAkCja/49LiBYHXTQqLmOWVi7yWmsvXjCyaJjfEryGa0YA8Pt7elwCt3SGewS6/3YE2gaw/f7OvQGBrkN8rVyKLj0kZTj/ytRxcCXCVOv/2zN5EtexKx++wjTh2g1jmoy3fxhg7+XKMmXcFKylkOKxlv294GLi8rxHFGiB9IXZdDVUPerlyjJ+GMnj8QCAx+PxeBAQbg9AWwC64rRv7/7bZ6BHOHALuuzGgBTFzJ+cNptKzJIIOLak0IZqhCA99chhutxIyDIkqEbjGhSk2w9fPjs6fYEQwHU5/8dy9DUhSC+8LKgfyU5JpLAqUJCChMfj9Xb9IYM//F16ueLSy1gPCNIv4vjpD8djNYxBejvfbunpHCsUQRAEGQugICEIgiB3pSCF1r5DEARBxk13zR+XpUIQBEHuuG6cf6cXAAAEkihsLsioMWh7CwsjWltxsiQyerS2esPCRmnK9Ih27PyQ56DtVanRZIJCgy0SGTvtTSQO97g5rChk1PC43SJx+GjbTEPp6oMUEf7d0EEgyGi2N3G4xOvBhTaRURQkjyd8wnh4RysEgnTbh4hiHvg1Lwxf4EZG5YYRhsc8sHDgOPQkZXOQa80iSCiwN9voScrbm4eQCAH/VlIfag5GSLlEUffEZ63GRomMAvfMWSuKGuQNTT6fr4xT32CsWF3IKHCdaVTe87MRMgyGmuotCsftcdmFvO4mP/QsOu6QkWaCQhP7358KJmaEjI6YKL9u/QkrDRlZNbL+JIuaFBEZ4oldt8vvNWKC1M9iriNWjjDtyn9XznoOePiqLzIS7ZmvfOhZ7cp/B35YkEdMpCdFRSvNpqusvdnlbMF5d0ioaG31upwtrL3ZbLoaNUkpi4oebfthxDpzYqg5G+pqdaO2wB2fIKfM3RCVktV4oail8V8tjT96nc3YdpFbuj3EEeHR94qj750041dUnG6oh0fIoqQRMmuj2XnT0WS70dqKH8tBQkBYGCESh4dPoJLvSRhNU2YY5xrqIbdhte8RlSgqTjeMjgNBRsyy4kfHxGE9IHde070dXjt+6HKPVxBBEOQulK5QC9LQ58vxQrIdQRAEuUOtpVB1+J3xR2QKQOcbvH19pxYvLoIgyB1p+nR9j3xkVuTBOWkIgiDImGAkBYnX005Cxx2CIMgdZST16r1v++KqwWd6hOIjCIIgo69Do9yl80ftfChCCIIg416cbiUFfgjP1BYc9NwoTAiCIGNeh4Lq/AOj3bp0jdQYUn8T7dBOQhAEuRNto5GeYjccQRraDAWczoAgCDJulGkoi3kPo9vnBy+PISwVyhOCIMgYVqARV4HQWEj9nWCA06DXDkEQ5E61igbrtweVgOFYSCFJLnBeQw8/Y4/0+Xy+1+PGq44gCDJ28HrcPD5/IGUCHvQ1oyEkyse/xeOHYPt1PzYsTOBytuDlRxAEGTu4nC1EmKDvrn4oPf/wLBz+rZwg+FP2Yf3xAAUJQRBkTOF03gQeb9jjLLxb+zRrKKd9Bxpx3bx23SddtP36Wn3OFgdefgRBkDEkSC0On88HvUeGArr03l19qOCHxOwazpcE+WFuzoWXH0EQZOzg5jgeb/ivA91itNFb7TtQb3k8Hp/Pb21ttVwzYgtAEAQZC9SbDL7WVj6f36O7HiF9ulVB4g22gPegXrtu5w4jbrL2mw47tgMEQZDbi4NtbnGw/DCiz64fgvDX3eIAUk9B6vPgEHrtequuH3h1hivYFBAEQW4vdQa9H3h9dtQhsYeC0ZeRddkNaiTxeDxCQFZXld9km7FBIAiC3BbbqLqqQiAU9y0tvcyj4Vk/Q7aQhiE2MKDXLhgjicfjhRFkQ/1/Wa5dxZaBIAgymliuGX+qrwsjhH12zv1040NQhKHJSkP3aQV+v793pB4bO//tL9Dx2y2+H/zQsdXf1y+PD2H8MEIgFInDxeIJInE4IRBic0EQBAkhXo/b5WxxOm+6nC1eN+fz+30+f79q1Jd51G2WQP8TC4J5manHRqL37t6a1OfGgY0nv9/P40EfB/Xa2hGZ5/f53V6Px+P1ejzNtutej9vna8XWgyAIEkJ4fL5AQIaFER6Px+/395hTN6gpNLzXj4KcoEAMpzwd+jRAoA/JAV67kRQoQgGR2+aCA4DH4wUAHl8Qxhd02V7Qr1kGgeZY/3Zer1gIgiBjXj94wXXxfY3u9PiCUee/Ph/4fF5eB72T7TZWBLxBFWVQ8yhIiBGrxD6MpHZN4vGgQ416KFPgUZ272gSmU88CI3dpT2fhA3b1FidcZxxBkDtZnAYxYvqcdNDL4dbHvO2BnXW3aB6FXpD689oNaiQFqgt03xqMJrWrUYeN1WYqdVZHp2L1oUx9iVNfNhMaTQiCjGHJCcJo6m/yW48vd/c5CDSAGvUym4I1j4ZTqP4EKZgRo2HE6em460uTuslPh3XV21SCDg9eoJHUh1XUXy10zxXeAwiCjE11GpJ0DSBFENyUhB5q1KezLlRvJvUZhwhFpQ0ypNS3466HUPU8pP3ANvkI1KpAWephMPUpTn1YQihCCIKMC8upz48VDSxFg6hRX0n1Z1RBiGZ7D0eQ+rR4glf6QMdd4GDSAJrUIUJdphL0ctMFKlPvSunMIVpCCIKMV2XqU4d6hQcSkj5X9YZhfYjvVj4R/v8Bg0QXqhUQQ4UAAAAASUVORK5CYII=';
-const PG={
-it:{
- intro:'Audiobook Maker genera, oltre ai file audio, un <b>pacchetto podcast completo</b> con feed RSS 2.0. Per renderlo fruibile come podcast, i file vanno pubblicati su un server web accessibile da Internet. La soluzione ideale è un <b>proprio sito web</b> o spazio hosting. In alternativa, per uso personale o per condividere con pochi amici, si può usare una soluzione gratuita come <b>Netlify</b>, descritta in questa guida.',
- scope:'👤 <b>Uso consigliato:</b> questa soluzione è pensata per uso personale o per condividere con amici e familiari. Netlify offre 100 GB/mese di banda gratuita — più che sufficienti.',
- sections:[
-  {icon:'🎧',title:'1. Genera l’audiolibro per capitoli',body:'Nell’app, carica il file EPUB, scegli lingua e voce, poi seleziona <b>📁 Per capitoli</b> nella sezione Output. Questo è fondamentale: il podcast richiede un file MP3 per ogni episodio.'},
-  {icon:'🌐',title:'2. Crea un account Netlify (gratuito)',body:'Vai su <b>app.netlify.com</b> e registrati con email o GitHub. Non serve carta di credito. Il piano gratuito include 100 GB di banda, 10 GB di storage e HTTPS automatico.'},
-  {icon:'📦',title:'3. Scarica il pacchetto podcast',body:'Prima di scaricare, dovrai inserire l’<b>URL Netlify</b> dove pubblicherai i file (es. <code>https://mio-libro.netlify.app/</code>). Questo URL viene incorporato nel feed RSS affinché le app podcast possano trovare gli episodi. Ci sono due modi per ottenere il pacchetto:<br><br><b>Opzione A — Attendi nella pagina:</b> a generazione completata, clicca <b>🎙️ Scarica podcast</b>. Ti verrà chiesto l’URL, poi il ZIP verrà scaricato.<br><img src="__IMG_A__" style="max-width:100%;border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)"><br><b>Opzione B — Notifica email:</b> per audiolibri lunghi, l’app offre di avvisarti via email. Nella finestra di notifica, seleziona <b>Podcast (con RSS)</b>, inserisci l’URL Netlify nel campo <b>URL base pubblicazione podcast</b>, poi la tua email. A generazione completata, riceverai un’email con il link per scaricare lo ZIP.<br><img src="__IMG_B__" style="max-width:100%;border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)"><br>Lo ZIP contiene: file MP3, feed RSS (XML), copertina e una pagina di presentazione (index.html).'},
-  {icon:'📤',title:'4. Carica su Netlify (drag-and-drop)',body:'Nella dashboard Netlify, sezione <b>Sites</b>, trascina l’intera cartella estratta dal ZIP nella zona tratteggiata. In pochi secondi il sito sarà online. Poi rinominalo da <i>Site configuration → Change site name</i>.'},
-  {icon:'✅',title:'5. Verifica',body:'Apri nel browser l’URL del feed:<br><code>https://nome-scelto.netlify.app/nome_podcast.xml</code><br>Se vedi il contenuto XML, il podcast è online e pronto!'},
- ],
- apps_title:'Importa nelle app podcast',
- apps:[
-  {name:'Apple Podcasts',platform:'iOS / Mac',steps:'<b>iPhone:</b> Libreria → ⋮ → Aggiungi tramite URL → incolla URL del feed XML<br><b>Mac:</b> File → Segui uno show tramite URL'},
-  {name:'Pocket Casts',platform:'Android / iOS / Web',steps:'Cerca → icona link (🔗) → incolla URL del feed → Iscriviti'},
-  {name:'AntennaPod',platform:'Android',steps:'+ → Aggiungi feed RSS tramite URL → incolla URL'},
-  {name:'Overcast',platform:'iOS',steps:'+ → Add URL → incolla URL del feed'},
-  {name:'Podcast Addict',platform:'Android',steps:'+ → Feed RSS → incolla URL'},
- ],
- spotify_note:'⚠️ <b>Spotify</b> non supporta l’aggiunta di feed RSS privati. Usa una delle app sopra.',
- tips_title:'Consigli',
- tips:['<b>Condividi:</b> invia l’URL del feed XML ad amici — non serve che abbiano Netlify.','<b>Aggiorna:</b> ricarica i file su Netlify per sostituire la versione precedente.','<b>Più libri:</b> crea un sito Netlify diverso per ogni audiolibro.','<b>Limiti:</b> 10 GB di storage (~12 audiolibri). Rimuovi quelli già ascoltati per fare spazio.'],
- benefits_title:'Perché ascoltare come podcast?',
- benefits:['Segnaposto automatico — riprendi da dove avevi lasciato','Ordine episodi e passaggio automatico al successivo','Copertina, titoli e metadati visibili nell’app','Velocità regolabile (1.5×, 2×…) e timer spegnimento','Streaming senza scaricare tutti i file'],
-},
-en:{
- intro:'Audiobook Maker generates, alongside audio files, a <b>complete podcast package</b> with an RSS 2.0 feed. To make it available as a podcast, the files need to be published on a web server accessible from the Internet. The ideal solution is your <b>own website</b> or hosting space. Alternatively, for personal use or sharing with a few friends, you can use a free solution like <b>Netlify</b>, described in this guide.',
- scope:'👤 <b>Recommended use:</b> this solution is designed for personal use or sharing with friends and family. Netlify offers 100 GB/month of free bandwidth — more than enough.',
- sections:[
-  {icon:'🎧',title:'1. Generate audiobook by chapters',body:'In the app, upload your EPUB file, choose language and voice, then select <b>📁 By chapters</b> in the Output section. This is essential: podcasts need one MP3 per episode.'},
-  {icon:'🌐',title:'2. Create a free Netlify account',body:'Go to <b>app.netlify.com</b> and sign up with email or GitHub. No credit card needed. The free plan includes 100 GB bandwidth, 10 GB storage, and automatic HTTPS.'},
-  {icon:'📦',title:'3. Download the podcast package',body:'Before downloading, you’ll need to enter the <b>Netlify URL</b> where you plan to publish the files (e.g. <code>https://my-book.netlify.app/</code>). This URL is embedded into the RSS feed so podcast apps can find your episodes. There are two ways to get the package:<br><br><b>Option A — Wait on the page:</b> once generation completes, click <b>🎙️ Download podcast</b>. You’ll be prompted for the URL, then the ZIP will download.<br><img src="__IMG_A__" style="max-width:100%;border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)"><br><b>Option B — Email notification:</b> for long audiobooks, the app offers to notify you by email. In the notification dialog, select <b>Podcast (with RSS)</b>, enter the Netlify URL in the <b>Podcast base URL</b> field, then your email. When generation finishes, you’ll receive an email with a download link for the podcast ZIP.<br><img src="__IMG_B__" style="max-width:100%;border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)"><br>The ZIP contains: MP3 files, RSS feed (XML), cover art, and a landing page (index.html).'},
-  {icon:'📤',title:'4. Upload to Netlify (drag & drop)',body:'In the Netlify dashboard, under <b>Sites</b>, drag the entire extracted folder onto the dashed drop zone. The site goes live in seconds. Then rename it from <i>Site configuration → Change site name</i>.'},
-  {icon:'✅',title:'5. Verify',body:'Open the feed URL in your browser:<br><code>https://your-name.netlify.app/book_podcast.xml</code><br>If you see XML content, your podcast is live!'},
- ],
- apps_title:'Import into podcast apps',
- apps:[
-  {name:'Apple Podcasts',platform:'iOS / Mac',steps:'<b>iPhone:</b> Library → ⋮ → Add Show by URL → paste feed URL<br><b>Mac:</b> File → Follow a Show by URL'},
-  {name:'Pocket Casts',platform:'Android / iOS / Web',steps:'Search → link icon (🔗) → paste feed URL → Subscribe'},
-  {name:'AntennaPod',platform:'Android',steps:'+ → Add RSS feed by URL → paste URL'},
-  {name:'Overcast',platform:'iOS',steps:'+ → Add URL → paste feed URL'},
-  {name:'Podcast Addict',platform:'Android',steps:'+ → RSS Feed → paste URL'},
- ],
- spotify_note:'⚠️ <b>Spotify</b> does not support adding private RSS feeds. Use one of the apps above.',
- tips_title:'Tips',
- tips:['<b>Share:</b> send the feed XML URL to friends — they don’t need a Netlify account.','<b>Update:</b> re-upload files to Netlify to replace the previous version.','<b>Multiple books:</b> create a separate Netlify site for each audiobook.','<b>Limits:</b> 10 GB storage (~12 audiobooks). Remove finished ones to free up space.'],
- benefits_title:'Why listen as a podcast?',
- benefits:['Auto bookmarks — resume where you left off','Episode ordering and auto-advance','Cover art, titles, and metadata in your app','Adjustable speed (1.5×, 2×…) and sleep timer','Streaming without downloading all files'],
-},
-fr:{
- intro:'Audiobook Maker génère, en plus des fichiers audio, un <b>package podcast complet</b> avec flux RSS 2.0. Pour le rendre accessible en podcast, les fichiers doivent être publiés sur un serveur web. La solution idéale est votre <b>propre site web</b> ou espace d’hébergement. En alternative, pour un usage personnel ou le partage avec quelques amis, vous pouvez utiliser une solution gratuite comme <b>Netlify</b>, décrite dans ce guide.',
- scope:'👤 <b>Usage recommandé :</b> cette solution est conçue pour un usage personnel ou le partage avec des proches. Netlify offre 100 Go/mois de bande passante gratuite.',
- sections:[
-  {icon:'🎧',title:'1. Générez le livre audio par chapitres',body:'Chargez votre fichier EPUB, choisissez la langue et la voix, puis sélectionnez <b>📁 Par chapitres</b>. Le podcast nécessite un fichier MP3 par épisode.'},
-  {icon:'🌐',title:'2. Créez un compte Netlify gratuit',body:'Rendez-vous sur <b>app.netlify.com</b>. Inscription par email ou GitHub, sans carte bancaire. Plan gratuit : 100 Go de bande passante, 10 Go de stockage, HTTPS automatique.'},
-  {icon:'📦',title:'3. Téléchargez le package podcast',body:'Avant de télécharger, vous devrez saisir l’<b>URL Netlify</b> où vous publierez les fichiers (ex: <code>https://mon-livre.netlify.app/</code>). Cette URL est intégrée dans le flux RSS pour que les apps podcast trouvent vos épisodes. Deux options pour obtenir le package :<br><br><b>Option A — Restez sur la page :</b> une fois la génération terminée, cliquez sur <b>🎙️ Télécharger podcast</b>. L’URL vous sera demandée, puis le ZIP sera téléchargé.<br><img src="__IMG_A__" style="max-width:100%;border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)"><br><b>Option B — Notification par email :</b> pour les longs livres audio, l’app propose de vous notifier par email. Dans la fenêtre, sélectionnez <b>Podcast (avec RSS)</b>, entrez l’URL Netlify dans le champ <b>URL de base du podcast</b>, puis votre email. À la fin, vous recevrez un email avec le lien de téléchargement.<br><img src="__IMG_B__" style="max-width:100%;border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)"><br>Le ZIP contient : fichiers MP3, flux RSS (XML), couverture et page d’accueil (index.html).'},
-  {icon:'📤',title:'4. Publiez sur Netlify (glisser-déposer)',body:'Dans le tableau de bord Netlify, section <b>Sites</b>, glissez le dossier extrait dans la zone en pointillés. Le site est en ligne en quelques secondes. Renommez-le ensuite.'},
-  {icon:'✅',title:'5. Vérifiez',body:'Ouvrez l’URL du flux dans votre navigateur :<br><code>https://nom-choisi.netlify.app/nom_podcast.xml</code><br>Si vous voyez du XML, le podcast est en ligne !'},
- ],
- apps_title:'Importer dans les apps podcast',
- apps:[
-  {name:'Apple Podcasts',platform:'iOS / Mac',steps:'<b>iPhone :</b> Bibliothèque → ⋮ → Ajouter via URL<br><b>Mac :</b> Fichier → Suivre une émission via URL'},
-  {name:'Pocket Casts',platform:'Android / iOS / Web',steps:'Rechercher → icône lien (🔗) → coller l’URL → S’abonner'},
-  {name:'AntennaPod',platform:'Android',steps:'+ → Ajouter un flux RSS par URL → coller l’URL'},
-  {name:'Overcast',platform:'iOS',steps:'+ → Add URL → coller l’URL du flux'},
-  {name:'Podcast Addict',platform:'Android',steps:'+ → Flux RSS → coller l’URL'},
- ],
- spotify_note:'⚠️ <b>Spotify</b> ne permet pas d’ajouter des flux RSS privés. Utilisez une app ci-dessus.',
- tips_title:'Conseils',
- tips:['<b>Partager :</b> envoyez l’URL du flux à vos proches.','<b>Mettre à jour :</b> rechargez les fichiers sur Netlify.','<b>Plusieurs livres :</b> créez un site par livre audio.','<b>Limites :</b> 10 Go de stockage (~12 livres audio).'],
- benefits_title:'Écouter en podcast : les avantages',
- benefits:['Signet automatique — reprenez où vous en étiez','Ordre des épisodes et passage automatique','Couverture et métadonnées dans l’app','Vitesse réglable et minuterie de sommeil','Streaming sans télécharger tous les fichiers'],
-},
-es:{
- intro:'Audiobook Maker genera, además de los archivos de audio, un <b>paquete podcast completo</b> con feed RSS 2.0. Para hacerlo accesible como podcast, los archivos deben publicarse en un servidor web. La solución ideal es tu <b>propio sitio web</b> o espacio de hosting. Como alternativa, para uso personal o para compartir con unos pocos amigos, puedes usar una solución gratuita como <b>Netlify</b>, descrita en esta guía.',
- scope:'👤 <b>Uso recomendado:</b> esta solución está pensada para uso personal o para compartir con amigos y familiares. Netlify ofrece 100 GB/mes de ancho de banda gratuito.',
- sections:[
-  {icon:'🎧',title:'1. Genera el audiolibro por capítulos',body:'Sube tu archivo EPUB, elige idioma y voz, y selecciona <b>📁 Por capítulos</b>. El podcast necesita un archivo MP3 por episodio.'},
-  {icon:'🌐',title:'2. Crea una cuenta gratuita en Netlify',body:'Ve a <b>app.netlify.com</b> y regístrate con email o GitHub. Sin tarjeta de crédito. Plan gratuito: 100 GB de ancho de banda, 10 GB de almacenamiento, HTTPS automático.'},
-  {icon:'📦',title:'3. Descarga el paquete podcast',body:'Antes de descargar, deberás introducir la <b>URL de Netlify</b> donde publicarás los archivos (ej: <code>https://mi-libro.netlify.app/</code>). Esta URL se incorpora al feed RSS para que las apps de podcast encuentren tus episodios. Hay dos formas de obtener el paquete:<br><br><b>Opción A — Espera en la página:</b> cuando termine la generación, haz clic en <b>🎙️ Descargar podcast</b>. Se te pedirá la URL y luego se descargará el ZIP.<br><img src="__IMG_A__" style="max-width:100%;border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)"><br><b>Opción B — Notificación por email:</b> para audiolibros largos, la app ofrece avisarte por email. En el diálogo de notificación, selecciona <b>Podcast (con RSS)</b>, introduce la URL de Netlify en el campo <b>URL base del podcast</b> y tu email. Al completarse, recibirás un email con el enlace de descarga.<br><img src="__IMG_B__" style="max-width:100%;border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)"><br>El ZIP contiene: archivos MP3, feed RSS (XML), portada y página de presentación (index.html).'},
-  {icon:'📤',title:'4. Sube a Netlify (arrastrar y soltar)',body:'En el panel de Netlify, sección <b>Sites</b>, arrastra la carpeta extraída a la zona punteada. El sitio estará en línea en segundos. Luego renombra desde <i>Site configuration → Change site name</i>.'},
-  {icon:'✅',title:'5. Verifica',body:'Abre la URL del feed en tu navegador:<br><code>https://nombre-elegido.netlify.app/nombre_podcast.xml</code><br>¡Si ves contenido XML, el podcast está en línea!'},
- ],
- apps_title:'Importar en apps de podcast',
- apps:[
-  {name:'Apple Podcasts',platform:'iOS / Mac',steps:'<b>iPhone:</b> Biblioteca → ⋮ → Añadir por URL<br><b>Mac:</b> Archivo → Seguir programa por URL'},
-  {name:'Pocket Casts',platform:'Android / iOS / Web',steps:'Buscar → icono enlace (🔗) → pegar URL → Suscribirse'},
-  {name:'AntennaPod',platform:'Android',steps:'+ → Añadir feed RSS por URL → pegar URL'},
-  {name:'Overcast',platform:'iOS',steps:'+ → Add URL → pegar URL del feed'},
-  {name:'Podcast Addict',platform:'Android',steps:'+ → Feed RSS → pegar URL'},
- ],
- spotify_note:'⚠️ <b>Spotify</b> no permite añadir feeds RSS privados. Usa una de las apps anteriores.',
- tips_title:'Consejos',
- tips:['<b>Comparte:</b> envía la URL del feed a tus amigos.','<b>Actualiza:</b> vuelve a subir los archivos a Netlify.','<b>Más libros:</b> crea un sitio Netlify por cada audiolibro.','<b>Límites:</b> 10 GB de almacenamiento (~12 audiolibros).'],
- benefits_title:'¿Por qué escuchar como podcast?',
- benefits:['Marcador automático — retoma donde lo dejaste','Orden de episodios y avance automático','Portada y metadatos visibles en la app','Velocidad ajustable y temporizador de sueño','Streaming sin descargar todos los archivos'],
-},
-de:{
- intro:'Audiobook Maker erzeugt neben den Audiodateien ein <b>komplettes Podcast-Paket</b> mit RSS 2.0-Feed. Um es als Podcast verfügbar zu machen, müssen die Dateien auf einem Webserver veröffentlicht werden. Die ideale Lösung ist eine <b>eigene Website</b> oder ein eigener Hosting-Bereich. Alternativ können Sie für den persönlichen Gebrauch oder zum Teilen mit wenigen Freunden eine kostenlose Lösung wie <b>Netlify</b> verwenden, die in dieser Anleitung beschrieben wird.',
- scope:'👤 <b>Empfohlene Nutzung:</b> Diese Lösung ist für den persönlichen Gebrauch oder zum Teilen mit Freunden und Familie gedacht. Netlify bietet 100 GB/Monat kostenlose Bandbreite.',
- sections:[
-  {icon:'🎧',title:'1. Hörbuch nach Kapiteln generieren',body:'Laden Sie Ihre EPUB-Datei hoch, wählen Sie Sprache und Stimme, dann <b>📁 Nach Kapiteln</b> bei der Ausgabe. Podcasts benötigen eine MP3 pro Episode.'},
-  {icon:'🌐',title:'2. Kostenloses Netlify-Konto erstellen',body:'Gehen Sie zu <b>app.netlify.com</b> und registrieren Sie sich. Keine Kreditkarte nötig. Kostenlos: 100 GB Bandbreite, 10 GB Speicher, automatisches HTTPS.'},
-  {icon:'📦',title:'3. Podcast-Paket herunterladen',body:'Vor dem Download müssen Sie die <b>Netlify-URL</b> eingeben, unter der die Dateien veröffentlicht werden (z.B. <code>https://mein-buch.netlify.app/</code>). Diese URL wird in den RSS-Feed eingebettet, damit Podcast-Apps Ihre Episoden finden. Es gibt zwei Wege:<br><br><b>Option A — Auf der Seite warten:</b> nach Abschluss der Generierung klicken Sie auf <b>🎙️ Podcast herunterladen</b>. Sie werden nach der URL gefragt, dann wird das ZIP heruntergeladen.<br><img src="__IMG_A__" style="max-width:100%;border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)"><br><b>Option B — E-Mail-Benachrichtigung:</b> bei langen Hörbüchern bietet die App eine E-Mail-Benachrichtigung an. Wählen Sie <b>Podcast (mit RSS)</b>, geben Sie die Netlify-URL im Feld <b>Podcast-Basis-URL</b> ein und Ihre E-Mail. Nach Abschluss erhalten Sie eine E-Mail mit dem Download-Link.<br><img src="__IMG_B__" style="max-width:100%;border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)"><br>Das ZIP enthält: MP3-Dateien, RSS-Feed (XML), Cover und eine Startseite (index.html).'},
-  {icon:'📤',title:'4. Auf Netlify hochladen (Drag & Drop)',body:'Im Netlify-Dashboard unter <b>Sites</b> den extrahierten Ordner in die gestrichelte Zone ziehen. Die Seite ist in Sekunden online. Dann unter <i>Site configuration → Change site name</i> umbenennen.'},
-  {icon:'✅',title:'5. Überprüfen',body:'Öffnen Sie die Feed-URL im Browser:<br><code>https://name.netlify.app/buch_podcast.xml</code><br>Wenn Sie XML-Inhalt sehen, ist der Podcast online!'},
- ],
- apps_title:'In Podcast-Apps importieren',
- apps:[
-  {name:'Apple Podcasts',platform:'iOS / Mac',steps:'<b>iPhone:</b> Mediathek → ⋮ → Über URL hinzufügen<br><b>Mac:</b> Ablage → Show per URL folgen'},
-  {name:'Pocket Casts',platform:'Android / iOS / Web',steps:'Suche → Link-Symbol (🔗) → URL einfügen → Abonnieren'},
-  {name:'AntennaPod',platform:'Android',steps:'+ → RSS-Feed per URL hinzufügen → URL einfügen'},
-  {name:'Overcast',platform:'iOS',steps:'+ → Add URL → Feed-URL einfügen'},
-  {name:'Podcast Addict',platform:'Android',steps:'+ → RSS-Feed → URL einfügen'},
- ],
- spotify_note:'⚠️ <b>Spotify</b> unterstützt keine privaten RSS-Feeds. Nutzen Sie eine der oben genannten Apps.',
- tips_title:'Tipps',
- tips:['<b>Teilen:</b> Senden Sie die Feed-URL an Freunde.','<b>Aktualisieren:</b> Laden Sie neue Dateien auf Netlify hoch.','<b>Mehrere Bücher:</b> Erstellen Sie eine separate Netlify-Site pro Hörbuch.','<b>Limits:</b> 10 GB Speicher (~12 Hörbücher).'],
- benefits_title:'Warum als Podcast hören?',
- benefits:['Automatisches Lesezeichen — dort weitermachen, wo Sie aufgehört haben','Episodenreihenfolge und automatischer Wechsel','Cover und Metadaten in der App sichtbar','Einstellbare Geschwindigkeit und Schlaf-Timer','Streaming ohne alle Dateien herunterzuladen'],
-},
-zh:{
- intro:'Audiobook Maker 除了生成音频文件外，还会生成一个包含RSS 2.0订阅源的<b>完整播客包</b>。要将其作为播客发布，需要将文件放在可访问的网络服务器上。理想的方案是使用<b>自己的网站</b>或托管空间。作为替代，如果仅供个人使用或与少数朋友分享，可以使用本指南介绍的免费方案<b>Netlify</b>。',
- scope:'👤 <b>建议用途：</b>此方案适合个人使用或与亲友分享。Netlify每月提供100 GB免费流量。',
- sections:[
-  {icon:'🎧',title:'1. 按章节生成有声读物',body:'上传EPUB文件，选择语言和语音，然后在输出部分选择<b>📁 按章节</b>。播客需要每集一个MP3文件。'},
-  {icon:'🌐',title:'2. 创建Nelify免费账户',body:'访问<b>app.netlify.com</b>，用邮箱或GitHub注册。无需信用卡。免费计划：100 GB流量、10 GB存储、自动HTTPS。'},
-  {icon:'📦',title:'3. 下载播客包',body:'下载前需要输入您计划发布文件的<b>Netlify URL</b>（如 <code>https://my-book.netlify.app/</code>）。该URL会嵌入RSS订阅源，以便播客应用找到您的剧集。有两种获取方式：<br><br><b>方式A — 在页面等待：</b>生成完成后，点击<b>🎙️ 下载播客</b>。系统会要求您输入URL，然后ZIP将开始下载。<br><img src="__IMG_A__" style="max-width:100%;border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)"><br><b>方式B — 邮件通知：</b>对于较长的有声读物，应用提供邮件通知功能。在通知对话框中，选择<b>播客（含RSS）</b>，在<b>播客发布基础URL</b>字段中输入Netlify URL，然后输入邮箱。生成完成后，您将收到包含下载链接的邮件。<br><img src="__IMG_B__" style="max-width:100%;border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)"><br>ZIP包含：MP3文件、RSS订阅源（XML）、封面和落地页（index.html）。'},
-  {icon:'📤',title:'4. 上传到Netlify（拖放）',body:'在Netlify控制台的<b>Sites</b>部分，将解压的文件夹拖到虚线区域。网站即刻上线。然后在 <i>Site configuration → Change site name</i> 重命名。'},
-  {icon:'✅',title:'5. 验证',body:'在浏览器中打开订阅源URL：<br><code>https://your-name.netlify.app/book_podcast.xml</code><br>如果看到XML内容，播客已上线！'},
- ],
- apps_title:'导入播客应用',
- apps:[
-  {name:'Apple Podcasts',platform:'iOS / Mac',steps:'<b>iPhone:</b> 资料库 → ⋮ → 通过URL添加<br><b>Mac:</b> 文件 → 通过URL关注节目'},
-  {name:'Pocket Casts',platform:'Android / iOS / Web',steps:'搜索 → 链接图标 (🔗) → 粘贴URL → 订阅'},
-  {name:'AntennaPod',platform:'Android',steps:'+ → 通过URL添加RSS订阅源 → 粘贴URL'},
-  {name:'Overcast',platform:'iOS',steps:'+ → Add URL → 粘贴订阅源URL'},
-  {name:'Podcast Addict',platform:'Android',steps:'+ → RSS Feed → 粘贴URL'},
- ],
- spotify_note:'⚠️ <b>Spotify</b> 不支持添加私有RSS订阅源。请使用以上应用。',
- tips_title:'小贴士',
- tips:['<b>分享：</b>将订阅源URL发送给朋友。','<b>更新：</b>重新上传文件到Netlify。','<b>多本书：</b>每本书创建一个Nelify网站。','<b>限制：</b>10 GB存储（约12本有声读物）。'],
- benefits_title:'为什么以播客形式收听？',
- benefits:['自动书签 — 从上次停下的地方继续','剧集顺序和自动播放下一集','应用中显示封面和元数据','可调速度和睡眠定时器','流式播放无需下载所有文件'],
+// Guida renderizzata dal server per lingua (templates/podcast_guide.py, testi in
+// i18n/<lang>.json): l'HTML si scarica solo alla prima apertura della guida,
+// per la lingua corrente (cache immutabile, ?v=hash), e resta in PG_HTML.
+const PG_HTML=Object.create(null);
+let pgLang=null;  // lingua attualmente renderizzata in #pgBody
+function loadPG(code){
+  if(PG_HTML[code])return Promise.resolve(PG_HTML[code]);
+  return fetch('/i18n/podcast_guide.'+code+'.html?v='+I18N_V).then(r=>{if(!r.ok)throw new Error('HTTP '+r.status);return r.text()}).then(t=>PG_HTML[code]=t);
 }
-};
-
-function buildPodcastGuide(){
-  const g=PG[cl]||PG.en;
-  let h='<style>.pg-guide code{background:var(--srf2);color:var(--ac);padding:2px 6px;border-radius:4px;font-size:.85em;word-break:break-all}.pg-guide a{color:var(--ac)}.pg-guide i{color:inherit;opacity:.85}</style>';
-  h+='<div class="pg-guide" style="font-size:.93rem;line-height:1.6;color:var(--tx)">';
-  // Intro
-  h+='<p style="margin:0 0 10px;color:var(--tx)">'+g.intro+'</p>';
-  h+='<div style="background:#fff3cd;border-left:4px solid #f0c040;padding:10px 14px;border-radius:6px;margin:0 0 18px;font-size:.88rem;color:#5a4510">'+g.scope+'</div>';
-  // Steps
-  g.sections.forEach(sec=>{
-    h+='<div style="display:flex;gap:12px;margin-bottom:14px;align-items:flex-start">';
-    h+='<div style="font-size:1.4rem;line-height:1;flex-shrink:0;margin-top:2px">'+sec.icon+'</div>';
-    h+='<div><div style="font-weight:700;margin-bottom:4px;color:var(--tx)">'+sec.title+'</div>';
-    h+='<div style="color:var(--txd)">'+sec.body.replace(/__IMG_A__/g,PG_IMG_A).replace(/__IMG_B__/g,PG_IMG_B)+'</div></div></div>';
-  });
-  // Divider
-  h+='<hr style="border:none;border-top:1px solid var(--brd);margin:20px 0">';
-  // Apps
-  h+='<h3 style="margin:0 0 12px;font-size:1.05rem;color:var(--tx)">📱 '+g.apps_title+'</h3>';
-  h+='<table style="width:100%;border-collapse:collapse;font-size:.88rem;margin-bottom:10px;color:var(--tx)">';
-  h+='<thead><tr style="background:var(--srf2)"><th style="padding:8px 10px;text-align:left;border-bottom:2px solid var(--brd)">App</th><th style="padding:8px 10px;text-align:left;border-bottom:2px solid var(--brd)">Platform</th><th style="padding:8px 10px;text-align:left;border-bottom:2px solid var(--brd)">Steps</th></tr></thead><tbody>';
-  g.apps.forEach(a=>{
-    h+='<tr><td style="padding:7px 10px;border-bottom:1px solid var(--brd);font-weight:600;white-space:nowrap">'+a.name+'</td>';
-    h+='<td style="padding:7px 10px;border-bottom:1px solid var(--brd);color:var(--txd);font-size:.82rem;white-space:nowrap">'+a.platform+'</td>';
-    h+='<td style="padding:7px 10px;border-bottom:1px solid var(--brd)">'+a.steps+'</td></tr>';
-  });
-  h+='</tbody></table>';
-  h+='<div style="background:#fff0f0;border-left:4px solid #e04040;padding:8px 14px;border-radius:6px;margin:0 0 18px;font-size:.85rem;color:#802020">'+g.spotify_note+'</div>';
-  // Benefits
-  h+='<h3 style="margin:0 0 10px;font-size:1.05rem;color:var(--tx)">🎧 '+g.benefits_title+'</h3>';
-  h+='<div style="display:flex;flex-wrap:wrap;gap:8px;margin-bottom:18px">';
-  g.benefits.forEach(b=>{
-    h+='<div style="background:var(--srf2);color:var(--tx);padding:6px 12px;border-radius:16px;font-size:.84rem">✓ '+b+'</div>';
-  });
-  h+='</div>';
-  // Tips
-  h+='<h3 style="margin:0 0 10px;font-size:1.05rem;color:var(--tx)">💡 '+g.tips_title+'</h3>';
-  g.tips.forEach(tip=>{
-    h+='<div style="padding:4px 0;font-size:.88rem;color:var(--tx)">• '+tip+'</div>';
-  });
-  h+='</div>';
-  document.getElementById('pgBody').innerHTML=h;
+async function buildPodcastGuide(){
+  const lang=cl;
+  if(pgLang===lang)return;  // riapertura nella stessa lingua: nessuna mutazione DOM
+  let html;
+  try{html=await loadPG(lang).catch(()=>loadPG('en'))}
+  catch(e){
+    // Nemmeno l'inglese: messaggio nella modale (chiudibile), nuovo tentativo alla prossima apertura
+    console.warn('podcast guide:',e);
+    if(cl===lang){E.pgBody.textContent=t('pg_load_err');pgLang=null}
+    return;
+  }
+  if(cl!==lang)return;  // lingua cambiata durante il download: si ricostruisce alla prossima apertura
+  E.pgBody.innerHTML=html;
+  pgLang=lang;
 }
-function openPodcastGuide(){buildPodcastGuide();document.getElementById('pgModal').classList.add('open')}
-function closePodcastGuide(){document.getElementById('pgModal').classList.remove('open')}
+function openPodcastGuide(){buildPodcastGuide();E.pgModal.classList.add('open')}
+function closePodcastGuide(){E.pgModal.classList.remove('open')}
 
 // ═══════════════════ ABOUT PROJECT ═══════════════════
-const ABOUT={
-it:{link:"Informazioni sul progetto",title:"Informazioni sul progetto",paras:[
-"Il progetto Audiobook Maker nasce per rispondere ad un mio personale desiderio di poter ascoltare, sfruttando i miei spostamenti di lavoro, alcuni libri che non ho tempo di “leggere con gli occhi”.",
-"Mi sono messo al lavoro dopo aver constatato che non esistono strumenti pronti e semplici per tradurre un libro in audio con lettori di buona qualità.",
-"Successivamente, parlandone con amici, mi sono reso conto che uno strumento del genere potrebbe essere di aiuto ad altre persone come me e, soprattutto, alle tante persone che, per vari motivi (ipovedenti, dislessia,...), hanno difficoltà di lettura.",
-"Ho pensato dunque di mettere a disposizione di tutti questo strumento gratuitamente.",
-"Provatelo, usatelo e per segnalazione di errori o per suggerimenti su nuove funzionalità, scrivetemi a:"]},
-en:{link:"About this project",title:"About this project",paras:[
-"The Audiobook Maker project was born from my personal desire to listen to some books I don’t have time to “read with my eyes”, taking advantage of my work commute.",
-"I started working on it after realizing that there are no ready-made, simple tools to convert a book into audio with good quality readers.",
-"Later, talking about it with friends, I realized that such a tool could help other people like me and, above all, the many people who, for various reasons (visually impaired, dyslexia,...), have reading difficulties.",
-"So I decided to make this tool available to everyone for free.",
-"Try it, use it, and for bug reports or suggestions for new features, write to me at:"]},
-fr:{link:"À propos du projet",title:"À propos du projet",paras:[
-"Le projet Audiobook Maker est né de mon désir personnel de pouvoir écouter, en profitant de mes trajets professionnels, certains livres que je n’ai pas le temps de « lire avec les yeux ».",
-"Je me suis mis au travail après avoir constaté qu’il n’existe pas d’outils simples et prêts à l’emploi pour convertir un livre en audio avec des lecteurs de bonne qualité.",
-"Par la suite, en en parlant avec des amis, j’ai réalisé qu’un tel outil pourrait aider d’autres personnes comme moi et, surtout, les nombreuses personnes qui, pour diverses raisons (malvoyants, dyslexie,...), ont des difficultés de lecture.",
-"J’ai donc décidé de mettre cet outil à la disposition de tous gratuitement.",
-"Essayez-le, utilisez-le et pour signaler des erreurs ou suggérer de nouvelles fonctionnalités, écrivez-moi à :"]},
-es:{link:"Sobre el proyecto",title:"Sobre el proyecto",paras:[
-"El proyecto Audiobook Maker nace de mi deseo personal de poder escuchar, aprovechando mis desplazamientos de trabajo, algunos libros que no tengo tiempo de “leer con los ojos”.",
-"Me puse a trabajar tras constatar que no existen herramientas listas y sencillas para convertir un libro en audio con lectores de buena calidad.",
-"Posteriormente, hablando con amigos, me di cuenta de que una herramienta así podría ayudar a otras personas como yo y, sobre todo, a las muchas personas que, por diversos motivos (discapacidad visual, dislexia,...), tienen dificultades de lectura.",
-"Así que decidí poner esta herramienta a disposición de todos de forma gratuita.",
-"Pruébenlo, úsenlo y para reportar errores o sugerir nuevas funcionalidades, escríbanme a:"]},
-de:{link:"Über das Projekt",title:"Über das Projekt",paras:[
-"Das Projekt Audiobook Maker entstand aus meinem persönlichen Wunsch, einige Bücher, für die ich keine Zeit habe sie „mit den Augen zu lesen“, während meiner Arbeitswege hören zu können.",
-"Ich machte mich an die Arbeit, nachdem ich festgestellt hatte, dass es keine fertigen und einfachen Tools gibt, um ein Buch mit guten Vorlesestimmen in Audio umzuwandeln.",
-"Später, im Gespräch mit Freunden, wurde mir klar, dass ein solches Tool auch anderen Menschen wie mir helfen könnte und vor allem den vielen Menschen, die aus verschiedenen Gründen (Sehbehinderung, Legasthenie,...) Leseschwierigkeiten haben.",
-"Deshalb habe ich beschlossen, dieses Tool allen kostenlos zur Verfügung zu stellen.",
-"Probieren Sie es aus, nutzen Sie es und schreiben Sie mir für Fehlermeldungen oder Vorschläge für neue Funktionen an:"]},
-zh:{link:"关于本项目",title:"关于本项目",paras:[
-"Audiobook Maker项目源于我个人的愿望：利用工作通勤时间，收听一些我没有时间“用眼睛阅读”的书籍。",
-"在发现市面上没有现成的、简单的工具可以用高质量的语音将书籍转换为音频后，我开始着手开发。",
-"后来，与朋友交流后，我意识到这样的工具不仅能帮助像我这样的人，更重要的是能帮助许多因各种原因（视力障碍、读写困难等）而有阅读困难的人。",
-"因此我决定将这个工具免费提供给所有人。",
-"试试看，用起来，如果您有错误报告或新功能建议，请写信给我："]}
-};
-function buildAbout(){
-  const a=ABOUT[cl]||ABOUT.en;
-  document.getElementById('aboutBtn').textContent=a.link;
-  document.getElementById('aboutTitle').textContent=a.title;
-  const b=document.getElementById('aboutBody');
-  b.innerHTML=a.paras.map(p=>'<p class="about-text">'+p+'</p>').join('')
+const ABOUT_HTML=Object.create(null);
+let aboutLang=null;  // lingua attualmente renderizzata in #aboutBody
+function aboutHtml(a){
+  return a.paras.map(p=>'<p class="about-text">'+p+'</p>').join('')
     +'<p class="about-contact">&#x2709;&#xFE0F; <a href="mailto:gfrangiamone@gmail.com">gfrangiamone@gmail.com</a> (Giuseppe Frangiamone)</p>';
 }
-function openAbout(){buildAbout();document.getElementById('aboutModal').classList.add('open')}
+function buildAbout(){
+  // Testi dal dizionario della lingua (sezione "about" di i18n/<lang>.json),
+  // già in L quando cl è attiva; riapertura nella stessa lingua: nessuna mutazione DOM
+  if(aboutLang===cl||!L[cl])return;
+  const a=L[cl].about;
+  E.aboutBtn.textContent=a.link;
+  E.aboutTitle.textContent=a.title;
+  E.aboutBody.innerHTML=ABOUT_HTML[cl]||(ABOUT_HTML[cl]=aboutHtml(a));
+  aboutLang=cl;
+}
+function openAbout(){buildAbout();E.aboutModal.classList.add('open')}
+function closeAbout(){E.aboutModal.classList.remove('open')}
 
@@ -1,13 +1,27 @@
 """
 HTML template for the Audiobook Maker landing page.
 
-The template is assembled from modular fragments at startup:
-  - _fragments/html_head.html         : HTML structure, CSS, early JS
-  - _fragments/i18n_data.js           : UI translations (6 languages)
+The page is assembled from modular fragments at startup:
+  - _fragments/html_head.html         : HTML structure, CSS, early JS, <script src> of the app bundle
+  - _fragments/html_tail.html         : Closing tags
+
+The page JavaScript is NOT inlined: it is one static bundle, identical for
+every language, served from /assets/app.<hash>.js with an immutable cache:
+  - _fragments/i18n_data.js           : UI translations loader (t(), loadLang())
   - _fragments/free_books_data.js     : Free book sites data + functions
-  - _fragments/podcast_guide_data.js  : Podcast guide (base64 images + per-language sections + About)
-  - _fragments/seo_data.js            : SEO metadata per language + applySEO()
-  - _fragments/html_tail.html         : Active jobs monitor, applyI18n, main app logic, closing tags
+  - _fragments/podcast_guide_data.js  : Podcast guide loader + About
+  - _fragments/seo_data.js            : applySEO() (client-side language switch)
+  - _fragments/app.js                 : Active jobs monitor, applyI18n, main app logic
+
+UI translations:
+  The dictionaries live in i18n/<lang>.json (source of truth). Only the page
+  language is inlined (#i18n-boot); the others are fetched from
+  /i18n/<lang>.json?v=<hash> when the user switches language.
+  The same payload carries the About texts ("about") and the SEO metadata
+  ("seo") of its language.
+  The podcast guide texts live in the same files ("podcast_guide"); they are
+  rendered to HTML at startup (podcast_guide.py) and fetched from
+  /i18n/podcast_guide.<lang>.html?v=<hash> when the guide opens.
 
 Server-side SEO:
   Meta tags (title, description, OG, hreflang, canonical, JSON-LD) are injected
@@ -16,17 +30,26 @@ Server-side SEO:
   before </body> via seo_content.build_seo_content_html().
 """
 
+import hashlib
+import json
+from functools import lru_cache
 from pathlib import Path
 
 _FRAGMENTS_DIR = Path(__file__).parent / "_fragments"
+_I18N_DIR = Path(__file__).parent.parent / "i18n"
+_STATIC_DIR = Path(__file__).parent.parent / "static"
 
 _FRAGMENT_ORDER = [
     "html_head.html",
+    "html_tail.html",
+]
+
+_SCRIPT_ORDER = [
     "i18n_data.js",
     "free_books_data.js",
     "podcast_guide_data.js",
     "seo_data.js",
-    "html_tail.html",
+    "app.js",
 ]
 
 # hreflang mapping
@@ -37,6 +60,108 @@ _HREFLANG_MAP = {
 _SUPPORTED_LANGS = list(_HREFLANG_MAP.keys())
 
 
+def _load_i18n_section(section: str) -> dict[str, dict]:
+    """Read one top-level section of every i18n/<lang>.json."""
+    return {
+        lang: json.loads((_I18N_DIR / f"{lang}.json").read_text(encoding="utf-8"))[section]
+        for lang in _SUPPORTED_LANGS
+    }
+
+
+@lru_cache(maxsize=None)
+def load_seo_data() -> dict[str, dict]:
+    """Per-language SEO metadata (``seo`` in i18n/<lang>.json).
+
+    Keys: title, desc, kw, ld_name, ld_desc. Used for the server-rendered
+    <head> and sitemap, and shipped to the page for client-side switches.
+    """
+    return _load_i18n_section("seo")
+
+
+@lru_cache(maxsize=None)
+def load_i18n_payloads() -> dict[str, bytes]:
+    """Load the per-language page dictionaries from i18n/<lang>.json as compact UTF-8 JSON.
+
+    Returns:
+        Dict lang -> JSON bytes of the flat ``ui`` dictionary plus the
+        ``about`` and ``seo`` objects under the keys of the same name, ready
+        to be inlined in the page or served as-is by the /i18n/<lang>.json route.
+    """
+    about = _load_i18n_section("about")
+    seo = load_seo_data()
+    return {
+        lang: json.dumps({**ui, "about": about[lang], "seo": seo[lang]},
+                         ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        for lang, ui in _load_i18n_section("ui").items()
+    }
+
+
+@lru_cache(maxsize=None)
+def build_podcast_guide_partials() -> dict[str, bytes]:
+    """Render the podcast guide (``podcast_guide`` in i18n/<lang>.json) per language.
+
+    Served as /i18n/podcast_guide.<lang>.html and fetched by the page only
+    when the guide is opened, for the current language. The __IMG_A__ /
+    __IMG_B__ placeholders in the step bodies are resolved here, once, to
+    the screenshots' /assets/ URLs.
+    """
+    from templates.podcast_guide import build_podcast_guide_html
+
+    img_a = static_asset_url("pg_a.png")
+    img_b = static_asset_url("pg_b.png")
+    return {
+        lang: build_podcast_guide_html(guide)
+        .replace("__IMG_A__", img_a).replace("__IMG_B__", img_b).encode("utf-8")
+        for lang, guide in _load_i18n_section("podcast_guide").items()
+    }
+
+
+@lru_cache(maxsize=None)
+def i18n_version() -> str:
+    """Short content hash of everything served under /i18n/ (cache-busting ?v= token)."""
+    h = hashlib.sha256()
+    for payloads in (load_i18n_payloads(), build_podcast_guide_partials()):
+        for body in payloads.values():
+            h.update(body)
+    return h.hexdigest()[:10]
+
+
+@lru_cache(maxsize=None)
+def static_asset_url(fname: str) -> str:
+    """Content-addressed /assets/ URL for a file in static/, hashed once.
+
+    A .webp sibling (served at the same URL via Accept negotiation) is part
+    of the hash, so the URL changes whenever either variant does.
+    """
+    path = _STATIC_DIR / fname
+    h = hashlib.sha256(path.read_bytes())
+    webp = path.with_suffix(".webp")
+    if webp != path and webp.exists():
+        h.update(webp.read_bytes())
+    return f"/assets/{path.stem}.{h.hexdigest()[:10]}{path.suffix}"
+
+
+@lru_cache(maxsize=None)
+def build_app_script() -> bytes:
+    """Concatenate the JS fragments into the page bundle (UTF-8 bytes).
+
+    The i18n version (__I18N_V__) and the hashed URL of the free-books icon
+    sprite (__FB_ICONS_URL__) are filled in here, so the bundle hash follows them.
+    """
+    parts = [(_FRAGMENTS_DIR / fname).read_text(encoding="utf-8") for fname in _SCRIPT_ORDER]
+    js = "\n".join(parts)
+    js = js.replace("__I18N_V__", i18n_version())
+    js = js.replace("__FB_ICONS_URL__", static_asset_url("fb-icons.svg"))
+    return js.encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def app_script_url() -> str:
+    """Content-addressed URL of the JS bundle: changes whenever the code does."""
+    digest = hashlib.sha256(build_app_script()).hexdigest()[:10]
+    return f"/assets/app.{digest}.js"
+
+
 def build_html_template(
     lang: str = "en",
     seo: dict | None = None,
@@ -50,6 +175,8 @@ def build_html_template(
 
     Injections:
       1. <head> meta tags via placeholder replacement (__SEO_TITLE__, etc.)
+         plus the boot-language UI dictionary (__I18N_BOOT__), the
+         bundle URL (__APP_JS__) and the favicon URL (__FAVICON_URL__)
       2. Visible SEO content block (text, features, FAQ) before </body>
       3. FAQPage JSON-LD schema in the SEO content block
       4. Version badge before </body>
@@ -102,6 +229,14 @@ def build_html_template(
         for placeholder, value in replacements.items():
             html = html.replace(placeholder, value)
 
+    # ── 2b. Boot-language UI strings (others load on demand) + JS bundle URL ──
+    payloads = load_i18n_payloads()
+    boot = payloads.get(lang, payloads["en"]).decode("utf-8")
+    boot_json = '{"%s":%s}' % (lang, boot)
+    html = html.replace("__I18N_BOOT__", boot_json.replace("</", "<\\/"))
+    html = html.replace("__APP_JS__", app_script_url())
+    html = html.replace("__FAVICON_URL__", static_asset_url("favicon.svg"))
+
     # ── 3. Inject visible SEO content block before </body> ──
     from seo_content import build_seo_content_html
     seo_block = build_seo_content_html(lang)
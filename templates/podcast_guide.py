@@ -1,26 +1,101 @@
 """
-Podcast guide data — base64 images and per-language guide sections.
+Podcast guide — server-side rendering of the per-language guide HTML.
 
-The actual JavaScript data is stored in:
-    _fragments/podcast_guide_data.js
+The guide texts are stored in i18n/<lang>.json under "podcast_guide".
+At startup index_page.build_podcast_guide_partials() renders them with
+build_podcast_guide_html() into one HTML partial per language, served as
+/i18n/podcast_guide.<lang>.html and fetched by the page only when the
+guide is opened (loader in _fragments/podcast_guide_data.js).
 
-This file documents the structure for reference. The JS data contains:
-
-Images (base64 encoded PNG):
-    PG_IMG_A — Screenshot of Netlify dashboard (drag & drop deploy)
-    PG_IMG_B — Screenshot of Netlify deploy result
+Images (placeholders in the step bodies):
+    __IMG_A__ — Screenshot of Netlify dashboard (drag & drop deploy),
+                static/pg_a.png, served at /assets/pg_a.<hash>.png (lazy-loaded <img>)
+    __IMG_B__ — Screenshot of Netlify deploy result,
+                static/pg_b.png, served at /assets/pg_b.<hash>.png (lazy-loaded <img>)
 
 Guide sections per language (it, en, fr, es, de, zh):
     Each language has:
-    - intro: Introduction text explaining the podcast feature
-    - img: Base64 image tag (used in guide steps)
+    - intro, scope: Introduction text and recommended-use box
     - sections: List of {title, body} objects for each guide step
-
-About section per language:
-    - link: Link text for the About button
-    - title: Modal title
-    - paras: List of paragraphs describing the project
+      (image placeholders are replaced with the screenshot URLs by
+      index_page.build_podcast_guide_partials(), once at startup)
+    - apps_title, app_steps: Podcast apps table, one "steps" cell per app
+    - spotify_note, tips_title, tips, benefits_title, benefits
+    The language-independent parts (PG_STEP_ICONS, PG_APPS) are defined
+    below and matched by index.
 
 To modify the podcast guide content, edit:
-    templates/_fragments/podcast_guide_data.js
+    i18n/<lang>.json ("podcast_guide")
 """
+
+# Parti invarianti della guida, uguali in tutte le lingue
+PG_STEP_ICONS = ("🎧", "🌐", "📦", "📤", "✅")
+PG_APPS = (
+    ("Apple Podcasts", "iOS / Mac"),
+    ("Pocket Casts", "Android / iOS / Web"),
+    ("AntennaPod", "Android"),
+    ("Overcast", "iOS"),
+    ("Podcast Addict", "Android"),
+)
+
+_STYLE = (
+    "<style>"
+    ".pg-guide code{background:var(--srf2);color:var(--ac);padding:2px 6px;border-radius:4px;font-size:.85em;word-break:break-all}"
+    ".pg-guide a{color:var(--ac)}"
+    ".pg-guide i{color:inherit;opacity:.85}"
+    ".pg-guide .pg-hero-img{max-width:100%;height:auto;background:var(--srf2);border-radius:8px;margin:10px 0;border:1px solid var(--brd);box-shadow:0 2px 8px rgba(0,0,0,.08)}"
+    "</style>"
+)
+_TH = '<th style="padding:8px 10px;text-align:left;border-bottom:2px solid var(--brd)">'
+
+
+def build_podcast_guide_html(g: dict) -> str:
+    """Render the guide for one language.
+
+    Args:
+        g: The "podcast_guide" section of an i18n/<lang>.json file. Its
+           strings are author-controlled HTML and are inserted as-is.
+
+    Returns:
+        The HTML assigned to #pgBody when the guide modal opens.
+    """
+    h = [_STYLE, '<div class="pg-guide" style="font-size:.93rem;line-height:1.6;color:var(--tx)">']
+    # Intro
+    h.append('<p style="margin:0 0 10px;color:var(--tx)">' + g["intro"] + "</p>")
+    h.append('<div style="background:#fff3cd;border-left:4px solid #f0c040;padding:10px 14px;'
+             'border-radius:6px;margin:0 0 18px;font-size:.88rem;color:#5a4510">' + g["scope"] + "</div>")
+    # Steps
+    for icon, sec in zip(PG_STEP_ICONS, g["sections"]):
+        h.append('<div style="display:flex;gap:12px;margin-bottom:14px;align-items:flex-start">')
+        h.append('<div style="font-size:1.4rem;line-height:1;flex-shrink:0;margin-top:2px">' + icon + "</div>")
+        h.append('<div><div style="font-weight:700;margin-bottom:4px;color:var(--tx)">' + sec["title"] + "</div>")
+        h.append('<div style="color:var(--txd)">' + sec["body"] + "</div></div></div>")
+    # Divider
+    h.append('<hr style="border:none;border-top:1px solid var(--brd);margin:20px 0">')
+    # Apps
+    h.append('<h3 style="margin:0 0 12px;font-size:1.05rem;color:var(--tx)">📱 ' + g["apps_title"] + "</h3>")
+    h.append('<table style="width:100%;border-collapse:collapse;font-size:.88rem;margin-bottom:10px;color:var(--tx)">')
+    h.append('<thead><tr style="background:var(--srf2)">' + _TH + "App</th>" + _TH + "Platform</th>"
+             + _TH + "Steps</th></tr></thead><tbody>")
+    for (name, platform), steps in zip(PG_APPS, g["app_steps"]):
+        h.append('<tr><td style="padding:7px 10px;border-bottom:1px solid var(--brd);font-weight:600;white-space:nowrap">'
+                 + name + "</td>")
+        h.append('<td style="padding:7px 10px;border-bottom:1px solid var(--brd);color:var(--txd);font-size:.82rem;white-space:nowrap">'
+                 + platform + "</td>")
+        h.append('<td style="padding:7px 10px;border-bottom:1px solid var(--brd)">' + steps + "</td></tr>")
+    h.append("</tbody></table>")
+    h.append('<div style="background:#fff0f0;border-left:4px solid #e04040;padding:8px 14px;border-radius:6px;'
+             'margin:0 0 18px;font-size:.85rem;color:#802020">' + g["spotify_note"] + "</div>")
+    # Benefits
+    h.append('<h3 style="margin:0 0 10px;font-size:1.05rem;color:var(--tx)">🎧 ' + g["benefits_title"] + "</h3>")
+    h.append('<div style="display:flex;flex-wrap:wrap;gap:8px;margin-bottom:18px">')
+    for b in g["benefits"]:
+        h.append('<div style="background:var(--srf2);color:var(--tx);padding:6px 12px;border-radius:16px;font-size:.84rem">✓ '
+                 + b + "</div>")
+    h.append("</div>")
+    # Tips
+    h.append('<h3 style="margin:0 0 10px;font-size:1.05rem;color:var(--tx)">💡 ' + g["tips_title"] + "</h3>")
+    for tip in g["tips"]:
+        h.append('<div style="padding:4px 0;font-size:.88rem;color:var(--tx)">• ' + tip + "</div>")
+    h.append("</div>")
+    return "".join(h)
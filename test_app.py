@@ -66,6 +66,38 @@ class TestAPI:
         # Deve rispondere (400 o 422), non crashare (500)
         assert response.status_code != 500
 
+    def test_cover_cacheable(self, client, tmp_path):
+        """La copertina di un job è riusabile dalla cache privata del browser e rivalidabile."""
+        from audiobook_app import jobs
+        cover = tmp_path / "cover.jpg"
+        cover.write_bytes(b"\xff\xd8\xff\xe0 test")
+        jobs["tcover01"] = {"cover_thumb": str(cover), "cover_mime": "image/jpeg"}
+        try:
+            response = client.get('/api/cover/tcover01')
+            assert response.status_code == 200
+            assert response.headers['Cache-Control'] == 'private, max-age=3600'
+            etag = response.headers['ETag']
+            assert client.get('/api/cover/tcover01', headers={'If-None-Match': etag}).status_code == 304
+        finally:
+            jobs.pop("tcover01", None)
+
+    def test_active_jobs_distinct_keys(self, client):
+        """Job omonimi avviati nello stesso secondo hanno chiavi monitor distinte e stabili."""
+        from audiobook_app import jobs
+        for jid in ("tmon0001", "tmon0002"):
+            jobs[jid] = {"status": "generating", "original_filename": "libro.epub", "start_time": 1700000000}
+        try:
+            keys = [j["key"] for j in client.get('/api/active_jobs').get_json()["jobs"]
+                    if j["title"] == "libro.epub"]
+            assert len(set(keys)) == 2
+            again = [j["key"] for j in client.get('/api/active_jobs').get_json()["jobs"]
+                     if j["title"] == "libro.epub"]
+            assert again == keys
+            assert not any(k.startswith("tmon") for k in keys)
+        finally:
+            jobs.pop("tmon0001", None)
+            jobs.pop("tmon0002", None)
+
     def test_unknown_route_404(self, client):
         """Route inesistenti restituiscono 404."""
         response = client.get('/api/nonexistent')
@@ -83,3 +115,187 @@ class TestPodcastGuide:
             code = ord(ch)
             assert not (0xD800 <= code <= 0xDFFF), \
                 f"Surrogate U+{code:04X} trovato nell'HTML"
+
+    def test_screenshot_cached(self, client):
+        """Gli screenshot della guida hanno URL versionato, cache immutabile ed ETag (304)."""
+        from audiobook_app import PG_IMG_A_URL, PG_IMG_B_URL
+        guide = client.get('/i18n/podcast_guide.it.html').data
+        assert PG_IMG_A_URL.encode() in guide and PG_IMG_B_URL.encode() in guide
+        assert b'__IMG_' not in guide
+        assert client.get(PG_IMG_B_URL).content_type == 'image/png'
+        response = client.get(PG_IMG_A_URL)
+        assert response.status_code == 200
+        assert response.content_type == 'image/png'
+        assert 'immutable' in response.headers['Cache-Control']
+        etag = response.headers['ETag']
+        assert client.get(PG_IMG_A_URL, headers={'If-None-Match': etag}).status_code == 304
+
+    def test_screenshot_webp_negotiation(self, client):
+        """I browser che accettano WebP ricevono la variante WebP allo stesso URL."""
+        from audiobook_app import PG_IMG_A_URL
+        response = client.get(PG_IMG_A_URL, headers={'Accept': 'image/avif,image/webp,*/*'})
+        assert response.content_type == 'image/webp'
+        assert response.data[8:12] == b'WEBP'
+        assert 'Accept' in response.headers['Vary']
+        for accept in ('*/*', 'image/webp;q=0, image/png'):
+            assert client.get(PG_IMG_A_URL, headers={'Accept': accept}).content_type == 'image/png'
+
+    def test_guide_html_on_demand(self, client):
+        """La guida è servita come HTML pre-renderizzato per lingua, fuori dal bundle JS."""
+        from audiobook_app import APP_JS_URL, I18N_V
+        response = client.get(f'/i18n/podcast_guide.fr.html?v={I18N_V}')
+        assert response.status_code == 200
+        assert 'text/html' in response.content_type
+        assert 'immutable' in response.headers['Cache-Control']
+        html = response.data.decode('utf-8')
+        assert html.startswith('<style>') and 'Pocket Casts' in html
+        bundle = client.get(APP_JS_URL).data
+        assert b'Pocket Casts' not in bundle and b'pg-hero-img' not in bundle
+
+
+class TestI18n:
+    """Verifica i dizionari UI serviti per lingua."""
+
+    def test_page_inlines_only_its_language(self, client):
+        """La pagina incorpora solo il dizionario della propria lingua."""
+        html = client.get('/fr/').data.decode('utf-8')
+        assert '"fr":{' in html
+        assert '"it":{' not in html
+
+    def test_i18n_json(self, client):
+        """/i18n/<lang>.json restituisce il dizionario con cache lunga solo per il ?v= corrente."""
+        from audiobook_app import I18N_V
+        response = client.get(f'/i18n/de.json?v={I18N_V}')
+        assert response.status_code == 200
+        assert 'immutable' in response.headers['Cache-Control']
+        assert response.get_json()['s1_title']
+        for url in ('/i18n/de.json', '/i18n/de.json?v=stale', '/i18n/podcast_guide.de.html?v=stale'):
+            response = client.get(url)
+            assert response.headers['Cache-Control'] == 'public, max-age=86400'
+            assert client.get(url, headers={'If-None-Match': response.headers['ETag']}).status_code == 304
+
+    def test_i18n_raw_utf8(self, client):
+        """I dizionari sono UTF-8 puro, senza sequenze di escape \\uXXXX."""
+        response = client.get('/i18n/zh.json')
+        assert 'charset=utf-8' in response.headers['Content-Type']
+        assert b'\\u' not in response.data
+        html = client.get('/zh/').data
+        assert b'\\u' not in html
+
+    def test_about_seo_per_language(self, client):
+        """Testi About e metadati SEO arrivano col dizionario della lingua, non nel bundle."""
+        from audiobook_app import APP_JS_URL, _SEO_DATA
+        d = client.get('/i18n/es.json').get_json()
+        assert d['about']['paras'] and d['seo'] == _SEO_DATA['es']
+        bundle = client.get(APP_JS_URL).data.decode('utf-8')
+        assert _SEO_DATA['de']['desc'] not in bundle
+        assert d['about']['title'] not in bundle
+
+    def test_html_lang_kept_after_boot(self, client):
+        """<html lang> resta nel formato del server (zh-Hans): lo aggiorna solo applySEO."""
+        import re
+        from audiobook_app import APP_JS_URL
+        assert '<html lang="zh-Hans">' in client.get('/zh/').data.decode('utf-8')
+        bundle = client.get(APP_JS_URL).data.decode('utf-8')
+        assert re.findall(r'documentElement\.lang=([^;\n]*)', bundle) == ['SEO_HTML_LANG[lang]||"en"']
+        assert 'zh:"zh-Hans"' in bundle
+
+    def test_i18n_unknown_lang_404(self, client):
+        """Lingue non supportate restituiscono 404."""
+        assert client.get('/i18n/xx.json').status_code == 404
+
+
+class TestAppScript:
+    """Verifica il bundle JS servito come asset statico."""
+
+    def test_page_references_bundle(self, client):
+        """La pagina carica il bundle dall'URL versionato, senza JS applicativo inline."""
+        import re
+        html = client.get('/it/').data.decode('utf-8')
+        m = re.search(r'<script src="(/assets/app\.[0-9a-f]+\.js)" defer>', html)
+        assert m
+        response = client.get(m.group(1))
+        assert response.status_code == 200
+        assert 'javascript' in response.content_type
+        assert 'immutable' in response.headers['Cache-Control']
+        assert b'function applyI18n' in response.data
+
+    def test_bundle_gzip(self, client):
+        """Con Accept-Encoding: gzip il bundle arriva pre-compresso."""
+        import gzip
+        from audiobook_app import APP_JS_URL
+        response = client.get(APP_JS_URL, headers={'Accept-Encoding': 'gzip, br'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert b'function applyI18n' in gzip.decompress(response.data)
+
+    def test_bundle_gzip_refused(self, client):
+        """gzip;q=0 rifiuta la compressione: il bundle arriva in chiaro."""
+        from audiobook_app import APP_JS_URL
+        response = client.get(APP_JS_URL, headers={'Accept-Encoding': 'gzip;q=0, identity'})
+        assert 'Content-Encoding' not in response.headers
+        assert b'function applyI18n' in response.data
+
+    def test_stale_bundle_404(self, client):
+        """Un hash non corrispondente al bundle corrente restituisce 404."""
+        assert client.get('/assets/app.0000000000.js').status_code == 404
+
+    def test_favicon_asset(self, client):
+        """La favicon è un file versionato, non un data URI inline."""
+        from audiobook_app import FAVICON_URL
+        html = client.get('/it/').data.decode('utf-8')
+        assert f'href="{FAVICON_URL}"' in html
+        assert 'data:image/svg+xml;base64' not in html
+        response = client.get(FAVICON_URL)
+        assert response.status_code == 200
+        assert response.content_type.startswith('image/svg+xml')
+        assert 'immutable' in response.headers['Cache-Control']
+        gz = client.get(FAVICON_URL, headers={'Accept-Encoding': 'gzip'})
+        assert gz.headers['Content-Encoding'] == 'gzip'
+
+    def test_fb_icons_asset(self, client):
+        """Lo sprite delle icone "Libri gratis" è un asset versionato referenziato dal bundle."""
+        from audiobook_app import APP_JS_URL, FB_ICONS_URL
+        assert FB_ICONS_URL.startswith('/assets/fb-icons.')
+        bundle = client.get(APP_JS_URL).data
+        assert FB_ICONS_URL.encode() in bundle and b'/static/fb-icons' not in bundle
+        response = client.get(FB_ICONS_URL, headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert 'immutable' in response.headers['Cache-Control']
+        assert response.headers['Content-Encoding'] == 'gzip'
+
+
+class TestStylesheet:
+    """Verifica che il foglio di stile non accumuli regole morte."""
+
+    def test_no_unused_css_classes(self):
+        """Ogni classe dei selettori CSS è emessa dall'HTML o dagli script."""
+        import re
+        from templates.index_page import _FRAGMENTS_DIR
+        import seo_content
+
+        head = open(os.path.join(_FRAGMENTS_DIR, 'html_head.html'), encoding='utf-8').read()
+        css = re.search(r'<style>(.*?)</style>', head, re.S).group(1)
+        css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+        css = re.sub(r'@keyframes[^{]*\{(?:[^{}]*\{[^{}]*\})*[^{}]*\}', '', css)
+        selectors = re.sub(r'\{[^{}]*\}', '{}', css)
+        css_classes = set(re.findall(r'\.([A-Za-z_][\w-]*)', selectors))
+
+        # Markup + JS: tutti i frammenti (senza il CSS) e il contenuto SEO server-side
+        corpus = head.replace(css, '')
+        for name in sorted(os.listdir(_FRAGMENTS_DIR)):
+            if name != 'html_head.html':
+                corpus += open(os.path.join(_FRAGMENTS_DIR, name), encoding='utf-8').read()
+        corpus += open(seo_content.__file__, encoding='utf-8').read()
+
+        used = set()
+        for m in re.finditer(r'class(?:Name)?\s*[=:]\s*\\?["\']([^"\'\\]*)', corpus):
+            used.update(m.group(1).split())
+        for m in re.finditer(r'className\s*\+?=\s*([^;]*)', corpus):
+            used.update(re.findall(r'[\w-]+', m.group(1)))
+        for m in re.finditer(r'classList\.(?:add|remove|toggle|contains)\(([^)]*)\)', corpus):
+            used.update(re.findall(r"'([\w-]+)'", m.group(1)))
+        for m in re.finditer(r"querySelector(?:All)?\('([^']*)'", corpus):
+            used.update(re.findall(r'\.([\w-]+)', m.group(1)))
+
+        unused = sorted(css_classes - used)
+        assert not unused, f"Classi CSS mai emesse da HTML/JS: {unused}"